@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import sys
+from collections.abc import Callable
 
 from gateway.core.config import load_config
 from gateway.core.gateway import Gateway
@@ -43,5 +44,21 @@ async def main() -> None:
         sys.exit(1)
 
 
+def event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Get the event loop factory to run the gateway with.
+
+    Uses uvloop when it is installed (``pip install api-gateway[speedups]``),
+    and falls back to the default asyncio event loop otherwise.
+
+    Returns:
+        uvloop's loop factory, or None for the default event loop
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop  # type: ignore[no-any-return]
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(), loop_factory=event_loop_factory())
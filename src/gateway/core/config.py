@@ -6,13 +6,45 @@ This module handles loading and validating configuration from multiple sources:
 - Command-line arguments
 """
 
+import copy
+import mmap
 import os
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 import yaml
 from pydantic import BaseModel, Field, field_validator
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+# Parsed YAML documents keyed by resolved path, validated against (mtime_ns, size)
+_YAML_CACHE: OrderedDict[str, tuple[int, int, dict[str, Any]]] = OrderedDict()
+_YAML_CACHE_MAX_SIZE = 100
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable value."""
+    return value.lower() == "true"
+
+
+# Environment variable overrides: (variable name, config section, key, caster)
+_ENV_OVERRIDES: tuple[tuple[str, str, str, Callable[[str], Any]], ...] = (
+    ("GATEWAY_SERVER_HOST", "server", "host", str),
+    ("GATEWAY_SERVER_PORT", "server", "port", int),
+    ("GATEWAY_SERVER_TLS_ENABLED", "server", "tls_enabled", _parse_bool),
+    ("GATEWAY_LOG_LEVEL", "logging", "level", str),
+    ("GATEWAY_LOG_FORMAT", "logging", "format", str),
+    ("GATEWAY_SESSION_STORE_URL", "session", "session_store_url", str),
+    ("GATEWAY_TOKEN_SIGNING_SECRET", "session", "token_signing_secret", str),
+    ("GATEWAY_RATELIMIT_STORE_URL", "rate_limiting", "store_url", str),
+    ("GATEWAY_RATELIMIT_ENABLED", "rate_limiting", "enabled", _parse_bool),
+)
+
 
 class ServerConfig(BaseModel):
     """HTTP server configuration."""
@@ -22,9 +54,16 @@ class ServerConfig(BaseModel):
     tls_enabled: bool = Field(default=False, description="Enable TLS/HTTPS")
     tls_cert_path: str | None = Field(default=None, description="Path to TLS certificate")
     tls_key_path: str | None = Field(default=None, description="Path to TLS private key")
+    tls_min_version: str = Field(
+        default="TLSv1.2", description="Minimum TLS version (TLSv1.2 or TLSv1.3)"
+    )
     connection_timeout: int = Field(default=60, ge=1, description="Connection timeout in seconds")
     keepalive_timeout: int = Field(default=75, ge=1, description="Keep-alive timeout in seconds")
     max_connections: int = Field(default=1000, ge=1, description="Maximum concurrent connections")
+    backlog: int = Field(default=1024, ge=1, description="Listen socket accept backlog")
+    reuse_port: bool = Field(
+        default=False, description="Bind with SO_REUSEPORT so workers share the listen port"
+    )
 
     @field_validator("tls_cert_path", "tls_key_path")
     @classmethod
@@ -34,6 +73,15 @@ class ServerConfig(BaseModel):
             raise ValueError(f"TLS file not found: {v}")
         return v
 
+    @field_validator("tls_min_version")
+    @classmethod
+    def validate_tls_min_version(cls, v: str) -> str:
+        """Validate minimum TLS version is supported."""
+        valid_versions = ["TLSv1.2", "TLSv1.3"]
+        if v not in valid_versions:
+            raise ValueError(f"Invalid tls_min_version: {v}. Must be one of {valid_versions}")
+        return v
+
 
 class RouteConfig(BaseModel):
     """Route configuration."""
@@ -85,6 +133,7 @@ class SessionConfig(BaseModel):
     token_ttl: int = Field(default=3600, ge=60, description="Token TTL in seconds")
     refresh_enabled: bool = Field(default=True, description="Enable token refresh")
     refresh_threshold: int = Field(default=300, ge=0, description="Refresh threshold in seconds")
+    pool_size: int = Field(default=64, ge=1, description="Maximum session store connections")
 
 
 class RateLimitRule(BaseModel):
@@ -129,6 +178,14 @@ class RateLimitConfig(BaseModel):
     fail_mode: str = Field(
         default="open", description="Fail mode (open or closed) when store unavailable"
     )
+    pool_size: int = Field(default=64, ge=1, description="Maximum store connections")
+    local_admission: bool = Field(
+        default=False,
+        description=(
+            "Admit token bucket requests for keys last seen with a full bucket before "
+            "the store confirms; may over-admit one request per key per replica"
+        ),
+    )
     rules: list[RateLimitRule] = Field(default_factory=list, description="Rate limiting rules")
 
     @field_validator("fail_mode")
@@ -159,6 +216,15 @@ class MetricsConfig(BaseModel):
     health_endpoint: str = Field(default="/health", description="Health check endpoint path")
     liveness_endpoint: str = Field(default="/health/live", description="Liveness endpoint path")
     readiness_endpoint: str = Field(default="/health/ready", description="Readiness endpoint path")
+    single_threaded: bool = Field(
+        default=False,
+        description="Update metric values without locking (only safe if one thread records)",
+    )
+    max_label_series: int = Field(
+        default=500,
+        ge=1,
+        description="Maximum label sets per metric for labels without a configured allowlist",
+    )
 
 
 class GatewayConfig(BaseModel):
@@ -221,22 +287,47 @@ class ConfigLoader:
 
         # Validate and create config object
         try:
-            config = GatewayConfig(**config_dict)
+            config = GatewayConfig.model_validate(config_dict)
         except Exception as e:
             raise ValueError(f"Configuration validation failed: {e}") from e
 
         return config
 
     def _load_from_file(self) -> dict[str, Any]:
-        """Load configuration from YAML file."""
-        if not self.config_path.exists():
+        """Load configuration from YAML file.
+
+        Parsed documents are cached by path and invalidated when the file's
+        modification time or size changes. Callers always receive a deep copy,
+        so mutating the result never affects the cache.
+        """
+        try:
+            st = self.config_path.stat()
+        except FileNotFoundError:
             # Return empty dict if file doesn't exist, will use defaults
             return {}
 
-        with open(self.config_path) as f:
-            config_dict = yaml.safe_load(f) or {}
-
-        return config_dict
+        cache_key = str(self.config_path.resolve())
+        cached = _YAML_CACHE.get(cache_key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            _YAML_CACHE.move_to_end(cache_key)
+            return copy.deepcopy(cached[2])
+
+        config_dict: dict[str, Any] = {}
+        if st.st_size:
+            # Stream straight from the page cache instead of reading the whole
+            # file into a bytes object first (mmap rejects empty files)
+            with (
+                open(self.config_path, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            ):
+                config_dict = yaml.load(mm, Loader=_SafeLoader) or {}
+
+        _YAML_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, config_dict)
+        _YAML_CACHE.move_to_end(cache_key)
+        while len(_YAML_CACHE) > _YAML_CACHE_MAX_SIZE:
+            _YAML_CACHE.popitem(last=False)
+
+        return copy.deepcopy(config_dict)
 
     def _override_from_env(self, config_dict: dict[str, Any]) -> dict[str, Any]:
         """Override configuration with environment variables.
@@ -244,35 +335,15 @@ class ConfigLoader:
         Environment variables follow the pattern: GATEWAY_<SECTION>_<KEY>
         For example: GATEWAY_SERVER_PORT=8080
         """
-        # Server config
-        if host := os.getenv("GATEWAY_SERVER_HOST"):
-            config_dict.setdefault("server", {})["host"] = host
-        if port := os.getenv("GATEWAY_SERVER_PORT"):
-            config_dict.setdefault("server", {})["port"] = int(port)
-        if tls := os.getenv("GATEWAY_SERVER_TLS_ENABLED"):
-            config_dict.setdefault("server", {})["tls_enabled"] = tls.lower() == "true"
-
-        # Logging config
-        if log_level := os.getenv("GATEWAY_LOG_LEVEL"):
-            config_dict.setdefault("logging", {})["level"] = log_level
-        if log_format := os.getenv("GATEWAY_LOG_FORMAT"):
-            config_dict.setdefault("logging", {})["format"] = log_format
-
-        # Session config
-        if session_store := os.getenv("GATEWAY_SESSION_STORE_URL"):
-            config_dict.setdefault("session", {})["session_store_url"] = session_store
-        if token_secret := os.getenv("GATEWAY_TOKEN_SIGNING_SECRET"):
-            config_dict.setdefault("session", {})["token_signing_secret"] = token_secret
-
-        # Rate limiting config
-        if rl_store := os.getenv("GATEWAY_RATELIMIT_STORE_URL"):
-            config_dict.setdefault("rate_limiting", {})["store_url"] = rl_store
-        if rl_enabled := os.getenv("GATEWAY_RATELIMIT_ENABLED"):
-            config_dict.setdefault("rate_limiting", {})["enabled"] = rl_enabled.lower() == "true"
+        env = os.environ
+        for name, section, key, cast in _ENV_OVERRIDES:
+            value = env.get(name)
+            if value:
+                config_dict.setdefault(section, {})[key] = cast(value)
 
         # Environment
-        if env := os.getenv("GATEWAY_ENV"):
-            config_dict["environment"] = env
+        if environment := env.get("GATEWAY_ENV"):
+            config_dict["environment"] = environment
 
         return config_dict
 
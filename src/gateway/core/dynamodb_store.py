@@ -1,18 +1,40 @@
 """DynamoDB-based storage for sessions and rate limiting.
 
 This module provides DynamoDB implementations to replace Redis in AWS Lambda.
+
+boto3 is imported lazily in ``connect()`` so that importing this module (and
+Lambda cold starts that never touch DynamoDB) do not pay its import cost.
 """
 
-import json
+import asyncio
+import logging
+import random
 import time
 from typing import Any
 
-import boto3
-from botocore.exceptions import ClientError
+import orjson
+
+try:
+    from botocore.exceptions import ClientError
+except ImportError:  # pragma: no cover - aws extra not installed
+    ClientError = Exception  # type: ignore[assignment,misc]
 
 from gateway.core.rate_limit import RateLimitStore
 from gateway.core.session_store import SessionStore
 
+logger = logging.getLogger(__name__)
+
+# Concurrent session reads are coalesced into one BatchGetItem call
+_BATCH_WINDOW_SECONDS = 0.002
+_BATCH_MAX_KEYS = 100  # DynamoDB BatchGetItem limit
+# Unprocessed keys (throttling) are retried with jittered exponential backoff
+_BATCH_MAX_RETRIES = 5
+_BATCH_RETRY_BASE_SECONDS = 0.025
+
+# DynamoDB TTL attributes are whole epoch seconds; integer division of
+# time_ns() avoids the float round-trip of int(time.time())
+_NS_PER_SECOND = 1_000_000_000
+
 
 class DynamoDBSessionStore(SessionStore):
     """DynamoDB-based session store (replaces Redis in Lambda)."""
@@ -29,14 +51,29 @@ class DynamoDBSessionStore(SessionStore):
         self._dynamodb = None
         self._table = None
 
+        # Pending coalesced reads: key -> futures awaiting that key
+        self._pending: dict[str, list[asyncio.Future[str | None]]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
     async def connect(self) -> None:
         """Connect to DynamoDB."""
         # boto3 is synchronous, but we keep async interface for compatibility
+        import boto3
+
         self._dynamodb = boto3.resource("dynamodb", region_name=self.region_name)
         self._table = self._dynamodb.Table(self.table_name)
 
     async def disconnect(self) -> None:
         """Disconnect from DynamoDB."""
+        # Resolve any reads still waiting for the coalescing window
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._pending:
+            pending, self._pending = self._pending, {}
+            await self._flush(pending)
+
         # boto3 doesn't require explicit disconnect
         self._dynamodb = None
         self._table = None
@@ -44,25 +81,117 @@ class DynamoDBSessionStore(SessionStore):
     async def get(self, key: str) -> str | None:
         """Get value from DynamoDB.
 
+        Concurrent lookups are coalesced: reads issued within a short window
+        are fetched together with a single BatchGetItem call. A lone read with
+        no batch in flight is sent straight away.
+
         Args:
             key: Session key
 
         Returns:
             Session data as JSON string or None if not found
         """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[str | None] = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+
+        if len(self._pending) >= _BATCH_MAX_KEYS or (
+            len(self._pending) == 1 and not self._flush_tasks
+        ):
+            self._start_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(_BATCH_WINDOW_SECONDS, self._start_flush)
+
+        return await future
+
+    async def get_many(self, keys: list[str]) -> dict[str, str | None]:
+        """Get multiple values from DynamoDB using BatchGetItem.
+
+        Args:
+            keys: Session keys
+
+        Returns:
+            Mapping of each key to its session data, or None if not found
+            (including keys still unprocessed once retries are exhausted)
+        """
+        results: dict[str, str | None] = dict.fromkeys(keys)
+        unique_keys = list(results)
+        now = time.time_ns() // _NS_PER_SECOND
+
         try:
-            response = self._table.get_item(Key={"session_id": key})
-            if "Item" in response:
-                # Check if TTL has expired (DynamoDB TTL deletion is async)
-                ttl = response["Item"].get("ttl", 0)
-                if ttl > 0 and ttl < int(time.time()):
-                    return None
-                return response["Item"].get("data")
-            return None
-        except ClientError as e:
+            for i in range(0, len(unique_keys), _BATCH_MAX_KEYS):
+                chunk = unique_keys[i : i + _BATCH_MAX_KEYS]
+                request_items: dict[str, Any] = {
+                    self.table_name: {"Keys": [{"session_id": k} for k in chunk]}
+                }
+                attempt = 0
+                while request_items:
+                    response = await asyncio.to_thread(
+                        self._dynamodb.batch_get_item,  # type: ignore[attr-defined]
+                        RequestItems=request_items,
+                    )
+                    for item in response.get("Responses", {}).get(self.table_name, []):
+                        # Check if TTL has expired (DynamoDB TTL deletion is async)
+                        ttl = item.get("ttl", 0)
+                        if ttl > 0 and ttl < now:
+                            continue
+                        results[item["session_id"]] = item.get("data")
+                    request_items = response.get("UnprocessedKeys") or {}
+
+                    if request_items:
+                        if attempt >= _BATCH_MAX_RETRIES:
+                            unprocessed = len(request_items[self.table_name]["Keys"])
+                            logger.warning(
+                                f"DynamoDB batch_get left {unprocessed} keys unprocessed "
+                                f"after {attempt} retries"
+                            )
+                            break
+                        # Full jitter keeps retrying callers from hitting the
+                        # throttled partition in lockstep
+                        delay = _BATCH_RETRY_BASE_SECONDS * 2**attempt
+                        await asyncio.sleep(random.uniform(0, delay))
+                        attempt += 1
+        except ClientError:
             # Log error but don't raise to maintain availability
-            print(f"DynamoDB get error: {e}")
-            return None
+            logger.warning("DynamoDB batch_get error", exc_info=True)
+            return dict.fromkeys(keys)
+
+        return results
+
+    def _start_flush(self) -> None:
+        """Dispatch all pending reads as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._flush(pending))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, pending: dict[str, list[asyncio.Future[str | None]]]) -> None:
+        """Fetch a batch of pending keys and resolve their waiters.
+
+        Args:
+            pending: Mapping of session key to futures awaiting it
+        """
+        try:
+            results = await self.get_many(list(pending))
+        except Exception as e:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for key, futures in pending.items():
+            value = results.get(key)
+            for future in futures:
+                if not future.done():
+                    future.set_result(value)
 
     async def set(self, key: str, value: str, ttl: int | None = None) -> None:
         """Set value in DynamoDB.
@@ -80,11 +209,11 @@ class DynamoDBSessionStore(SessionStore):
 
             # Add TTL if provided
             if ttl:
-                item["ttl"] = int(time.time()) + ttl
+                item["ttl"] = time.time_ns() // _NS_PER_SECOND + ttl
 
-            self._table.put_item(Item=item)
-        except ClientError as e:
-            print(f"DynamoDB set error: {e}")
+            await asyncio.to_thread(self._table.put_item, Item=item)
+        except ClientError:
+            logger.warning("DynamoDB set error", exc_info=True)
             raise
 
     async def delete(self, key: str) -> None:
@@ -94,9 +223,9 @@ class DynamoDBSessionStore(SessionStore):
             key: Session key
         """
         try:
-            self._table.delete_item(Key={"session_id": key})
-        except ClientError as e:
-            print(f"DynamoDB delete error: {e}")
+            await asyncio.to_thread(self._table.delete_item, Key={"session_id": key})
+        except ClientError:
+            logger.warning("DynamoDB delete error", exc_info=True)
             # Don't raise, deletion failure is not critical
 
     async def exists(self, key: str) -> bool:
@@ -108,13 +237,32 @@ class DynamoDBSessionStore(SessionStore):
         Returns:
             True if key exists and not expired, False otherwise
         """
-        value = await self.get(key)
-        return value is not None
+        try:
+            # Project only the key and TTL so the session payload is never transferred
+            response = await asyncio.to_thread(
+                self._table.get_item,
+                Key={"session_id": key},
+                ProjectionExpression="session_id, #ttl",
+                ExpressionAttributeNames={"#ttl": "ttl"},
+            )
+            if "Item" not in response:
+                return False
+            ttl = response["Item"].get("ttl", 0)
+            return not (ttl > 0 and ttl < time.time_ns() // _NS_PER_SECOND)
+        except ClientError:
+            logger.warning("DynamoDB exists error", exc_info=True)
+            return False
 
 
 class DynamoDBRateLimitStore(RateLimitStore):
     """DynamoDB-based rate limit store (replaces Redis in Lambda)."""
 
+    # Update expressions for increment(), built once rather than per call
+    _INCREMENT_EXPR = "SET #count = if_not_exists(#count, :zero) + :inc"
+    _INCREMENT_EXPR_WITH_TTL = _INCREMENT_EXPR + ", #ttl = :ttl"
+    _INCREMENT_NAMES = {"#count": "count"}
+    _INCREMENT_NAMES_WITH_TTL = {"#count": "count", "#ttl": "ttl"}
+
     def __init__(self, table_name: str, region_name: str | None = None):
         """Initialize DynamoDB rate limit store.
 
@@ -129,6 +277,8 @@ class DynamoDBRateLimitStore(RateLimitStore):
 
     async def connect(self) -> None:
         """Connect to DynamoDB."""
+        import boto3
+
         self._dynamodb = boto3.resource("dynamodb", region_name=self.region_name)
         self._table = self._dynamodb.Table(self.table_name)
 
@@ -144,7 +294,9 @@ class DynamoDBRateLimitStore(RateLimitStore):
             True if healthy, False otherwise
         """
         try:
-            self._table.meta.client.describe_table(TableName=self.table_name)
+            await asyncio.to_thread(
+                self._table.meta.client.describe_table, TableName=self.table_name
+            )
             return True
         except ClientError:
             return False
@@ -159,16 +311,16 @@ class DynamoDBRateLimitStore(RateLimitStore):
             Current count
         """
         try:
-            response = self._table.get_item(Key={"rate_limit_key": key})
+            response = await asyncio.to_thread(self._table.get_item, Key={"rate_limit_key": key})
             if "Item" in response:
                 # Check if TTL has expired
                 ttl = response["Item"].get("ttl", 0)
-                if ttl > 0 and ttl < int(time.time()):
+                if ttl > 0 and ttl < time.time_ns() // _NS_PER_SECOND:
                     return 0
                 return int(response["Item"].get("count", 0))
             return 0
-        except ClientError as e:
-            print(f"DynamoDB get_count error: {e}")
+        except ClientError:
+            logger.warning("DynamoDB get_count error", exc_info=True)
             return 0
 
     async def increment(self, key: str, amount: int = 1, ttl: int | None = None) -> int:
@@ -183,17 +335,19 @@ class DynamoDBRateLimitStore(RateLimitStore):
             New count value
         """
         try:
-            # Use atomic update
-            update_expr = "SET #count = if_not_exists(#count, :zero) + :inc"
-            expr_attr_names = {"#count": "count"}
+            # Use atomic update. Expression values must be a fresh dict per call
+            # since boto3 serializes them in place.
             expr_attr_values = {":zero": 0, ":inc": amount}
-
             if ttl:
-                update_expr += ", #ttl = :ttl"
-                expr_attr_names["#ttl"] = "ttl"
-                expr_attr_values[":ttl"] = int(time.time()) + ttl
-
-            response = self._table.update_item(
+                update_expr = self._INCREMENT_EXPR_WITH_TTL
+                expr_attr_names = self._INCREMENT_NAMES_WITH_TTL
+                expr_attr_values[":ttl"] = time.time_ns() // _NS_PER_SECOND + ttl
+            else:
+                update_expr = self._INCREMENT_EXPR
+                expr_attr_names = self._INCREMENT_NAMES
+
+            response = await asyncio.to_thread(
+                self._table.update_item,
                 Key={"rate_limit_key": key},
                 UpdateExpression=update_expr,
                 ExpressionAttributeNames=expr_attr_names,
@@ -202,8 +356,8 @@ class DynamoDBRateLimitStore(RateLimitStore):
             )
 
             return int(response["Attributes"]["count"])
-        except ClientError as e:
-            print(f"DynamoDB increment error: {e}")
+        except ClientError:
+            logger.warning("DynamoDB increment error", exc_info=True)
             # Return 0 to fail open
             return 0
 
@@ -222,11 +376,11 @@ class DynamoDBRateLimitStore(RateLimitStore):
             }
 
             if ttl:
-                item["ttl"] = int(time.time()) + ttl
+                item["ttl"] = time.time_ns() // _NS_PER_SECOND + ttl
 
-            self._table.put_item(Item=item)
-        except ClientError as e:
-            print(f"DynamoDB set_count error: {e}")
+            await asyncio.to_thread(self._table.put_item, Item=item)
+        except ClientError:
+            logger.warning("DynamoDB set_count error", exc_info=True)
             # Don't raise to fail open
 
     async def reset(self, key: str) -> None:
@@ -236,9 +390,9 @@ class DynamoDBRateLimitStore(RateLimitStore):
             key: Rate limit key
         """
         try:
-            self._table.delete_item(Key={"rate_limit_key": key})
-        except ClientError as e:
-            print(f"DynamoDB reset error: {e}")
+            await asyncio.to_thread(self._table.delete_item, Key={"rate_limit_key": key})
+        except ClientError:
+            logger.warning("DynamoDB reset error", exc_info=True)
             # Don't raise, reset failure is not critical
 
     async def get_state(self, key: str) -> dict[str, Any]:
@@ -251,22 +405,22 @@ class DynamoDBRateLimitStore(RateLimitStore):
             State dictionary with count, tokens, last_update, etc.
         """
         try:
-            response = self._table.get_item(Key={"rate_limit_key": key})
+            response = await asyncio.to_thread(self._table.get_item, Key={"rate_limit_key": key})
             if "Item" in response:
                 item = response["Item"]
                 # Check if TTL has expired
                 ttl = item.get("ttl", 0)
-                if ttl > 0 and ttl < int(time.time()):
+                if ttl > 0 and ttl < time.time_ns() // _NS_PER_SECOND:
                     return {}
 
                 # Return state (deserialize JSON if needed)
                 state_json = item.get("state", "{}")
                 if isinstance(state_json, str):
-                    return json.loads(state_json)
+                    return orjson.loads(state_json)  # type: ignore[no-any-return]
                 return state_json
             return {}
-        except ClientError as e:
-            print(f"DynamoDB get_state error: {e}")
+        except ClientError:
+            logger.warning("DynamoDB get_state error", exc_info=True)
             return {}
 
     async def set_state(self, key: str, state: dict[str, Any], ttl: int | None = None) -> None:
@@ -280,13 +434,13 @@ class DynamoDBRateLimitStore(RateLimitStore):
         try:
             item = {
                 "rate_limit_key": key,
-                "state": json.dumps(state),
+                "state": orjson.dumps(state).decode(),
             }
 
             if ttl:
-                item["ttl"] = int(time.time()) + ttl
+                item["ttl"] = time.time_ns() // _NS_PER_SECOND + ttl
 
-            self._table.put_item(Item=item)
-        except ClientError as e:
-            print(f"DynamoDB set_state error: {e}")
+            await asyncio.to_thread(self._table.put_item, Item=item)
+        except ClientError:
+            logger.warning("DynamoDB set_state error", exc_info=True)
             # Don't raise to fail open
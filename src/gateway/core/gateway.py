@@ -11,12 +11,17 @@ This module integrates all components:
 - Authentication
 """
 
+import asyncio
 import logging
+import signal
+import time
+from functools import cached_property
 
+import orjson
 from aiohttp import web
 
 from gateway.core.config import GatewayConfig
-from gateway.core.handler import create_handler_middleware
+from gateway.core.handler import RequestHandler
 from gateway.core.logging import GatewayLogger
 from gateway.core.metrics import GatewayMetrics
 from gateway.core.middleware import (
@@ -33,13 +38,23 @@ from gateway.core.rate_limit import (
 )
 from gateway.core.routing import Router
 from gateway.core.server import HTTPServer
-from gateway.core.session_store import RedisSessionStore, SessionStore
+from gateway.core.session_store import CachedSessionStore, RedisSessionStore, SessionStore
 from gateway.middleware.auth import AuthenticationMiddleware
 from gateway.middleware.proxy import ProxyMiddleware
 from gateway.middleware.ratelimit import RateLimitingMiddleware
 
 logger = logging.getLogger(__name__)
 
+# Static probe response bodies, serialized once at import time
+_LIVENESS_BODY = orjson.dumps({"status": "alive"})
+_READY_BODY = orjson.dumps({"status": "ready"})
+_SESSION_STORE_NOT_READY_BODY = orjson.dumps(
+    {"status": "not_ready", "reason": "session_store_unavailable"}
+)
+_RATE_LIMIT_STORE_NOT_READY_BODY = orjson.dumps(
+    {"status": "not_ready", "reason": "rate_limit_store_unavailable"}
+)
+
 
 class Gateway:
     """Main API Gateway class.
@@ -47,6 +62,9 @@ class Gateway:
     Integrates all components and manages the gateway lifecycle.
     """
 
+    # Readiness probes within this window reuse the previous result
+    READINESS_CACHE_SECONDS = 2.0
+
     def __init__(self, config: GatewayConfig):
         """Initialize the gateway.
 
@@ -56,7 +74,11 @@ class Gateway:
         self.config = config
         self.structured_logger = GatewayLogger(config.logging)
         self.metrics = GatewayMetrics(config.metrics)
-        self.router = Router(config.routes)
+        self.metrics.set_label_allowlists(
+            routes=[route.id for route in config.routes],
+            upstreams=[route.upstream_url for route in config.routes],
+            rule_names=[rule.name for rule in config.rate_limiting.rules],
+        )
 
         # Initialize session store
         self.session_store = self._create_session_store()
@@ -64,9 +86,40 @@ class Gateway:
         # Initialize rate limit store
         self.rate_limit_store = self._create_rate_limit_store()
 
-        self.middleware_chain = self._create_middleware_chain()
         self.server = HTTPServer(config, self.structured_logger, self.metrics)
 
+        # Health response depends only on static config, so serialize it once
+        self._health_body = orjson.dumps(
+            {
+                "status": "healthy",
+                "environment": config.environment,
+                "version": "0.1.0",
+            }
+        )
+
+        # (checked at, status, body) of the last readiness check
+        self._readiness_cache: tuple[float, int, bytes] | None = None
+        self._readiness_lock = asyncio.Lock()
+
+    # The router and middleware chain are only needed once the first request
+    # arrives, so they are built on first access rather than in __init__.
+    # This keeps them off the critical path of Lambda cold starts.
+
+    @cached_property
+    def router(self) -> Router:
+        """Router for the configured routes, built on first access."""
+        return Router(self.config.routes)
+
+    @cached_property
+    def middleware_chain(self) -> MiddlewareChain:
+        """Middleware chain, built on first access."""
+        return self._create_middleware_chain()
+
+    @cached_property
+    def _request_handler(self) -> RequestHandler:
+        """Request handler bound to the router and middleware chain."""
+        return RequestHandler(self.router, self.middleware_chain, self.config)
+
     def _create_session_store(self) -> SessionStore:
         """Create session store instance.
 
@@ -91,9 +144,13 @@ class Gateway:
             region = os.getenv("AWS_REGION_NAME") or os.getenv("AWS_REGION") or "us-east-1"
             return DynamoDBSessionStore(table_name=table_name, region_name=region)
         else:
-            # Default to Redis
-            return RedisSessionStore(
-                redis_url=self.config.session.session_store_url, key_prefix="session:"
+            # Default to Redis, with a short-lived in-process cache in front
+            return CachedSessionStore(
+                RedisSessionStore(
+                    redis_url=self.config.session.session_store_url,
+                    key_prefix="session:",
+                    max_connections=self.config.session.pool_size,
+                )
             )
 
     def _create_rate_limit_store(self) -> RateLimitStore:
@@ -105,7 +162,9 @@ class Gateway:
         # Check if Redis URL is provided for rate limiting
         if self.config.rate_limiting.store_url.startswith("redis://"):
             return RedisRateLimitStore(
-                redis_url=self.config.rate_limiting.store_url, key_prefix="ratelimit:"
+                redis_url=self.config.rate_limiting.store_url,
+                key_prefix="ratelimit:",
+                max_connections=self.config.rate_limiting.pool_size,
             )
         elif self.config.rate_limiting.store_url == "memory":
             # Use in-memory store for development/testing
@@ -125,7 +184,9 @@ class Gateway:
         else:
             # Default to Redis
             return RedisRateLimitStore(
-                redis_url=self.config.rate_limiting.store_url, key_prefix="ratelimit:"
+                redis_url=self.config.rate_limiting.store_url,
+                key_prefix="ratelimit:",
+                max_connections=self.config.rate_limiting.pool_size,
             )
 
     def _create_middleware_chain(self) -> MiddlewareChain:
@@ -134,10 +195,10 @@ class Gateway:
         Middleware execution order (section 9.6):
         1. Error handling (wraps everything)
         2. Request logging
-        3. Authentication and Authorization (section 9.3)
-        4. Rate limiting (section 9.4)
-        5. Proxy (section 9.5)
-        6. Response logging
+        3. Response logging (wraps the middleware below, so it sees their responses)
+        4. Authentication and Authorization (section 9.3)
+        5. Rate limiting (section 9.4)
+        6. Proxy (section 9.5)
 
         Returns:
             MiddlewareChain instance
@@ -145,10 +206,10 @@ class Gateway:
         middlewares: list[Middleware] = [
             ErrorHandlingMiddleware(self.config),
             RequestLoggingMiddleware(self.config),
+            ResponseLoggingMiddleware(self.config),
             AuthenticationMiddleware(self.config, self.session_store),
             RateLimitingMiddleware(self.config, self.rate_limit_store),
             ProxyMiddleware(self.config),
-            ResponseLoggingMiddleware(self.config),
         ]
 
         return MiddlewareChain(middlewares)
@@ -159,14 +220,6 @@ class Gateway:
         Args:
             app: aiohttp Application instance
         """
-        # Create handler middleware
-        handler_middleware = create_handler_middleware(
-            self.router, self.middleware_chain, self.config
-        )
-
-        # Add to app middlewares (need to cast as aiohttp expects specific middleware type)
-        app.middlewares.append(handler_middleware)  # type: ignore[arg-type]
-
         # Add health check routes
         if self.config.metrics.enabled:
             app.router.add_get(self.config.metrics.health_endpoint, self._health_check)
@@ -174,6 +227,22 @@ class Gateway:
             app.router.add_get(self.config.metrics.readiness_endpoint, self._readiness_check)
             app.router.add_get(self.config.metrics.endpoint, self._metrics_endpoint)
 
+        # Everything else is dispatched straight to the gateway's router and
+        # middleware chain. This is registered last so the endpoints above
+        # resolve first, and avoids an aiohttp middleware layer per request.
+        app.router.add_route("*", "/{tail:.*}", self._handle_request)
+
+    async def _handle_request(self, request: web.Request) -> web.Response:
+        """Dispatch a request to the gateway's request handler.
+
+        Args:
+            request: aiohttp Request object
+
+        Returns:
+            web.Response object
+        """
+        return await self._request_handler.handle_request(request)
+
     async def _health_check(self, request: web.Request) -> web.Response:
         """Health check endpoint.
 
@@ -183,12 +252,7 @@ class Gateway:
         Returns:
             Health status response
         """
-        health_status = {
-            "status": "healthy",
-            "environment": self.config.environment,
-            "version": "0.1.0",
-        }
-        return web.json_response(health_status, status=200)
+        return web.Response(body=self._health_body, content_type="application/json")
 
     async def _liveness_check(self, request: web.Request) -> web.Response:
         """Liveness check endpoint.
@@ -199,17 +263,39 @@ class Gateway:
         Returns:
             Liveness status response
         """
-        return web.json_response({"status": "alive"}, status=200)
+        return web.Response(body=_LIVENESS_BODY, content_type="application/json")
 
     async def _readiness_check(self, request: web.Request) -> web.Response:
         """Readiness check endpoint.
 
+        The result is cached for ``READINESS_CACHE_SECONDS``, and concurrent
+        probes wait on a single check, so frequent probing does not add load
+        to the session and rate limit stores.
+
         Args:
             request: aiohttp Request object
 
         Returns:
             Readiness status response
         """
+        cached = self._readiness_cache
+        if cached is None or time.monotonic() - cached[0] >= self.READINESS_CACHE_SECONDS:
+            async with self._readiness_lock:
+                # Another probe may have refreshed the result while we waited
+                cached = self._readiness_cache
+                if cached is None or time.monotonic() - cached[0] >= self.READINESS_CACHE_SECONDS:
+                    status, body = await self._check_readiness()
+                    cached = (time.monotonic(), status, body)
+                    self._readiness_cache = cached
+
+        return web.Response(body=cached[2], status=cached[1], content_type="application/json")
+
+    async def _check_readiness(self) -> tuple[int, bytes]:
+        """Check connectivity of the session and rate limit stores.
+
+        Returns:
+            Tuple of (HTTP status, response body)
+        """
         # Check session store connectivity
         try:
             # Simple connectivity check - try to get a non-existent key
@@ -220,9 +306,7 @@ class Gateway:
             session_store_ready = False
 
         if not session_store_ready:
-            return web.json_response(
-                {"status": "not_ready", "reason": "session_store_unavailable"}, status=503
-            )
+            return 503, _SESSION_STORE_NOT_READY_BODY
 
         # Check rate limit store health (only if rate limiting is enabled)
         rate_limit_store_ready = True
@@ -234,11 +318,9 @@ class Gateway:
                 rate_limit_store_ready = False
 
             if not rate_limit_store_ready:
-                return web.json_response(
-                    {"status": "not_ready", "reason": "rate_limit_store_unavailable"}, status=503
-                )
+                return 503, _RATE_LIMIT_STORE_NOT_READY_BODY
 
-        return web.json_response({"status": "ready"}, status=200)
+        return 200, _READY_BODY
 
     async def _metrics_endpoint(self, request: web.Request) -> web.Response:
         """Metrics endpoint (Prometheus format).
@@ -249,9 +331,9 @@ class Gateway:
         Returns:
             Metrics in Prometheus format
         """
-        metrics_bytes = self.metrics.export_metrics()
-        metrics_text = metrics_bytes.decode("utf-8")
-        return web.Response(text=metrics_text, content_type="text/plain; version=0.0.4")
+        return web.Response(
+            body=self.metrics.export_metrics(), content_type="text/plain; version=0.0.4"
+        )
 
     async def start(self) -> None:
         """Start the gateway."""
@@ -280,6 +362,12 @@ class Gateway:
         logger.info("Stopping API Gateway...")
         await self.server.stop()
 
+        # Close the upstream client session, if the chain was ever built
+        if "middleware_chain" in vars(self):
+            for middleware in self.middleware_chain.middlewares:
+                if isinstance(middleware, ProxyMiddleware):
+                    await middleware.close()
+
         # Disconnect from session store
         await self.session_store.disconnect()
 
@@ -288,16 +376,24 @@ class Gateway:
 
         logger.info("API Gateway stopped")
 
+        # Flush any queued log records
+        self.structured_logger.shutdown()
+
     async def run_forever(self) -> None:
-        """Run the gateway until interrupted."""
+        """Run the gateway until SIGINT or SIGTERM is received."""
         await self.start()
 
-        # Wait forever (until interrupted)
-        import asyncio
+        # Wait for a shutdown signal, then stop gracefully
+        loop = asyncio.get_running_loop()
+        stop_event = asyncio.Event()
+        shutdown_signals = (signal.SIGINT, signal.SIGTERM)
+        for sig in shutdown_signals:
+            loop.add_signal_handler(sig, stop_event.set)
 
         try:
-            await asyncio.Event().wait()
-        except (KeyboardInterrupt, SystemExit):
+            await stop_event.wait()
             logger.info("Shutdown signal received")
         finally:
+            for sig in shutdown_signals:
+                loop.remove_signal_handler(sig)
             await self.stop()
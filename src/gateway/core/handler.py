@@ -5,13 +5,17 @@ to handle incoming HTTP requests.
 """
 
 import logging
-from collections.abc import Awaitable, Callable
-from datetime import UTC, datetime
 
+import orjson
 from aiohttp import web
 
 from gateway.core.config import GatewayConfig
-from gateway.core.middleware import MiddlewareChain, create_request_context
+from gateway.core.middleware import (
+    MiddlewareChain,
+    create_request_context,
+    resolve_correlation_id,
+    utc_timestamp,
+)
 from gateway.core.routing import Router
 
 logger = logging.getLogger(__name__)
@@ -27,6 +31,16 @@ class RequestHandler:
     - Error responses (404, 405, etc.)
     """
 
+    __slots__ = (
+        "router",
+        "middleware_chain",
+        "config",
+        "_correlation_header",
+        "_match_route",
+        "_get_allowed_methods",
+        "_chain_for",
+    )
+
     def __init__(self, router: Router, middleware_chain: MiddlewareChain, config: GatewayConfig):
         """Initialize the request handler.
 
@@ -38,6 +52,13 @@ class RequestHandler:
         self.router = router
         self.middleware_chain = middleware_chain
         self.config = config
+        # Bind hot-path lookups once instead of resolving them per request
+        self._correlation_header = config.logging.correlation_id_header
+        self._match_route = router.match_route
+        self._get_allowed_methods = router.get_allowed_methods
+        # Call the route's pre-composed chain directly, skipping
+        # MiddlewareChain.execute and any middleware the route does not need
+        self._chain_for = middleware_chain.handler_for
 
     async def handle_request(self, request: web.Request) -> web.Response:
         """Handle an incoming HTTP request.
@@ -48,45 +69,41 @@ class RequestHandler:
         Returns:
             web.Response object
         """
-        # Create request context
-        context = create_request_context(request)
+        correlation_header = self._correlation_header
 
-        # Add correlation ID to response headers
-        headers = {self.config.logging.correlation_id_header: context.correlation_id}
-
-        # Try to match route
-        route_match = self.router.match_route(context.path, context.method)
+        # Match the route before building the full request context, so that
+        # unroutable requests (e.g. scanner traffic) stay cheap
+        route_match = self._match_route(request.path, request.method)
 
         if route_match is None:
+            correlation_id = resolve_correlation_id(request)
+            headers = {correlation_header: correlation_id}
+
             # No route matched - check if path exists with different method
-            allowed_methods = self.router.get_allowed_methods(context.path)
+            allowed_methods = self._get_allowed_methods(request.path)
 
             if allowed_methods:
                 # Path exists but method not allowed - return 405
-                return web.json_response(
-                    {
-                        "error": "method_not_allowed",
-                        "message": f"Method {context.method} not allowed for this path",
-                        "correlation_id": context.correlation_id,
-                        "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
-                    },
-                    status=405,
-                    headers={**headers, "Allow": ", ".join(allowed_methods)},
+                headers["Allow"] = ", ".join(allowed_methods)
+                return _error_response(
+                    405,
+                    "method_not_allowed",
+                    f"Method {request.method} not allowed for this path",
+                    correlation_id,
+                    headers,
                 )
             else:
                 # No route found - return 404
-                return web.json_response(
-                    {
-                        "error": "not_found",
-                        "message": "The requested resource was not found",
-                        "correlation_id": context.correlation_id,
-                        "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
-                    },
-                    status=404,
-                    headers=headers,
+                return _error_response(
+                    404,
+                    "not_found",
+                    "The requested resource was not found",
+                    correlation_id,
+                    headers,
                 )
 
-        # Attach route match to context
+        # Create request context and attach route match
+        context = create_request_context(request)
         context.route_match = route_match
 
         logger.debug(
@@ -100,18 +117,19 @@ class RequestHandler:
 
         # Execute middleware chain
         try:
-            response = await self.middleware_chain.execute(request, context)
+            response = await self._chain_for(route_match.route)(request, context)
 
-            # Add correlation ID to response headers if not already present
-            if self.config.logging.correlation_id_header not in response.headers:
-                response.headers[self.config.logging.correlation_id_header] = context.correlation_id
+            # Proxied responses already carry the correlation ID; add it to
+            # responses produced elsewhere in the chain (401, 429, ...)
+            if correlation_header not in response.headers:
+                response.headers[correlation_header] = context.correlation_id
 
             return response
 
         except web.HTTPException as e:
             # HTTP exceptions are already proper responses
             # Add correlation ID and re-raise
-            e.headers[self.config.logging.correlation_id_header] = context.correlation_id
+            e.headers[correlation_header] = context.correlation_id
             raise
 
         except Exception as e:
@@ -121,48 +139,36 @@ class RequestHandler:
                 extra={"correlation_id": context.correlation_id},
             )
 
-            return web.json_response(
-                {
-                    "error": "internal_error",
-                    "message": "An unexpected error occurred",
-                    "correlation_id": context.correlation_id,
-                    "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
-                },
-                status=500,
-                headers=headers,
+            return _error_response(
+                500,
+                "internal_error",
+                "An unexpected error occurred",
+                context.correlation_id,
+                {correlation_header: context.correlation_id},
             )
 
 
-def create_handler_middleware(
-    router: Router, middleware_chain: MiddlewareChain, config: GatewayConfig
-) -> Callable[
-    [web.Request, Callable[[web.Request], Awaitable[web.Response]]], Awaitable[web.Response]
-]:
-    """Create an aiohttp middleware that uses our request handler.
+def _error_response(
+    status: int, error: str, message: str, correlation_id: str, headers: dict[str, str]
+) -> web.Response:
+    """Build a JSON error response.
 
     Args:
-        router: Router instance
-        middleware_chain: Middleware chain instance
-        config: Gateway configuration
+        status: HTTP status code
+        error: Machine-readable error code
+        message: Human-readable error message
+        correlation_id: Request correlation ID
+        headers: Response headers
 
     Returns:
-        aiohttp middleware function
+        web.Response object
     """
-    request_handler = RequestHandler(router, middleware_chain, config)
-
-    @web.middleware
-    async def middleware(
-        request: web.Request, handler: Callable[[web.Request], Awaitable[web.Response]]
-    ) -> web.Response:
-        """aiohttp middleware function.
-
-        Args:
-            request: aiohttp Request object
-            handler: Next handler (ignored, we use our own chain)
-
-        Returns:
-            web.Response object
-        """
-        return await request_handler.handle_request(request)
-
-    return middleware  # type: ignore[no-any-return]
+    body = orjson.dumps(
+        {
+            "error": error,
+            "message": message,
+            "correlation_id": correlation_id,
+            "timestamp": utc_timestamp(),
+        }
+    )
+    return web.Response(body=body, status=status, headers=headers, content_type="application/json")
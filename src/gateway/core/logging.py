@@ -3,23 +3,132 @@
 Provides structured logging with JSON format, correlation IDs, and sensitive data redaction.
 """
 
+import atexit
+import copy
+import itertools
 import json
 import logging
+import os
+import queue
+import re
 import sys
-import uuid
-from datetime import UTC, datetime
+import time
+from collections.abc import Mapping
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
+import orjson
+
 from gateway.core.config import LoggingConfig
 
+# LogRecord attributes that JsonFormatter never copies into the output
+_RESERVED_RECORD_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "created",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "message",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "correlation_id",
+        "event_fields",
+        "extra_fields",
+    }
+)
+
+# Correlation ID of the request being handled by the current asyncio task
+_correlation_id: ContextVar[str] = ContextVar("correlation_id", default="none")
+
+# Correlation IDs are a random per-process prefix plus a counter, so
+# generating one needs no urandom syscall the way uuid4() does
+_correlation_id_prefix = os.urandom(4).hex()
+_correlation_id_counter = itertools.count()
+
+
+def _reseed_correlation_ids() -> None:
+    """Give a forked worker process its own correlation ID prefix."""
+    global _correlation_id_prefix, _correlation_id_counter
+    _correlation_id_prefix = os.urandom(4).hex()
+    _correlation_id_counter = itertools.count()
+
+
+os.register_at_fork(after_in_child=_reseed_correlation_ids)
+
+
+def generate_correlation_id() -> str:
+    """Generate a unique correlation ID.
+
+    Returns:
+        A correlation ID such as ``req-1a2b3c4d0000002a``
+    """
+    return f"req-{_correlation_id_prefix}{next(_correlation_id_counter) & 0xFFFFFFFF:08x}"
+
+
+# (whole second, formatted "YYYY-MM-DDTHH:MM:SS" prefix) of the last timestamp
+_last_second: tuple[int, str] = (-1, "")
+
+
+def _format_created(created: float) -> str:
+    """Format a record creation time as an ISO 8601 UTC timestamp.
+
+    The date and time part only changes once per second, so it is cached and
+    just the microseconds are formatted per record.
+
+    Args:
+        created: Record creation time in seconds since the epoch
+
+    Returns:
+        Timestamp such as ``2024-01-01T12:00:00.123456+00:00``
+    """
+    global _last_second
+    second = int(created)
+    cached_second, prefix = _last_second
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _last_second = (second, prefix)
+    return f"{prefix}.{int((created - second) * 1_000_000):06d}+00:00"
+
+
+# Listener writing records for the "gateway" logger, if one is running
+_active_listener: QueueListener | None = None
+
+
+def _stop_active_listener() -> None:
+    """Flush queued records and stop the active queue listener, if any."""
+    global _active_listener
+    listener, _active_listener = _active_listener, None
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+# Make sure records still in the queue are written on interpreter exit
+atexit.register(_stop_active_listener)
+
 
 class CorrelationIdFilter(logging.Filter):
-    """Logging filter that adds correlation ID to log records."""
+    """Logging filter that adds correlation ID to log records.
 
-    def __init__(self) -> None:
-        """Initialize the correlation ID filter."""
-        super().__init__()
-        self._correlation_id: str | None = None
+    The correlation ID is stored in a context variable, so concurrent
+    requests handled by different asyncio tasks never see each other's ID.
+    """
 
     def set_correlation_id(self, correlation_id: str) -> None:
         """Set the correlation ID for the current request.
@@ -27,11 +136,11 @@ class CorrelationIdFilter(logging.Filter):
         Args:
             correlation_id: The correlation ID to use
         """
-        self._correlation_id = correlation_id
+        _correlation_id.set(correlation_id)
 
     def clear_correlation_id(self) -> None:
         """Clear the correlation ID."""
-        self._correlation_id = None
+        _correlation_id.set("none")
 
     def filter(self, record: logging.LogRecord) -> bool:
         """Add correlation ID to the log record.
@@ -42,7 +151,7 @@ class CorrelationIdFilter(logging.Filter):
         Returns:
             True to include the record
         """
-        record.correlation_id = self._correlation_id or "none"  # type: ignore
+        record.correlation_id = _correlation_id.get() or "none"  # type: ignore
         return True
 
 
@@ -57,6 +166,12 @@ class JsonFormatter(logging.Formatter):
         """
         super().__init__()
         self.redact_patterns = redact_patterns or []
+        # Case-insensitive substring match on any pattern, as one regex scan
+        self._redact_re = (
+            re.compile("|".join(re.escape(p.lower()) for p in self.redact_patterns))
+            if self.redact_patterns
+            else None
+        )
 
     def format(self, record: logging.LogRecord) -> str:
         """Format a log record as JSON.
@@ -68,7 +183,7 @@ class JsonFormatter(logging.Formatter):
             JSON-formatted log string
         """
         log_data: dict[str, Any] = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": _format_created(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -79,44 +194,30 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        # Add extra fields from the record
-        if hasattr(record, "extra_fields"):
-            extra = record.extra_fields
-            if isinstance(extra, dict):
-                log_data.update(self._redact_sensitive_data(extra))
+        # Add fields built by GatewayLogger itself; their keys are fixed and
+        # known not to be sensitive, so they skip redaction
+        event_fields = getattr(record, "event_fields", None)
+        if isinstance(event_fields, dict):
+            log_data.update(event_fields)
+
+        # Add caller-supplied extra fields from the record
+        extra = getattr(record, "extra_fields", None)
+        if isinstance(extra, dict) and extra:
+            log_data.update(self._redact_sensitive_data(extra))
 
         # Add any custom attributes
         for key, value in record.__dict__.items():
-            if key not in [
-                "name",
-                "msg",
-                "args",
-                "created",
-                "filename",
-                "funcName",
-                "levelname",
-                "levelno",
-                "lineno",
-                "module",
-                "msecs",
-                "message",
-                "pathname",
-                "process",
-                "processName",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "correlation_id",
-                "extra_fields",
-            ]:
+            if key not in _RESERVED_RECORD_ATTRS:
                 log_data[key] = value
 
-        return json.dumps(log_data, default=str)
+        try:
+            return orjson.dumps(log_data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            # orjson rejects a few values the stdlib accepts (e.g. integers
+            # wider than 64 bits); never drop a log line because of that
+            return json.dumps(log_data, default=str)
 
-    def _redact_sensitive_data(self, data: dict[str, Any]) -> dict[str, Any]:
+    def _redact_sensitive_data(self, data: Mapping[str, Any]) -> dict[str, Any]:
         """Redact sensitive data from log fields.
 
         Args:
@@ -125,11 +226,13 @@ class JsonFormatter(logging.Formatter):
         Returns:
             Dictionary with sensitive fields redacted
         """
+        redact_re = self._redact_re
         redacted: dict[str, Any] = {}
         for key, value in data.items():
-            if any(pattern.lower() in key.lower() for pattern in self.redact_patterns):
+            if redact_re is not None and redact_re.search(key.lower()):
                 redacted[key] = "***REDACTED***"
-            elif isinstance(value, dict):
+            elif isinstance(value, Mapping):
+                # Also covers request header multidicts, which are not dicts
                 redacted[key] = self._redact_sensitive_data(value)
             else:
                 redacted[key] = value
@@ -148,7 +251,7 @@ class TextFormatter(logging.Formatter):
         Returns:
             Formatted log string
         """
-        timestamp = datetime.now(UTC).isoformat()
+        timestamp = _format_created(record.created)
         correlation_id = getattr(record, "correlation_id", "none")
 
         base = (
@@ -163,6 +266,30 @@ class TextFormatter(logging.Formatter):
         return base
 
 
+class _ThreadQueueHandler(QueueHandler):
+    """Queue handler for a listener thread in the same process.
+
+    The stdlib ``QueueHandler`` fully formats each record before enqueueing it
+    so it can be pickled. Records here never leave the process, so only the
+    message is resolved on the calling thread; formatting and I/O happen on
+    the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Resolve the message arguments before the record is enqueued.
+
+        Args:
+            record: The log record to enqueue
+
+        Returns:
+            Copy of the record with its message merged
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 class GatewayLogger:
     """Gateway logger with structured logging and correlation ID support."""
 
@@ -175,13 +302,25 @@ class GatewayLogger:
         self.config = config
         self.correlation_filter = CorrelationIdFilter()
         self._setup_logging()
+        self._logger = self.get_logger()
 
     def _setup_logging(self) -> None:
-        """Set up logging configuration."""
+        """Set up logging configuration.
+
+        Records are handed to a queue and written by a background listener
+        thread, so slow log output (e.g. a back-pressured stdout pipe) never
+        blocks the event loop. On AWS Lambda records are written synchronously.
+        """
+        global _active_listener
+
         # Get or create root logger
         logger = logging.getLogger("gateway")
         logger.setLevel(getattr(logging, self.config.level))
+        for existing in logger.handlers:
+            if not isinstance(existing, QueueHandler):
+                existing.close()
         logger.handlers.clear()
+        _stop_active_listener()
 
         # Create handler based on output configuration
         handler: logging.Handler
@@ -201,12 +340,34 @@ class GatewayLogger:
             formatter = TextFormatter()
 
         handler.setFormatter(formatter)
-        handler.addFilter(self.correlation_filter)
-        logger.addHandler(handler)
+
+        self.listener: QueueListener | None = None
+        if os.getenv("AWS_LAMBDA_FUNCTION_NAME"):
+            # Lambda freezes the process between invocations without running
+            # atexit, so a listener thread could write an invocation's records
+            # late or lose them; write them before the invocation returns
+            handler.addFilter(self.correlation_filter)
+            logger.addHandler(handler)
+        else:
+            # The correlation ID lives in a context variable, so it has to be
+            # attached on the logging thread rather than the listener thread
+            log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+            queue_handler = _ThreadQueueHandler(log_queue)
+            queue_handler.addFilter(self.correlation_filter)
+            logger.addHandler(queue_handler)
+
+            self.listener = QueueListener(log_queue, handler)
+            self.listener.start()
+            _active_listener = self.listener
 
         # Prevent propagation to root logger
         logger.propagate = False
 
+    def shutdown(self) -> None:
+        """Flush queued log records and stop the listener thread."""
+        if self.listener is not None and _active_listener is self.listener:
+            _stop_active_listener()
+
     def set_correlation_id(self, correlation_id: str | None = None) -> str:
         """Set or generate a correlation ID for the current request.
 
@@ -232,7 +393,7 @@ class GatewayLogger:
         Returns:
             A unique correlation ID
         """
-        return f"req-{uuid.uuid4().hex[:16]}"
+        return generate_correlation_id()
 
     def get_logger(self, name: str = "gateway") -> logging.Logger:
         """Get a logger instance.
@@ -245,6 +406,42 @@ class GatewayLogger:
         """
         return logging.getLogger(name)
 
+    def _log(
+        self,
+        level: int,
+        message: str,
+        event_fields: dict[str, Any],
+        extra_fields: dict[str, Any],
+    ) -> None:
+        """Emit a structured log record.
+
+        Builds the record directly instead of going through ``Logger.log``,
+        which walks the call stack to find the caller's file and line number
+        on every call. The formatters never output those, and for these
+        helpers they would always point here anyway.
+
+        Callers check ``self._logger.isEnabledFor(level)`` first, so that no
+        fields are built for records that would be discarded.
+
+        Args:
+            level: Log level
+            message: Log message
+            event_fields: Fields built by the helper itself (not redacted)
+            extra_fields: Caller-supplied fields (redacted by JsonFormatter)
+        """
+        logger = self._logger
+        record = logger.makeRecord(
+            logger.name,
+            level,
+            "(unknown file)",
+            0,
+            message,
+            (),
+            None,
+            extra={"event_fields": event_fields, "extra_fields": extra_fields},
+        )
+        logger.handle(record)
+
     def log_request(
         self,
         method: str,
@@ -264,8 +461,10 @@ class GatewayLogger:
             user_id: Authenticated user ID
             **kwargs: Additional fields to log
         """
-        logger = self.get_logger()
-        extra_fields = {
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
+
+        event_fields: dict[str, Any] = {
             "event_type": "request_received",
             "request": {
                 "method": method,
@@ -275,15 +474,9 @@ class GatewayLogger:
             },
         }
         if user_id:
-            extra_fields["auth"] = {"user_id": user_id}
-
-        extra_fields.update(kwargs)
+            event_fields["auth"] = {"user_id": user_id}
 
-        # Create a log record with extra fields
-        logger.info(
-            f"{method} {path} from {client_ip}",
-            extra={"extra_fields": extra_fields},
-        )
+        self._log(logging.INFO, f"{method} {path} from {client_ip}", event_fields, kwargs)
 
     def log_response(
         self,
@@ -306,8 +499,18 @@ class GatewayLogger:
             user_id: Authenticated user ID
             **kwargs: Additional fields to log
         """
-        logger = self.get_logger()
-        extra_fields = {
+        # Determine log level based on status code
+        if status_code >= 500:
+            log_level = logging.ERROR
+        elif status_code >= 400:
+            log_level = logging.WARNING
+        else:
+            log_level = logging.INFO
+
+        if not self._logger.isEnabledFor(log_level):
+            return
+
+        event_fields: dict[str, Any] = {
             "event_type": "request_completed",
             "request": {"method": method, "path": path},
             "response": {
@@ -317,22 +520,13 @@ class GatewayLogger:
             },
         }
         if user_id:
-            extra_fields["auth"] = {"user_id": user_id}
-
-        extra_fields.update(kwargs)
-
-        # Determine log level based on status code
-        if status_code >= 500:
-            log_level = logging.ERROR
-        elif status_code >= 400:
-            log_level = logging.WARNING
-        else:
-            log_level = logging.INFO
+            event_fields["auth"] = {"user_id": user_id}
 
-        logger.log(
+        self._log(
             log_level,
             f"{method} {path} -> {status_code} ({latency_ms:.2f}ms)",
-            extra={"extra_fields": extra_fields},
+            event_fields,
+            kwargs,
         )
 
     def log_auth_event(
@@ -352,23 +546,24 @@ class GatewayLogger:
             reason: Failure reason if applicable
             **kwargs: Additional fields to log
         """
-        logger = self.get_logger()
+        log_level = logging.INFO if success else logging.WARNING
+        if not self._logger.isEnabledFor(log_level):
+            return
+
         auth_data: dict[str, Any] = {"user_id": user_id, "success": success}
         if reason:
             auth_data["reason"] = reason
 
-        extra_fields: dict[str, Any] = {
+        event_fields: dict[str, Any] = {
             "event_type": event,
             "auth": auth_data,
         }
-        extra_fields.update(kwargs)
 
-        log_level = logging.INFO if success else logging.WARNING
         message = f"Auth event: {event}"
         if reason:
             message += f" - {reason}"
 
-        logger.log(log_level, message, extra={"extra_fields": extra_fields})
+        self._log(log_level, message, event_fields, kwargs)
 
     def log_rate_limit_event(
         self,
@@ -387,8 +582,12 @@ class GatewayLogger:
             exceeded: Whether the limit was exceeded
             **kwargs: Additional fields to log
         """
-        logger = self.get_logger()
-        extra_fields = {
+        # Passed checks log at DEBUG, so are usually filtered out in production
+        log_level = logging.WARNING if exceeded else logging.DEBUG
+        if not self._logger.isEnabledFor(log_level):
+            return
+
+        event_fields: dict[str, Any] = {
             "event_type": "rate_limit_check",
             "ratelimit": {
                 "key": key,
@@ -397,12 +596,10 @@ class GatewayLogger:
                 "exceeded": exceeded,
             },
         }
-        extra_fields.update(kwargs)
 
-        log_level = logging.WARNING if exceeded else logging.DEBUG
         message = f"Rate limit {'exceeded' if exceeded else 'checked'} for key {key}"
 
-        logger.log(log_level, message, extra={"extra_fields": extra_fields})
+        self._log(log_level, message, event_fields, kwargs)
 
     def log_upstream_event(
         self,
@@ -423,7 +620,10 @@ class GatewayLogger:
             error: Error message if request failed
             **kwargs: Additional fields to log
         """
-        logger = self.get_logger()
+        log_level = logging.ERROR if error else logging.DEBUG
+        if not self._logger.isEnabledFor(log_level):
+            return
+
         upstream_data: dict[str, Any] = {
             "url": upstream_url,
             "method": method,
@@ -433,20 +633,18 @@ class GatewayLogger:
         if error:
             upstream_data["error"] = error
 
-        extra_fields: dict[str, Any] = {
+        event_fields: dict[str, Any] = {
             "event_type": "upstream_request",
             "upstream": upstream_data,
         }
-        extra_fields.update(kwargs)
 
-        log_level = logging.ERROR if error else logging.DEBUG
         message = f"Upstream {method} {upstream_url}"
         if status_code:
             message += f" -> {status_code}"
         if error:
             message += f" - {error}"
 
-        logger.log(log_level, message, extra={"extra_fields": extra_fields})
+        self._log(log_level, message, event_fields, kwargs)
 
 
 # Global logger instance (will be initialized by the application)
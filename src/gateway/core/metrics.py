@@ -3,8 +3,14 @@
 Provides metrics collection, health checks, and integration with monitoring systems.
 """
 
+import asyncio
+import functools
+import inspect
+import math
+import re
 import time
-from collections.abc import Callable
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Iterable
 from enum import Enum
 from typing import Any
 
@@ -14,10 +20,140 @@ from prometheus_client import (
     Gauge,
     Histogram,
     generate_latest,
+    values,
 )
 
 from gateway.core.config import MetricsConfig
 
+# Path segments replaced with placeholders by GatewayMetrics._normalize_path
+_UUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE
+)
+_NUMERIC_ID_RE = re.compile(r"/\d+")
+# Paths without digits or dashes cannot contain either of the above
+_MAYBE_ID_RE = re.compile(r"[\d-]")
+
+
+# Most traffic hits a small set of paths, so the result is memoized. The cache
+# is bounded so that unique paths (e.g. scanner traffic) cannot grow it freely.
+@functools.lru_cache(maxsize=2048)
+def _normalize_path(path: str) -> str:
+    """Normalize path for metrics to avoid cardinality explosion.
+
+    Replaces UUIDs and numeric IDs with placeholders.
+
+    Args:
+        path: Original request path
+
+    Returns:
+        Normalized path
+    """
+    # Fast path for static paths such as /health
+    if not _MAYBE_ID_RE.search(path):
+        return path
+
+    # Replace UUIDs
+    path = _UUID_RE.sub(":id", path)
+
+    # Replace numeric IDs (sequences of digits)
+    return _NUMERIC_ID_RE.sub("/:id", path)
+
+
+class _UnlockedValue(values.MutexValue):
+    """Metric value updated without taking a lock.
+
+    The gateway records metrics from a single event loop thread, where the
+    per-update ``threading.Lock`` of ``MutexValue`` is pure overhead.
+    """
+
+    def inc(self, amount: float) -> None:
+        """Increment the value."""
+        self._value += amount
+
+    def set(self, value: float, timestamp: float | None = None) -> None:
+        """Set the value."""
+        self._value = value
+
+    def set_exemplar(self, exemplar: Any) -> None:
+        """Set the exemplar."""
+        self._exemplar = exemplar
+
+    def get(self) -> float:
+        """Get the value."""
+        return self._value  # type: ignore[no-any-return]
+
+    def get_exemplar(self) -> Any:
+        """Get the exemplar."""
+        return self._exemplar
+
+
+def _use_unlocked_values() -> None:
+    """Make metrics created from now on use lock-free values.
+
+    prometheus_client picks the value class when each metric (child) is
+    created, process-wide. Multiprocess mode uses its own value class, which
+    is left alone.
+    """
+    if values.ValueClass is values.MutexValue:
+        values.ValueClass = _UnlockedValue
+
+
+class _BisectHistogram(Histogram):
+    """Histogram that finds the bucket for an observation by binary search.
+
+    ``Histogram.observe`` scans the buckets linearly in Python; with the
+    gateway's 11 latency buckets, bisecting the sorted bounds is cheaper.
+    This relies on prometheus_client's private ``_upper_bounds``, ``_buckets``
+    and ``_sum``, so its version is capped in pyproject.toml.
+    """
+
+    def observe(self, amount: float, exemplar: dict[str, str] | None = None) -> None:
+        """Observe the given amount.
+
+        Args:
+            amount: Observed value
+            exemplar: Optional exemplar labels
+        """
+        # NaN compares false against every bound, so the linear scan counts it
+        # in no bucket while bisect_left would put it in the first one
+        if exemplar or math.isnan(amount):
+            super().observe(amount, exemplar)
+            return
+        self._raise_if_not_observable()
+        self._sum.inc(amount)
+        # Bounds are sorted and end in +Inf, so this is the first bucket
+        # whose upper bound is >= amount, as in the linear scan
+        self._buckets[bisect_left(self._upper_bounds, amount)].inc(1)
+
+
+# Rate limit key types accepted by RateLimitRule
+_RATE_LIMIT_KEY_TYPES = frozenset({"ip", "user", "route", "composite"})
+
+# Status label values, so recording a status does not format a new string
+_STATUS_LABELS = {code: str(code) for code in range(100, 600)}
+
+# Label value substituted for values outside an allowlist or series budget
+OTHER_LABEL_VALUE = "other"
+
+
+def _sanitize_label(value: str, allowed: frozenset[str] | None) -> str:
+    """Map a label value outside of an allowlist to ``OTHER_LABEL_VALUE``.
+
+    Args:
+        value: Label value
+        allowed: Accepted label values, or None to accept any value
+
+    Returns:
+        The label value if allowed, otherwise ``OTHER_LABEL_VALUE``
+    """
+    if allowed is None or value in allowed:
+        return value
+    return OTHER_LABEL_VALUE
+
+
+# Bound children of the request total, duration, request size and response size metrics
+_RequestChildren = tuple[Counter, _BisectHistogram, _BisectHistogram, _BisectHistogram]
+
 
 class HealthStatus(Enum):
     """Health check status enumeration."""
@@ -30,6 +166,8 @@ class HealthStatus(Enum):
 class ComponentHealth:
     """Health status of a component."""
 
+    __slots__ = ("name", "status", "message", "details")
+
     def __init__(
         self,
         name: str,
@@ -70,6 +208,15 @@ class ComponentHealth:
 class GatewayMetrics:
     """Gateway metrics collector using Prometheus."""
 
+    # Scrapes within this window reuse the previously rendered exposition
+    EXPORT_CACHE_SECONDS = 1.0
+
+    # Summary health checks within this window reuse the previous result
+    HEALTH_CACHE_SECONDS = 1.0
+
+    # Maximum number of (method, path, status) label sets with cached children
+    LABEL_CACHE_SIZE = 4096
+
     def __init__(self, config: MetricsConfig):
         """Initialize the metrics collector.
 
@@ -77,7 +224,23 @@ class GatewayMetrics:
             config: Metrics configuration
         """
         self.config = config
-        self._health_checks: dict[str, Callable[[], ComponentHealth]] = {}
+        if config.single_threaded:
+            _use_unlocked_values()
+
+        self._health_checks: dict[str, Callable[[], Awaitable[ComponentHealth]]] = {}
+        self._export_bytes = b""
+        self._export_time = float("-inf")
+        # (checked at, result) of the last summary health check
+        self._health_cache: tuple[float, dict[str, Any]] | None = None
+        # (method, normalized path, status) -> bound request metric children
+        self._request_children: dict[tuple[str, str, int], _RequestChildren] = {}
+        # Accepted route, upstream and rate limit rule label values; None until
+        # set_label_allowlists() is called, leaving only the series budget
+        self._allowed_routes: frozenset[str] | None = None
+        self._allowed_upstreams: frozenset[str] | None = None
+        self._allowed_rule_names: frozenset[str] | None = None
+        # Metric name -> label sets recorded for labels fed by free-form strings
+        self._label_sets: dict[str, set[tuple[str, ...]]] = {}
 
         # Request metrics
         self.request_total = Counter(
@@ -86,24 +249,26 @@ class GatewayMetrics:
             ["method", "path", "status"],
         )
 
-        self.request_duration = Histogram(
+        self.request_duration = _BisectHistogram(
             "gateway_request_duration_seconds",
             "HTTP request latency in seconds",
             ["method", "path"],
             buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
         )
 
-        self.request_size = Histogram(
+        # Size histograms are labelled by method only: per-path size buckets
+        # would multiply the series count for little insight
+        self.request_size = _BisectHistogram(
             "gateway_request_size_bytes",
             "HTTP request size in bytes",
-            ["method", "path"],
+            ["method"],
             buckets=(100, 1000, 10000, 100000, 1000000, 10000000),
         )
 
-        self.response_size = Histogram(
+        self.response_size = _BisectHistogram(
             "gateway_response_size_bytes",
             "HTTP response size in bytes",
-            ["method", "path"],
+            ["method"],
             buckets=(100, 1000, 10000, 100000, 1000000, 10000000),
         )
 
@@ -151,7 +316,7 @@ class GatewayMetrics:
             ["upstream", "status"],
         )
 
-        self.upstream_duration = Histogram(
+        self.upstream_duration = _BisectHistogram(
             "gateway_upstream_duration_seconds",
             "Upstream request latency in seconds",
             ["upstream"],
@@ -171,6 +336,55 @@ class GatewayMetrics:
             ["error_type"],
         )
 
+        self.label_overflow = Counter(
+            "gateway_metric_label_overflow_total",
+            "Total number of label sets folded into the other series",
+            ["metric"],
+        )
+
+    def set_label_allowlists(
+        self,
+        routes: Iterable[str],
+        upstreams: Iterable[str],
+        rule_names: Iterable[str],
+    ) -> None:
+        """Restrict route, upstream and rate limit rule labels to known values.
+
+        Values outside an allowlist are recorded as ``OTHER_LABEL_VALUE``.
+
+        Args:
+            routes: Configured route identifiers
+            upstreams: Configured upstream URLs
+            rule_names: Configured rate limit rule names
+        """
+        self._allowed_routes = frozenset(routes)
+        self._allowed_upstreams = frozenset(upstreams)
+        self._allowed_rule_names = frozenset(rule_names)
+
+    def _bounded_labels(self, metric: Any, metric_name: str, *label_values: str) -> Any:
+        """Get the child of a metric, capping the number of label sets.
+
+        Labels without an allowlist (error types, auth failure reasons) have no
+        configured set of values, so once a metric holds ``max_label_series``
+        label sets, new ones are recorded against an all-"other" series.
+
+        Args:
+            metric: Labelled Prometheus metric
+            metric_name: Name of the metric, used for the overflow counter
+            *label_values: Label values, in label name order
+
+        Returns:
+            The metric child to record against
+        """
+        label_sets = self._label_sets.setdefault(metric_name, set())
+        if label_values not in label_sets:
+            if len(label_sets) >= self.config.max_label_series:
+                self.label_overflow.labels(metric=metric_name).inc()
+                label_values = (OTHER_LABEL_VALUE,) * len(label_values)
+            else:
+                label_sets.add(label_values)
+        return metric.labels(*label_values)
+
     def record_request(
         self,
         method: str,
@@ -193,17 +407,47 @@ class GatewayMetrics:
         # Normalize path for metrics (remove IDs, etc.)
         normalized_path = self._normalize_path(path)
 
-        self.request_total.labels(
-            method=method, path=normalized_path, status=str(status_code)
-        ).inc()
+        key = (method, normalized_path, status_code)
+        children = self._request_children.get(key)
+        if children is None:
+            children = self._bind_request_children(key)
+        total, duration, req_size, resp_size = children
 
-        self.request_duration.labels(method=method, path=normalized_path).observe(duration_seconds)
+        total.inc()
+        duration.observe(duration_seconds)
 
         if request_size is not None:
-            self.request_size.labels(method=method, path=normalized_path).observe(request_size)
+            req_size.observe(request_size)
 
         if response_size is not None:
-            self.response_size.labels(method=method, path=normalized_path).observe(response_size)
+            resp_size.observe(response_size)
+
+    def _bind_request_children(self, key: tuple[str, str, int]) -> _RequestChildren:
+        """Resolve and cache the request metric children for a label set.
+
+        ``.labels()`` hashes the label values and takes a lock on every call,
+        so the bound children are cached per label set instead. The cache is
+        bounded, evicting the oldest entry, since label sets are not.
+
+        Args:
+            key: Tuple of (method, normalized path, status code)
+
+        Returns:
+            Tuple of (request total, duration, request size, response size) children
+        """
+        method, path, status_code = key
+        children = (
+            self.request_total.labels(method=method, path=path, status=str(status_code)),
+            self.request_duration.labels(method=method, path=path),
+            self.request_size.labels(method=method),
+            self.response_size.labels(method=method),
+        )
+
+        cache = self._request_children
+        if len(cache) >= self.LABEL_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = children
+        return children
 
     def record_auth_attempt(self, success: bool, reason: str | None = None) -> None:
         """Record an authentication attempt.
@@ -216,15 +460,16 @@ class GatewayMetrics:
         self.auth_attempts.labels(result=result).inc()
 
         if not success and reason:
-            self.auth_failures.labels(reason=reason).inc()
+            self._bounded_labels(self.auth_failures, "gateway_auth_failures_total", reason).inc()
 
     def record_authz_denial(self, route: str) -> None:
         """Record an authorization denial.
 
         Args:
-            route: The route that was denied
+            route: Identifier of the route that was denied
         """
-        self.authz_denials.labels(route=route).inc()
+        route = _sanitize_label(route, self._allowed_routes)
+        self._bounded_labels(self.authz_denials, "gateway_authz_denials_total", route).inc()
 
     def record_rate_limit_exceeded(self, rule_name: str, key_type: str) -> None:
         """Record a rate limit violation.
@@ -233,7 +478,11 @@ class GatewayMetrics:
             rule_name: Name of the rate limit rule
             key_type: Type of rate limit key (ip, user, etc.)
         """
-        self.rate_limit_exceeded.labels(rule=rule_name, key_type=key_type).inc()
+        rule_name = _sanitize_label(rule_name, self._allowed_rule_names)
+        key_type = _sanitize_label(key_type, _RATE_LIMIT_KEY_TYPES)
+        self._bounded_labels(
+            self.rate_limit_exceeded, "gateway_rate_limit_exceeded_total", rule_name, key_type
+        ).inc()
 
     def update_rate_limit_keys(self, count: int) -> None:
         """Update the number of active rate limit keys.
@@ -253,18 +502,27 @@ class GatewayMetrics:
         """Record an upstream request.
 
         Args:
-            upstream: Upstream service identifier
+            upstream: Upstream service URL
             status_code: HTTP status code (0 if error)
             duration_seconds: Request duration in seconds
             error_type: Error type if request failed
         """
-        status_str = str(status_code) if status_code > 0 else "error"
-        self.upstream_requests.labels(upstream=upstream, status=status_str).inc()
+        status_str = _STATUS_LABELS.get(status_code) or (
+            str(status_code) if status_code > 0 else "error"
+        )
+        upstream = _sanitize_label(upstream, self._allowed_upstreams)
+        self._bounded_labels(
+            self.upstream_requests, "gateway_upstream_requests_total", upstream, status_str
+        ).inc()
 
-        self.upstream_duration.labels(upstream=upstream).observe(duration_seconds)
+        self._bounded_labels(
+            self.upstream_duration, "gateway_upstream_duration_seconds", upstream
+        ).observe(duration_seconds)
 
         if error_type:
-            self.upstream_errors.labels(upstream=upstream, error_type=error_type).inc()
+            self._bounded_labels(
+                self.upstream_errors, "gateway_upstream_errors_total", upstream, error_type
+            ).inc()
 
     def record_error(self, error_type: str) -> None:
         """Record an error.
@@ -272,7 +530,7 @@ class GatewayMetrics:
         Args:
             error_type: Type of error
         """
-        self.errors_total.labels(error_type=error_type).inc()
+        self._bounded_labels(self.errors_total, "gateway_errors_total", error_type).inc()
 
     def increment_connections(self) -> None:
         """Increment active connection count."""
@@ -282,57 +540,90 @@ class GatewayMetrics:
         """Decrement active connection count."""
         self.active_connections.dec()
 
-    def register_health_check(self, name: str, check_func: Callable[[], ComponentHealth]) -> None:
+    def register_health_check(
+        self,
+        name: str,
+        check_func: Callable[[], ComponentHealth] | Callable[[], Awaitable[ComponentHealth]],
+    ) -> None:
         """Register a health check function.
 
+        Synchronous check functions are run in a worker thread, so that
+        blocking checks do not stall the event loop.
+
         Args:
             name: Component name
-            check_func: Function that returns ComponentHealth
+            check_func: Function or coroutine function that returns ComponentHealth
         """
-        self._health_checks[name] = check_func
+        if inspect.iscoroutinefunction(check_func):
+            self._health_checks[name] = check_func
+        else:
+            self._health_checks[name] = functools.partial(asyncio.to_thread, check_func)  # type: ignore[arg-type,assignment]
+        self._health_cache = None
 
-    def check_health(self, detailed: bool = False) -> dict[str, Any]:
+    async def check_health(self, detailed: bool = False, use_cache: bool = True) -> dict[str, Any]:
         """Check health of all registered components.
 
+        Checks run concurrently, so a check takes as long as the slowest
+        component. Summary results (``detailed=False``) are cached for
+        ``HEALTH_CACHE_SECONDS``, so back-to-back probes do not re-run
+        checks that may do network I/O.
+
         Args:
             detailed: Whether to include detailed component status
+            use_cache: Whether a cached summary result may be returned
 
         Returns:
             Dictionary with health check results
         """
+        cached = self._health_cache
+        if (
+            use_cache
+            and not detailed
+            and cached is not None
+            and time.monotonic() - cached[0] < self.HEALTH_CACHE_SECONDS
+        ):
+            return dict(cached[1])
+
         if not self._health_checks:
             return {
                 "status": HealthStatus.HEALTHY.value,
                 "message": "No health checks registered",
             }
 
-        component_results: list[ComponentHealth] = []
+        results = await asyncio.gather(
+            *(check_func() for check_func in self._health_checks.values()),
+            return_exceptions=True,
+        )
+
+        # Component entries are only built for detailed responses
+        components: list[dict[str, Any]] = []
         overall_status = HealthStatus.HEALTHY
 
-        for name, check_func in self._health_checks.items():
-            try:
-                health_result = check_func()
-                component_results.append(health_result)
-
-                # Determine overall status
-                if health_result.status == HealthStatus.UNHEALTHY:
-                    overall_status = HealthStatus.UNHEALTHY
-                elif (
-                    health_result.status == HealthStatus.DEGRADED
-                    and overall_status == HealthStatus.HEALTHY
-                ):
-                    overall_status = HealthStatus.DEGRADED
-
-            except Exception as e:
+        for name, health_result in zip(self._health_checks, results, strict=True):
+            if isinstance(health_result, BaseException):
                 # Health check itself failed
-                component_results.append(
-                    ComponentHealth(
-                        name=name,
-                        status=HealthStatus.UNHEALTHY,
-                        message=f"Health check failed: {str(e)}",
+                overall_status = HealthStatus.UNHEALTHY
+                if detailed:
+                    components.append(
+                        ComponentHealth(
+                            name=name,
+                            status=HealthStatus.UNHEALTHY,
+                            message=f"Health check failed: {str(health_result)}",
+                        ).to_dict()
                     )
-                )
+                continue
+
+            if detailed:
+                components.append(health_result.to_dict())
+
+            # Determine overall status
+            if health_result.status == HealthStatus.UNHEALTHY:
                 overall_status = HealthStatus.UNHEALTHY
+            elif (
+                health_result.status == HealthStatus.DEGRADED
+                and overall_status == HealthStatus.HEALTHY
+            ):
+                overall_status = HealthStatus.DEGRADED
 
         response: dict[str, Any] = {
             "status": overall_status.value,
@@ -340,7 +631,9 @@ class GatewayMetrics:
         }
 
         if detailed:
-            response["components"] = [c.to_dict() for c in component_results]
+            response["components"] = components
+        else:
+            self._health_cache = (time.monotonic(), dict(response))
 
         return response
 
@@ -355,14 +648,14 @@ class GatewayMetrics:
             "timestamp": time.time(),
         }
 
-    def check_readiness(self) -> dict[str, Any]:
+    async def check_readiness(self) -> dict[str, Any]:
         """Check if the service is ready to accept traffic.
 
         Returns:
             Dictionary with readiness status
         """
         # Readiness is based on all health checks passing
-        health = self.check_health(detailed=False)
+        health = await self.check_health(detailed=False)
         return {
             "status": health["status"],
             "ready": health["status"] == HealthStatus.HEALTHY.value,
@@ -372,37 +665,20 @@ class GatewayMetrics:
     def export_metrics(self) -> bytes:
         """Export metrics in Prometheus format.
 
-        Returns:
-            Prometheus-formatted metrics
-        """
-        return bytes(generate_latest(REGISTRY))
-
-    @staticmethod
-    def _normalize_path(path: str) -> str:
-        """Normalize path for metrics to avoid cardinality explosion.
-
-        Replaces UUIDs and numeric IDs with placeholders.
-
-        Args:
-            path: Original request path
+        The rendered output is cached for ``EXPORT_CACHE_SECONDS`` so that
+        concurrent or rapid scrapes do not re-render the whole registry.
 
         Returns:
-            Normalized path
+            Prometheus-formatted metrics
         """
-        import re
-
-        # Replace UUIDs
-        path = re.sub(
-            r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
-            ":id",
-            path,
-            flags=re.IGNORECASE,
-        )
-
-        # Replace numeric IDs (sequences of digits)
-        path = re.sub(r"/\d+", "/:id", path)
-
-        return path
+        now = time.monotonic()
+        if now - self._export_time >= self.EXPORT_CACHE_SECONDS:
+            self._export_bytes = generate_latest(REGISTRY)
+            self._export_time = now
+        return self._export_bytes
+
+    # Exposed on the class so existing callers keep working
+    _normalize_path = staticmethod(_normalize_path)
 
 
 # Global metrics instance (will be initialized by the application)
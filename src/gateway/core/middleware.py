@@ -9,22 +9,42 @@ This module implements the middleware framework including:
 
 import logging
 import time
-import uuid
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Callable
-from dataclasses import dataclass, field
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import UTC, datetime
 from typing import Any
 
+import orjson
 from aiohttp import web
 
-from gateway.core.config import GatewayConfig
+from gateway.core.config import GatewayConfig, RouteConfig
+from gateway.core.logging import generate_correlation_id
 from gateway.core.routing import RouteMatch
-from gateway.core.server import CONFIG_KEY, LOGGER_KEY, METRICS_KEY
+from gateway.core.server import CORRELATION_HEADER_KEY, LOGGER_KEY, METRICS_KEY
 
 logger = logging.getLogger(__name__)
 
+# (epoch milliseconds, formatted timestamp) of the last utc_timestamp() call
+_last_timestamp: tuple[int, str] = (-1, "")
+
+
+def utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string with a ``Z`` suffix.
+
+    The formatted value is reused for all calls within the same millisecond,
+    so bursts of error responses do not each pay for datetime formatting.
+
+    Returns:
+        Timestamp such as ``2025-01-01T12:00:00.123Z``
+    """
+    global _last_timestamp
+    now_ms = time.time_ns() // 1_000_000
+    if now_ms != _last_timestamp[0]:
+        formatted = datetime.fromtimestamp(now_ms / 1000, UTC).isoformat(timespec="milliseconds")
+        _last_timestamp = (now_ms, formatted.replace("+00:00", "Z"))
+    return _last_timestamp[1]
+
 
-@dataclass
 class RequestContext:
     """Request context that flows through the middleware chain.
 
@@ -35,37 +55,114 @@ class RequestContext:
     - User and session context (populated by auth middleware)
     - Timing information
     - Custom attributes
-    """
 
-    # HTTP Request Data
-    method: str
-    path: str
-    query_params: dict[str, str]
-    headers: dict[str, str]
-    client_ip: str
-    user_agent: str
-
-    # Correlation and Timing
-    correlation_id: str
-    start_time: float = field(default_factory=time.time)
+    One context is created per request, so it is a plain ``__slots__`` class
+    rather than a dataclass with default factories.
+    """
 
-    # Route Information
-    route_match: RouteMatch | None = None
+    __slots__ = (
+        "method",
+        "path",
+        "query_params",
+        "headers",
+        "client_ip",
+        "user_agent",
+        "correlation_id",
+        "start_time",
+        "route_match",
+        "user_id",
+        "session_id",
+        "roles",
+        "permissions",
+        "authenticated",
+        "rate_limit_key",
+        "rate_limit_remaining",
+        "rate_limit_reset",
+        "attributes",
+    )
 
-    # Authentication/Authorization Context (populated by auth middleware)
-    user_id: str | None = None
-    session_id: str | None = None
-    roles: list[str] = field(default_factory=list)
-    permissions: list[str] = field(default_factory=list)
-    authenticated: bool = False
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        query_params: Mapping[str, str],
+        headers: Mapping[str, str],
+        client_ip: str,
+        user_agent: str,
+        correlation_id: str,
+        start_time: float | None = None,
+        route_match: RouteMatch | None = None,
+        user_id: str | None = None,
+        session_id: str | None = None,
+        roles: list[str] | None = None,
+        permissions: list[str] | None = None,
+        authenticated: bool = False,
+        rate_limit_key: str | None = None,
+        rate_limit_remaining: int | None = None,
+        rate_limit_reset: int | None = None,
+        attributes: dict[str, Any] | None = None,
+    ):
+        """Initialize the request context.
 
-    # Rate Limiting Context (populated by rate limiting middleware)
-    rate_limit_key: str | None = None
-    rate_limit_remaining: int | None = None
-    rate_limit_reset: int | None = None
+        Args:
+            method: HTTP method
+            path: Request path
+            query_params: Query parameters
+            headers: Request headers
+            client_ip: Client IP address
+            user_agent: Client user agent
+            correlation_id: Correlation ID
+            start_time: ``time.perf_counter()`` reading at request start (default: now)
+            route_match: Matched route
+            user_id: Authenticated user ID
+            session_id: Session ID
+            roles: User roles
+            permissions: User permissions
+            authenticated: Whether the request is authenticated
+            rate_limit_key: Rate limit key
+            rate_limit_remaining: Remaining requests in the rate limit window
+            rate_limit_reset: Rate limit window reset time
+            attributes: Custom attributes
+        """
+        # HTTP Request Data
+        self.method = method
+        self.path = path
+        # Read-only views of the request's multidicts, not copies
+        self.query_params = query_params
+        self.headers = headers
+        self.client_ip = client_ip
+        self.user_agent = user_agent
+
+        # Correlation and Timing
+        self.correlation_id = correlation_id
+        # time.perf_counter() reading, only meaningful relative to other readings
+        self.start_time = time.perf_counter() if start_time is None else start_time
+
+        # Route Information
+        self.route_match = route_match
+
+        # Authentication/Authorization Context (populated by auth middleware)
+        self.user_id = user_id
+        self.session_id = session_id
+        self.roles = [] if roles is None else roles
+        self.permissions = [] if permissions is None else permissions
+        self.authenticated = authenticated
+
+        # Rate Limiting Context (populated by rate limiting middleware)
+        self.rate_limit_key = rate_limit_key
+        self.rate_limit_remaining = rate_limit_remaining
+        self.rate_limit_reset = rate_limit_reset
+
+        # Custom attributes for middleware to attach data
+        self.attributes = {} if attributes is None else attributes
+
+    def elapsed_seconds(self) -> float:
+        """Calculate elapsed time since request start in seconds.
 
-    # Custom attributes for middleware to attach data
-    attributes: dict[str, Any] = field(default_factory=dict)
+        Returns:
+            Elapsed time in seconds
+        """
+        return time.perf_counter() - self.start_time
 
     def elapsed_ms(self) -> float:
         """Calculate elapsed time since request start in milliseconds.
@@ -73,7 +170,7 @@ class RequestContext:
         Returns:
             Elapsed time in milliseconds
         """
-        return (time.time() - self.start_time) * 1000
+        return (time.perf_counter() - self.start_time) * 1000
 
 
 # Type alias for middleware handler functions
@@ -113,6 +210,20 @@ class Middleware(ABC):
         """
         pass
 
+    def applies_to(self, route: RouteConfig) -> bool:
+        """Check whether this middleware has any work to do for a route.
+
+        Middleware that returns False is left out of the chain built for the
+        route, rather than being called only to pass the request on.
+
+        Args:
+            route: Matched route configuration
+
+        Returns:
+            True if the middleware should run for requests to the route
+        """
+        return True
+
     @property
     def name(self) -> str:
         """Get middleware name.
@@ -128,6 +239,14 @@ class MiddlewareChain:
 
     Middleware are executed in order, with each middleware having the opportunity
     to call the next handler or short-circuit the chain by returning a response.
+
+    The chain is composed into nested handlers once at construction time, so
+    executing a request does not rebuild any handlers. The composed coroutine
+    is exposed as ``handler`` for callers that want to invoke it directly.
+
+    ``handler_for`` returns a chain specialized for a route, containing only
+    the middleware that applies to it (e.g. no authentication for public
+    routes). Routes that need the same middleware share one composed chain.
     """
 
     def __init__(self, middlewares: list[Middleware]):
@@ -137,69 +256,88 @@ class MiddlewareChain:
             middlewares: List of middleware in execution order
         """
         self.middlewares = middlewares
+        self.handler = self._compose(middlewares)
+        # Route chains are keyed by id() since route configs are not hashable;
+        # the routes are owned by the gateway config and outlive the chain
+        self._route_handlers: dict[int, MiddlewareHandler] = {}
+        self._handlers_by_mask: dict[tuple[bool, ...], MiddlewareHandler] = {
+            (True,) * len(middlewares): self.handler
+        }
         logger.info(
             f"Middleware chain initialized with {len(middlewares)} middleware",
             extra={"middleware": [m.name for m in middlewares]},
         )
 
-    async def execute(self, request: web.Request, context: RequestContext) -> web.Response:
-        """Execute the middleware chain.
+    @staticmethod
+    def _compose(middlewares: list[Middleware]) -> MiddlewareHandler:
+        """Compose middleware into a single handler, from the tail inward.
 
         Args:
-            request: aiohttp Request object
-            context: Request context
+            middlewares: List of middleware in execution order
 
         Returns:
-            web.Response object
+            Handler that runs the whole chain
         """
 
-        # Build the chain from the end
-        async def build_handler(index: int) -> MiddlewareHandler:
-            """Build handler at given index.
+        async def end_handler(req: web.Request, ctx: RequestContext) -> web.Response:
+            # End of chain - should not reach here in normal flow
+            return web.Response(
+                status=500,
+                text=(
+                    '{"error": "internal_error", '
+                    '"message": "End of middleware chain reached without response"}'
+                ),
+                content_type="application/json",
+            )
 
-            Args:
-                index: Middleware index
+        def bind(middleware: Middleware, next_handler: MiddlewareHandler) -> MiddlewareHandler:
+            process = middleware.process
 
-            Returns:
-                Handler function
-            """
-            if index >= len(self.middlewares):
-                # End of chain - should not reach here in normal flow
-                async def end_handler(req: web.Request, ctx: RequestContext) -> web.Response:
-                    return web.Response(
-                        status=500,
-                        text=(
-                            '{"error": "internal_error", '
-                            '"message": "End of middleware chain reached without response"}'
-                        ),
-                        content_type="application/json",
-                    )
+            # A plain function returning process()'s coroutine, rather than a
+            # coroutine awaiting it, so each middleware costs one coroutine
+            # per request instead of two
+            def handler(req: web.Request, ctx: RequestContext) -> Awaitable[web.Response]:
+                return process(req, ctx, next_handler)
 
-                return end_handler
+            return handler
 
-            middleware = self.middlewares[index]
+        handler: MiddlewareHandler = end_handler
+        for middleware in reversed(middlewares):
+            handler = bind(middleware, handler)
+        return handler
 
-            async def handler(req: web.Request, ctx: RequestContext) -> web.Response:
-                """Handler for current middleware.
+    def handler_for(self, route: RouteConfig) -> MiddlewareHandler:
+        """Get the composed chain for a route.
 
-                Args:
-                    req: aiohttp Request object
-                    ctx: Request context
+        Args:
+            route: Matched route configuration
 
-                Returns:
-                    web.Response object
-                """
-                # Get the next handler
-                next_handler = await build_handler(index + 1)
+        Returns:
+            Handler that runs the middleware applying to the route
+        """
+        handler = self._route_handlers.get(id(route))
+        if handler is None:
+            mask = tuple(middleware.applies_to(route) for middleware in self.middlewares)
+            handler = self._handlers_by_mask.get(mask)
+            if handler is None:
+                handler = self._compose(
+                    [m for m, applies in zip(self.middlewares, mask, strict=True) if applies]
+                )
+                self._handlers_by_mask[mask] = handler
+            self._route_handlers[id(route)] = handler
+        return handler
 
-                # Execute current middleware
-                return await middleware.process(req, ctx, next_handler)
+    async def execute(self, request: web.Request, context: RequestContext) -> web.Response:
+        """Execute the middleware chain.
 
-            return handler
+        Args:
+            request: aiohttp Request object
+            context: Request context
 
-        # Start execution from first middleware
-        first_handler = await build_handler(0)
-        return await first_handler(request, context)
+        Returns:
+            web.Response object
+        """
+        return await self.handler(request, context)
 
 
 class RequestLoggingMiddleware(Middleware):
@@ -243,7 +381,8 @@ class ResponseLoggingMiddleware(Middleware):
     """Middleware for logging responses.
 
     Logs response metadata after request processing completes.
-    Should be placed at the end of the middleware chain.
+    Must wrap the middleware that produces responses (authentication, rate
+    limiting, proxy), since those do not pass requests on once they respond.
     """
 
     async def process(
@@ -261,6 +400,7 @@ class ResponseLoggingMiddleware(Middleware):
         """
         # Execute next middleware
         response = await next_handler(request, context)
+        elapsed_seconds = context.elapsed_seconds()
 
         # Get structured logger from app
         structured_logger = request.app.get(LOGGER_KEY)
@@ -285,7 +425,7 @@ class ResponseLoggingMiddleware(Middleware):
                 method=context.method,
                 path=context.path,
                 status_code=response.status,
-                latency_ms=context.elapsed_ms(),
+                latency_ms=elapsed_seconds * 1000,
                 user_id=context.user_id,
                 **extra_fields,
             )
@@ -297,7 +437,7 @@ class ResponseLoggingMiddleware(Middleware):
                 method=context.method,
                 path=context.path,
                 status_code=response.status,
-                duration_seconds=context.elapsed_ms() / 1000.0,
+                duration_seconds=elapsed_seconds,
             )
 
         return response
@@ -339,17 +479,37 @@ class ErrorHandlingMiddleware(Middleware):
             )
 
             # Return 500 error response with timestamp per design spec section 6.1
-            from datetime import UTC, datetime
-
-            return web.json_response(
+            body = orjson.dumps(
                 {
                     "error": "internal_error",
                     "message": "An unexpected error occurred",
                     "correlation_id": context.correlation_id,
-                    "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
-                },
-                status=500,
+                    "timestamp": utc_timestamp(),
+                }
             )
+            return web.Response(body=body, status=500, content_type="application/json")
+
+
+def resolve_correlation_id(request: web.Request) -> str:
+    """Get the client-supplied correlation ID, or generate a new one.
+
+    Args:
+        request: aiohttp Request object
+
+    Returns:
+        Correlation ID for the request
+    """
+    # Check if client provided correlation ID
+    correlation_id = None
+    header_name = request.app.get(CORRELATION_HEADER_KEY)
+    if header_name:
+        correlation_id = request.headers.get(header_name)
+
+    # Generate if not available
+    if not correlation_id:
+        correlation_id = generate_correlation_id()
+
+    return correlation_id
 
 
 def create_request_context(
@@ -366,15 +526,7 @@ def create_request_context(
     """
     # Generate correlation ID if not provided
     if not correlation_id:
-        # Check if client provided correlation ID
-        config = request.app.get(CONFIG_KEY)
-        if config:
-            header_name = config.logging.correlation_id_header
-            correlation_id = request.headers.get(header_name)
-
-        # Generate if still not available
-        if not correlation_id:
-            correlation_id = f"req-{uuid.uuid4().hex[:16]}"
+        correlation_id = resolve_correlation_id(request)
 
     # Extract client IP (handle proxies)
     client_ip = request.headers.get("X-Forwarded-For", "").split(",")[0].strip()
@@ -384,17 +536,13 @@ def create_request_context(
     # Get user agent
     user_agent = request.headers.get("User-Agent", "unknown")
 
-    # Build query params dict
-    query_params = dict(request.query)
-
-    # Build headers dict (convert to regular dict)
-    headers = dict(request.headers)
-
+    # Query params and headers reference the request's read-only multidicts
+    # rather than copying them, since middleware only looks up a few keys
     return RequestContext(
         method=request.method,
         path=request.path,
-        query_params=query_params,
-        headers=headers,
+        query_params=request.query,
+        headers=request.headers,
         client_ip=client_ip,
         user_agent=user_agent,
         correlation_id=correlation_id,
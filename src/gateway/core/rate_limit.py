@@ -7,15 +7,26 @@ This module implements:
 - Rate limiting evaluation logic (Task 18)
 """
 
+import asyncio
 import logging
+import math
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 import redis.asyncio as redis
+from redis.exceptions import NoScriptError
+
+if TYPE_CHECKING:
+    from redis.commands.core import AsyncScript
 
 logger = logging.getLogger(__name__)
 
+# Window boundaries are computed in integer nanoseconds from time.time_ns(),
+# so quantizing to a window never depends on float rounding
+_NS_PER_SECOND = 1_000_000_000
+
 
 @dataclass
 class RateLimitState:
@@ -27,6 +38,8 @@ class RateLimitState:
         limit: Total request limit
         reset_at: Unix timestamp when the limit resets
         retry_after: Seconds to wait before retrying (if denied)
+        next_allowed_at_ns: Unix time in nanoseconds before which the key is
+            certain to stay denied, if the algorithm can tell
     """
 
     allowed: bool
@@ -34,6 +47,7 @@ class RateLimitState:
     limit: int
     reset_at: int
     retry_after: int | None = None
+    next_allowed_at_ns: int | None = None
 
 
 class RateLimitAlgorithm(ABC):
@@ -66,15 +80,35 @@ class TokenBucketAlgorithm(RateLimitAlgorithm):
 
     Allows bursts of traffic up to the bucket capacity while enforcing
     a sustained rate over time.
+
+    Implemented as GCRA (generic cell rate algorithm): instead of a token
+    count and refill time, the store keeps one theoretical arrival time (TAT)
+    per key. Each admitted request pushes the TAT one emission interval
+    (window / limit) further out, and a request is admitted while the pushed
+    TAT stays within capacity intervals of now.
+
+    With local admission enabled, the last TAT seen for each key is kept in
+    process. A key whose bucket was last seen full (TAT already passed) is
+    admitted at once and the store is updated in the background. The store is
+    shared by all replicas, so if others drained the bucket meanwhile, each
+    replica can over-admit one request per key before it learns the real TAT.
     """
 
-    def __init__(self, store: "RateLimitStore"):
+    # Keys whose last seen TAT is remembered for local admission
+    MAX_LOCAL_KEYS = 10000
+
+    def __init__(self, store: "RateLimitStore", local_admission: bool = False):
         """Initialize token bucket algorithm.
 
         Args:
             store: Rate limiting state store
+            local_admission: Admit requests for keys last seen with a full
+                bucket without waiting for the store
         """
         self.store = store
+        self.local_admission = local_admission
+        self._local_tats: dict[str, float] = {}
+        self._write_backs: set[asyncio.Task[None]] = set()
 
     async def check_limit(
         self,
@@ -95,58 +129,91 @@ class TokenBucketAlgorithm(RateLimitAlgorithm):
             RateLimitState with decision
         """
         bucket_capacity = burst if burst else limit
-        refill_rate = limit / window  # Tokens per second
+        emission_interval = window / limit  # Seconds per token
+        tolerance = emission_interval * bucket_capacity
 
         now = time.time()
 
-        # Get current bucket state
-        bucket_state = await self.store.get_bucket_state(key)
-
-        tokens: float
-        last_refill: float
-        if bucket_state is None:
-            # First request - initialize bucket
-            tokens = float(bucket_capacity - 1)  # Consume one token
-            last_refill = now
-        else:
-            tokens, last_refill = bucket_state
-
-            # Calculate tokens to add based on time elapsed
-            time_elapsed = now - last_refill
-            tokens_to_add = time_elapsed * refill_rate
-            tokens = min(float(bucket_capacity), tokens + tokens_to_add)
-
-            # Try to consume a token
-            if tokens >= 1:
-                tokens -= 1
-            else:
-                # No tokens available - rate limit exceeded
-                retry_after = int((1 - tokens) / refill_rate) + 1
-                reset_at = int(last_refill + window)
-
+        if self.local_admission:
+            local_tat = self._local_tats.get(key)
+            if local_tat is not None and local_tat <= now:
+                # The bucket was full when last seen; admit now and let the
+                # store catch up in the background
+                tat = now + emission_interval
+                self._local_tats[key] = tat
+                task = asyncio.create_task(self._write_back(key, emission_interval, tolerance, now))
+                self._write_backs.add(task)
+                task.add_done_callback(self._write_backs.discard)
                 return RateLimitState(
-                    allowed=False,
-                    remaining=0,
+                    allowed=True,
+                    remaining=bucket_capacity - 1,
                     limit=limit,
-                    reset_at=reset_at,
-                    retry_after=retry_after,
+                    reset_at=math.ceil(tat),
                 )
 
-            last_refill = now
+        # Advance the theoretical arrival time in one store call
+        allowed, tat = await self.store.advance_tat(key, emission_interval, tolerance, now)
+        if self.local_admission:
+            self._remember_tat(key, tat)
+
+        # The bucket is full again once the TAT has passed
+        reset_at = math.ceil(tat)
+
+        if not allowed:
+            # No tokens available - rate limit exceeded
+            next_allowed_at = tat + emission_interval - tolerance
+            retry_after = int(next_allowed_at - now) + 1
 
-        # Update bucket state
-        await self.store.set_bucket_state(key, tokens, last_refill, window)
+            return RateLimitState(
+                allowed=False,
+                remaining=0,
+                limit=limit,
+                reset_at=reset_at,
+                retry_after=retry_after,
+                next_allowed_at_ns=int(next_allowed_at * _NS_PER_SECOND),
+            )
 
-        # Calculate reset time
-        reset_at = int(now + window)
+        # Tokens left are the intervals still free below the tolerance; the
+        # epsilon keeps float error from rounding a whole token down
+        remaining = int((tolerance - (tat - now)) / emission_interval + 1e-9)
 
         return RateLimitState(
             allowed=True,
-            remaining=int(tokens),
+            remaining=max(0, remaining),
             limit=limit,
             reset_at=reset_at,
         )
 
+    async def _write_back(
+        self, key: str, emission_interval: float, tolerance: float, now: float
+    ) -> None:
+        """Record a locally admitted request in the store.
+
+        Args:
+            key: Rate limit key
+            emission_interval: Seconds each admitted request adds to the TAT
+            tolerance: Furthest the new TAT may be ahead of now
+            now: Time the request was admitted
+        """
+        try:
+            _, tat = await self.store.advance_tat(key, emission_interval, tolerance, now)
+        except Exception as e:
+            logger.warning(f"Failed to write back locally admitted request for {key}: {e}")
+            return
+        self._remember_tat(key, tat)
+
+    def _remember_tat(self, key: str, tat: float) -> None:
+        """Remember the latest TAT the store reported for a key.
+
+        Args:
+            key: Rate limit key
+            tat: Theoretical arrival time
+        """
+        if key not in self._local_tats and len(self._local_tats) >= self.MAX_LOCAL_KEYS:
+            # Evict the oldest entry to bound memory
+            del self._local_tats[next(iter(self._local_tats))]
+        self._local_tats[key] = tat
+
 
 class FixedWindowAlgorithm(RateLimitAlgorithm):
     """Fixed window rate limiting algorithm.
@@ -181,19 +248,20 @@ class FixedWindowAlgorithm(RateLimitAlgorithm):
         Returns:
             RateLimitState with decision
         """
-        now = time.time()
-
-        # Calculate current window start
-        window_start = int(now / window) * window
-
-        # Get current count for this window
-        count = await self.store.get_window_count(key, window_start)
+        # Calculate current window start and the time elapsed within it
+        window_ns = window * _NS_PER_SECOND
+        window_index, elapsed_ns = divmod(time.time_ns(), window_ns)
+        window_start = window_index * window
+
+        # Check and increment the counter for this window in one store call
+        new_count, allowed = await self.store.check_and_increment_window_count(
+            key, window_start, window, limit
+        )
 
-        # Check if limit exceeded
-        if count >= limit:
+        if not allowed:
             # Rate limit exceeded
             reset_at = window_start + window
-            retry_after = int(reset_at - now)
+            retry_after = (window_ns - elapsed_ns) // _NS_PER_SECOND
 
             return RateLimitState(
                 allowed=False,
@@ -201,11 +269,9 @@ class FixedWindowAlgorithm(RateLimitAlgorithm):
                 limit=limit,
                 reset_at=reset_at,
                 retry_after=retry_after,
+                next_allowed_at_ns=(window_index + 1) * window_ns,
             )
 
-        # Increment counter
-        new_count = await self.store.increment_window_count(key, window_start, window)
-
         reset_at = window_start + window
         remaining = max(0, limit - new_count)
 
@@ -250,29 +316,25 @@ class SlidingWindowAlgorithm(RateLimitAlgorithm):
         Returns:
             RateLimitState with decision
         """
-        now = time.time()
-
-        # Calculate current and previous window starts
-        current_window_start = int(now / window) * window
-        previous_window_start = current_window_start - window
-
-        # Get counts for both windows
-        current_count = await self.store.get_window_count(key, current_window_start)
-        previous_count = await self.store.get_window_count(key, previous_window_start)
-
-        # Calculate weighted count
-        # Weight is based on how far into the current window we are
-        time_in_window = now - current_window_start
-        window_progress = time_in_window / window
-
-        # Weighted count = previous_count * (1 - progress) + current_count
-        weighted_count = previous_count * (1 - window_progress) + current_count
+        # Calculate current window start and the time elapsed within it
+        window_ns = window * _NS_PER_SECOND
+        window_index, elapsed_ns = divmod(time.time_ns(), window_ns)
+        current_window_start = window_index * window
+
+        # The previous window's count is weighted by how much of it still
+        # overlaps the sliding window, i.e. 1 - progress into the current one
+        previous_weight = 1 - elapsed_ns / window_ns
+
+        # Check and increment the current window counter in one store call
+        result = await self.store.check_and_increment_sliding_window_count(
+            key, current_window_start, window, limit, previous_weight
+        )
+        previous_count, current_count, allowed = result
 
-        # Check if limit exceeded
-        if weighted_count >= limit:
+        if not allowed:
             # Rate limit exceeded
             reset_at = current_window_start + window
-            retry_after = int(reset_at - now)
+            retry_after = (window_ns - elapsed_ns) // _NS_PER_SECOND
 
             return RateLimitState(
                 allowed=False,
@@ -282,13 +344,8 @@ class SlidingWindowAlgorithm(RateLimitAlgorithm):
                 retry_after=retry_after,
             )
 
-        # Increment current window counter
-        new_current_count = await self.store.increment_window_count(
-            key, current_window_start, window
-        )
-
-        # Recalculate weighted count after increment
-        weighted_count = previous_count * (1 - window_progress) + new_current_count
+        # Weighted count = previous_count * (1 - progress) + current_count
+        weighted_count = previous_count * previous_weight + current_count
         remaining = max(0, int(limit - weighted_count))
 
         reset_at = current_window_start + window
@@ -324,25 +381,24 @@ class RateLimitStore(ABC):
         pass
 
     @abstractmethod
-    async def get_bucket_state(self, key: str) -> tuple[float, float] | None:
-        """Get token bucket state.
+    async def get_tat(self, key: str) -> float | None:
+        """Get token bucket theoretical arrival time.
 
         Args:
             key: Rate limit key
 
         Returns:
-            Tuple of (tokens, last_refill_time) or None if not found
+            Theoretical arrival time as a Unix timestamp, or None if not found
         """
         pass
 
     @abstractmethod
-    async def set_bucket_state(self, key: str, tokens: float, last_refill: float, ttl: int) -> None:
-        """Set token bucket state.
+    async def set_tat(self, key: str, tat: float, ttl: int) -> None:
+        """Set token bucket theoretical arrival time.
 
         Args:
             key: Rate limit key
-            tokens: Current token count
-            last_refill: Last refill timestamp
+            tat: Theoretical arrival time as a Unix timestamp
             ttl: Time-to-live in seconds
         """
         pass
@@ -376,34 +432,216 @@ class RateLimitStore(ABC):
         """
         pass
 
+    async def advance_tat(
+        self, key: str, emission_interval: float, tolerance: float, now: float
+    ) -> tuple[bool, float]:
+        """Admit a token bucket request by advancing its theoretical arrival time.
+
+        Stores should override this with a single atomic operation. The
+        default composes get_tat and set_tat.
+
+        Args:
+            key: Rate limit key
+            emission_interval: Seconds each admitted request adds to the TAT
+            tolerance: Furthest the new TAT may be ahead of now
+            now: Current Unix timestamp
+
+        Returns:
+            Tuple of (allowed, tat). When allowed, tat is the advanced TAT;
+            otherwise it is the current one, which is at least now.
+        """
+        tat = max(await self.get_tat(key) or now, now)
+        new_tat = tat + emission_interval
+        if new_tat - now > tolerance:
+            return False, tat
+
+        # The state is only needed until the bucket is full again
+        await self.set_tat(key, new_tat, math.ceil(new_tat - now))
+        return True, new_tat
+
+    async def check_and_increment_window_count(
+        self, key: str, window_start: int, window_duration: int, limit: int
+    ) -> tuple[int, bool]:
+        """Increment the window count unless the limit is already reached.
+
+        Stores should override this with a single atomic operation. The
+        default composes get_window_count and increment_window_count.
+
+        Args:
+            key: Rate limit key
+            window_start: Window start timestamp
+            window_duration: Window duration in seconds
+            limit: Request limit for the window
+
+        Returns:
+            Tuple of (count, allowed). When allowed, count is the new count
+            after the increment; otherwise it is the unchanged current count.
+        """
+        count = await self.get_window_count(key, window_start)
+        if count >= limit:
+            return count, False
+        return await self.increment_window_count(key, window_start, window_duration), True
+
+    async def check_and_increment_sliding_window_count(
+        self,
+        key: str,
+        window_start: int,
+        window_duration: int,
+        limit: int,
+        previous_weight: float,
+    ) -> tuple[int, int, bool]:
+        """Increment the current window count unless the sliding limit is reached.
+
+        The sliding count is the previous window's count times
+        ``previous_weight`` plus the current window's count. Stores should
+        override this with a single atomic operation. The default composes
+        get_window_count and increment_window_count.
+
+        Args:
+            key: Rate limit key
+            window_start: Current window start timestamp
+            window_duration: Window duration in seconds
+            limit: Request limit for the sliding window
+            previous_weight: Weight of the previous window's count
+
+        Returns:
+            Tuple of (previous count, current count, allowed). When allowed,
+            the current count is the new count after the increment.
+        """
+        current_count = await self.get_window_count(key, window_start)
+        previous_count = await self.get_window_count(key, window_start - window_duration)
+        if previous_count * previous_weight + current_count >= limit:
+            return previous_count, current_count, False
+        current_count = await self.increment_window_count(key, window_start, window_duration)
+        return previous_count, current_count, True
+
+
+# Increments a window counter, only setting its TTL when the counter is created.
+# KEYS[1] = window key, ARGV[1] = TTL in seconds
+_INCREMENT_WINDOW_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return count
+"""
+
+
+# Checks the fixed-window counter against the limit and increments it in one
+# round-trip. The TTL is only set when the counter is created.
+# KEYS[1] = window key, ARGV[1] = limit, ARGV[2] = TTL in seconds
+_FIXED_WINDOW_SCRIPT = """
+local count = tonumber(redis.call('GET', KEYS[1]) or '0')
+if count >= tonumber(ARGV[1]) then
+    return {count, 0}
+end
+count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return {count, 1}
+"""
+
+
+# Checks the sliding-window count against the limit and increments the current
+# window's counter in one round-trip. The TTL is only set when the counter is
+# created, and covers the next window, which reads this one as its previous.
+# KEYS[1] = previous window key, KEYS[2] = current window key,
+# ARGV[1] = limit, ARGV[2] = previous window weight, ARGV[3] = TTL in seconds
+_SLIDING_WINDOW_SCRIPT = """
+local previous = tonumber(redis.call('GET', KEYS[1]) or '0')
+local current = tonumber(redis.call('GET', KEYS[2]) or '0')
+if previous * tonumber(ARGV[2]) + current >= tonumber(ARGV[1]) then
+    return {previous, current, 0}
+end
+current = redis.call('INCR', KEYS[2])
+if current == 1 then
+    redis.call('EXPIRE', KEYS[2], ARGV[3])
+end
+return {previous, current, 1}
+"""
+
+
+# Advances a token bucket's theoretical arrival time (GCRA) in one round-trip.
+# The TAT is returned as a string, since Redis truncates Lua numbers to
+# integers, and only lives until the bucket is full again.
+# KEYS[1] = TAT key, ARGV[1] = emission interval, ARGV[2] = tolerance,
+# ARGV[3] = current time
+_TOKEN_BUCKET_SCRIPT = """
+local now = tonumber(ARGV[3])
+local tat = math.max(tonumber(redis.call('GET', KEYS[1]) or '0'), now)
+local new_tat = tat + tonumber(ARGV[1])
+if new_tat - now > tonumber(ARGV[2]) then
+    return {0, string.format('%.6f', tat)}
+end
+redis.call('SET', KEYS[1], string.format('%.6f', new_tat), 'PX', math.ceil((new_tat - now) * 1000))
+return {1, string.format('%.6f', new_tat)}
+"""
+
 
 class RedisRateLimitStore(RateLimitStore):
     """Redis-based rate limiting state store."""
 
-    def __init__(self, redis_url: str, key_prefix: str = "ratelimit:"):
+    def __init__(self, redis_url: str, key_prefix: str = "ratelimit:", max_connections: int = 64):
         """Initialize Redis rate limit store.
 
         Args:
             redis_url: Redis connection URL
             key_prefix: Prefix for rate limit keys
+            max_connections: Maximum pooled connections; callers wait for a free one
         """
         self.redis_url = redis_url
         self.key_prefix = key_prefix
+        self.max_connections = max_connections
         self.client: redis.Redis | None = None
+        self._increment_window_script: AsyncScript | None = None
+        self._fixed_window_script: AsyncScript | None = None
+        self._token_bucket_script: AsyncScript | None = None
+        self._sliding_window_script: AsyncScript | None = None
+
+        # Pending pipelined script calls: (script, keys, args, future)
+        self._pending_scripts: list[
+            tuple[AsyncScript, list[str], list[Any], asyncio.Future[Any]]
+        ] = []
+        self._flush_handle: asyncio.Handle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
 
     async def connect(self) -> None:
         """Connect to Redis."""
         if self.client is None:
-            self.client = await redis.from_url(
-                self.redis_url, encoding="utf-8", decode_responses=True
+            # A bounded, blocking pool queues bursts instead of opening a
+            # connection per concurrent command
+            pool = redis.BlockingConnectionPool.from_url(
+                self.redis_url,
+                max_connections=self.max_connections,
+                encoding="utf-8",
+                decode_responses=True,
             )
+            self.client = redis.Redis.from_pool(pool)
+            # Scripts run via EVALSHA, falling back to EVAL if not yet cached
+            self._increment_window_script = self.client.register_script(_INCREMENT_WINDOW_SCRIPT)
+            self._fixed_window_script = self.client.register_script(_FIXED_WINDOW_SCRIPT)
+            self._token_bucket_script = self.client.register_script(_TOKEN_BUCKET_SCRIPT)
+            self._sliding_window_script = self.client.register_script(_SLIDING_WINDOW_SCRIPT)
             logger.info(f"Connected to Redis rate limit store at {self.redis_url}")
 
     async def disconnect(self) -> None:
         """Disconnect from Redis."""
+        # Send any script calls still waiting to be pipelined
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._pending_scripts:
+            pending, self._pending_scripts = self._pending_scripts, []
+            await self._flush_scripts(pending)
+
         if self.client:
             await self.client.close()
             self.client = None
+            self._increment_window_script = None
+            self._fixed_window_script = None
+            self._token_bucket_script = None
+            self._sliding_window_script = None
             logger.info("Disconnected from Redis rate limit store")
 
     async def is_healthy(self) -> bool:
@@ -423,6 +661,89 @@ class RedisRateLimitStore(RateLimitStore):
         except Exception:
             return False
 
+    async def _run_script(self, script: "AsyncScript", keys: list[str], args: list[Any]) -> Any:
+        """Run a Lua script, pipelined with other script calls made concurrently.
+
+        Script calls issued in the same event loop iteration, such as the
+        rules of one request, which the rate limiting middleware evaluates
+        concurrently, are sent in a single pipeline, so they cost one
+        round-trip in total.
+
+        Args:
+            script: Registered script
+            keys: Script keys
+            args: Script arguments
+
+        Returns:
+            Script result
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        self._pending_scripts.append((script, keys, args, future))
+
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_soon(self._start_script_flush)
+
+        return await future
+
+    def _start_script_flush(self) -> None:
+        """Dispatch all pending script calls as one pipeline."""
+        self._flush_handle = None
+        pending, self._pending_scripts = self._pending_scripts, []
+        if not pending:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._flush_scripts(pending))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_scripts(
+        self, pending: list[tuple["AsyncScript", list[str], list[Any], asyncio.Future[Any]]]
+    ) -> None:
+        """Run a batch of pending script calls and resolve their waiters.
+
+        Args:
+            pending: Pending (script, keys, args, future) script calls
+        """
+        results: list[Any]
+        try:
+            if not self.client:
+                raise RuntimeError("Rate limit store not connected")
+
+            if len(pending) == 1:
+                script, keys, args, _ = pending[0]
+                results = [await script(keys=keys, args=args)]
+            else:
+                # EVALSHA directly, since pipelining the script objects would
+                # check that they are loaded with SCRIPT EXISTS on every batch
+                async with self.client.pipeline(transaction=False) as pipe:
+                    for script, keys, args, _ in pending:
+                        pipe.evalsha(script.sha, len(keys), *keys, *args)
+                    results = await pipe.execute(raise_on_error=False)
+
+                # Scripts the server has not cached yet (e.g. after a restart)
+                # are retried through the script object, which loads them
+                for i, result in enumerate(results):
+                    if isinstance(result, NoScriptError):
+                        script, keys, args, _ = pending[i]
+                        try:
+                            results[i] = await script(keys=keys, args=args)
+                        except Exception as e:
+                            results[i] = e
+        except Exception as e:
+            for *_, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (*_, future), result in zip(pending, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
     def _make_key(self, key: str) -> str:
         """Generate Redis key with prefix.
 
@@ -434,16 +755,16 @@ class RedisRateLimitStore(RateLimitStore):
         """
         return f"{self.key_prefix}{key}"
 
-    def _bucket_key(self, key: str) -> str:
-        """Generate bucket state key.
+    def _tat_key(self, key: str) -> str:
+        """Generate token bucket TAT key.
 
         Args:
             key: Rate limit key
 
         Returns:
-            Bucket state key
+            TAT key
         """
-        return f"{self._make_key(key)}:bucket"
+        return f"{self._make_key(key)}:tat"
 
     def _window_key(self, key: str, window_start: int) -> str:
         """Generate window count key.
@@ -457,73 +778,80 @@ class RedisRateLimitStore(RateLimitStore):
         """
         return f"{self._make_key(key)}:window:{window_start}"
 
-    async def get_bucket_state(self, key: str) -> tuple[float, float] | None:
-        """Get token bucket state from Redis.
+    async def get_tat(self, key: str) -> float | None:
+        """Get token bucket theoretical arrival time from Redis.
 
         Args:
             key: Rate limit key
 
         Returns:
-            Tuple of (tokens, last_refill_time) or None
+            Theoretical arrival time or None
         """
         if not self.client:
             raise RuntimeError("Rate limit store not connected")
 
         try:
-            bucket_key = self._bucket_key(key)
-            hgetall_result = self.client.hgetall(bucket_key)
-            if hasattr(hgetall_result, "__await__"):
-                data = await hgetall_result
+            get_result = self.client.get(self._tat_key(key))
+            if hasattr(get_result, "__await__"):
+                value = await get_result
             else:
-                data = hgetall_result
+                value = get_result
 
-            if not data:
-                return None
-
-            tokens = float(data.get("tokens", 0))
-            last_refill = float(data.get("last_refill", 0))
-
-            return tokens, last_refill
+            return float(value) if value is not None else None
 
         except Exception as e:
             logger.error(f"Failed to get bucket state for {key}: {e}")
             return None
 
-    async def set_bucket_state(self, key: str, tokens: float, last_refill: float, ttl: int) -> None:
-        """Set token bucket state in Redis.
+    async def set_tat(self, key: str, tat: float, ttl: int) -> None:
+        """Set token bucket theoretical arrival time in Redis.
 
         Args:
             key: Rate limit key
-            tokens: Current token count
-            last_refill: Last refill timestamp
+            tat: Theoretical arrival time
             ttl: Time-to-live in seconds
         """
         if not self.client:
             raise RuntimeError("Rate limit store not connected")
 
         try:
-            bucket_key = self._bucket_key(key)
-
-            # Use pipeline for atomic operation
-            async with self.client.pipeline(transaction=True) as pipe:
-                hset_result = pipe.hset(
-                    bucket_key,
-                    mapping={
-                        "tokens": str(tokens),
-                        "last_refill": str(last_refill),
-                    },
-                )
-                if hasattr(hset_result, "__await__"):
-                    await hset_result
-                expire_result = pipe.expire(bucket_key, ttl * 2)  # TTL = 2x window for safety
-                if hasattr(expire_result, "__await__"):
-                    await expire_result
-                await pipe.execute()
+            set_result = self.client.set(self._tat_key(key), repr(tat), ex=ttl)
+            if hasattr(set_result, "__await__"):
+                await set_result
 
         except Exception as e:
             logger.error(f"Failed to set bucket state for {key}: {e}")
             raise
 
+    async def advance_tat(
+        self, key: str, emission_interval: float, tolerance: float, now: float
+    ) -> tuple[bool, float]:
+        """Advance a token bucket's theoretical arrival time with a Lua script.
+
+        Args:
+            key: Rate limit key
+            emission_interval: Seconds each admitted request adds to the TAT
+            tolerance: Furthest the new TAT may be ahead of now
+            now: Current Unix timestamp
+
+        Returns:
+            Tuple of (allowed, tat)
+        """
+        if not self.client or not self._token_bucket_script:
+            raise RuntimeError("Rate limit store not connected")
+
+        try:
+            allowed, tat = await self._run_script(
+                self._token_bucket_script,
+                [self._tat_key(key)],
+                [emission_interval, tolerance, now],
+            )
+            return bool(allowed), float(tat)
+
+        except Exception as e:
+            logger.error(f"Failed to consume bucket token for {key}: {e}")
+            raise
+
     async def get_window_count(self, key: str, window_start: int) -> int:
         """Get request count for a time window from Redis.
 
@@ -564,26 +892,88 @@ class RedisRateLimitStore(RateLimitStore):
         Returns:
             New count after increment
         """
-        if not self.client:
+        if not self.client or not self._increment_window_script:
             raise RuntimeError("Rate limit store not connected")
 
         try:
             window_key = self._window_key(key, window_start)
+            # TTL = 2x window, so the count outlives the window for sliding
+            # window checks that read it as the previous window
+            count = await self._increment_window_script(
+                keys=[window_key], args=[window_duration * 2]
+            )
+            return int(count)
+
+        except Exception as e:
+            logger.error(f"Failed to increment window count for {key}: {e}")
+            raise
+
+    async def check_and_increment_window_count(
+        self, key: str, window_start: int, window_duration: int, limit: int
+    ) -> tuple[int, bool]:
+        """Check and increment a window count atomically with a Lua script.
 
-            # Use pipeline for atomic increment and expiration
-            async with self.client.pipeline(transaction=True) as pipe:
-                incr_result = pipe.incr(window_key)
-                if hasattr(incr_result, "__await__"):
-                    await incr_result
-                expire_result = pipe.expire(window_key, window_duration * 2)  # TTL = 2x window
-                if hasattr(expire_result, "__await__"):
-                    await expire_result
-                results = await pipe.execute()
+        Args:
+            key: Rate limit key
+            window_start: Window start timestamp
+            window_duration: Window duration in seconds
+            limit: Request limit for the window
+
+        Returns:
+            Tuple of (count, allowed)
+        """
+        if not self.client or not self._fixed_window_script:
+            raise RuntimeError("Rate limit store not connected")
 
-            return int(results[0])
+        try:
+            window_key = self._window_key(key, window_start)
+            # The counter is created inside its window and only read while
+            # that window lasts, so a one-window TTL is enough
+            count, allowed = await self._run_script(
+                self._fixed_window_script, [window_key], [limit, window_duration]
+            )
+            return int(count), bool(allowed)
 
         except Exception as e:
-            logger.error(f"Failed to increment window count for {key}: {e}")
+            logger.error(f"Failed to check window count for {key}: {e}")
+            raise
+
+    async def check_and_increment_sliding_window_count(
+        self,
+        key: str,
+        window_start: int,
+        window_duration: int,
+        limit: int,
+        previous_weight: float,
+    ) -> tuple[int, int, bool]:
+        """Check and increment a sliding window count atomically with a Lua script.
+
+        Args:
+            key: Rate limit key
+            window_start: Current window start timestamp
+            window_duration: Window duration in seconds
+            limit: Request limit for the sliding window
+            previous_weight: Weight of the previous window's count
+
+        Returns:
+            Tuple of (previous count, current count, allowed)
+        """
+        if not self.client or not self._sliding_window_script:
+            raise RuntimeError("Rate limit store not connected")
+
+        try:
+            previous_count, current_count, allowed = await self._run_script(
+                self._sliding_window_script,
+                [
+                    self._window_key(key, window_start - window_duration),
+                    self._window_key(key, window_start),
+                ],
+                [limit, previous_weight, window_duration * 2],  # TTL = 2x window
+            )
+            return int(previous_count), int(current_count), bool(allowed)
+
+        except Exception as e:
+            logger.error(f"Failed to check sliding window count for {key}: {e}")
             raise
 
 
@@ -592,8 +982,8 @@ class InMemoryRateLimitStore(RateLimitStore):
 
     def __init__(self) -> None:
         """Initialize in-memory rate limit store."""
-        self.buckets: dict[str, tuple[float, float]] = {}
-        self.windows: dict[str, int] = {}
+        self.tats: dict[str, float] = {}
+        self.windows: dict[tuple[str, int], int] = {}
 
     async def connect(self) -> None:
         """Connect (no-op for in-memory store)."""
@@ -601,7 +991,7 @@ class InMemoryRateLimitStore(RateLimitStore):
 
     async def disconnect(self) -> None:
         """Disconnect (no-op for in-memory store)."""
-        self.buckets.clear()
+        self.tats.clear()
         self.windows.clear()
 
     async def is_healthy(self) -> bool:
@@ -612,27 +1002,26 @@ class InMemoryRateLimitStore(RateLimitStore):
         """
         return True
 
-    async def get_bucket_state(self, key: str) -> tuple[float, float] | None:
-        """Get token bucket state.
+    async def get_tat(self, key: str) -> float | None:
+        """Get token bucket theoretical arrival time.
 
         Args:
             key: Rate limit key
 
         Returns:
-            Tuple of (tokens, last_refill_time) or None
+            Theoretical arrival time or None
         """
-        return self.buckets.get(key)
+        return self.tats.get(key)
 
-    async def set_bucket_state(self, key: str, tokens: float, last_refill: float, ttl: int) -> None:
-        """Set token bucket state.
+    async def set_tat(self, key: str, tat: float, ttl: int) -> None:
+        """Set token bucket theoretical arrival time.
 
         Args:
             key: Rate limit key
-            tokens: Current token count
-            last_refill: Last refill timestamp
+            tat: Theoretical arrival time
             ttl: Time-to-live (ignored for in-memory)
         """
-        self.buckets[key] = (tokens, last_refill)
+        self.tats[key] = tat
 
     async def get_window_count(self, key: str, window_start: int) -> int:
         """Get request count for a time window.
@@ -644,8 +1033,7 @@ class InMemoryRateLimitStore(RateLimitStore):
         Returns:
             Request count
         """
-        window_key = f"{key}:{window_start}"
-        return self.windows.get(window_key, 0)
+        return self.windows.get((key, window_start), 0)
 
     async def increment_window_count(
         self, key: str, window_start: int, window_duration: int
@@ -660,8 +1048,84 @@ class InMemoryRateLimitStore(RateLimitStore):
         Returns:
             New count after increment
         """
-        window_key = f"{key}:{window_start}"
-        current = self.windows.get(window_key, 0)
-        new_count = current + 1
+        window_key = (key, window_start)
+        new_count = self.windows.get(window_key, 0) + 1
         self.windows[window_key] = new_count
         return new_count
+
+    # The combined operations below are overridden to work on the dicts
+    # directly. Nothing awaits in between, so each is atomic on the event loop
+    # without the per-step coroutines of the base class defaults.
+
+    async def advance_tat(
+        self, key: str, emission_interval: float, tolerance: float, now: float
+    ) -> tuple[bool, float]:
+        """Admit a token bucket request by advancing its theoretical arrival time.
+
+        Args:
+            key: Rate limit key
+            emission_interval: Seconds each admitted request adds to the TAT
+            tolerance: Furthest the new TAT may be ahead of now
+            now: Current Unix timestamp
+
+        Returns:
+            Tuple of (allowed, tat)
+        """
+        tat = max(self.tats.get(key, now), now)
+        new_tat = tat + emission_interval
+        if new_tat - now > tolerance:
+            return False, tat
+
+        self.tats[key] = new_tat
+        return True, new_tat
+
+    async def check_and_increment_window_count(
+        self, key: str, window_start: int, window_duration: int, limit: int
+    ) -> tuple[int, bool]:
+        """Increment the window count unless the limit is already reached.
+
+        Args:
+            key: Rate limit key
+            window_start: Window start timestamp
+            window_duration: Window duration (ignored for in-memory)
+            limit: Request limit for the window
+
+        Returns:
+            Tuple of (count, allowed)
+        """
+        window_key = (key, window_start)
+        count = self.windows.get(window_key, 0)
+        if count >= limit:
+            return count, False
+        count += 1
+        self.windows[window_key] = count
+        return count, True
+
+    async def check_and_increment_sliding_window_count(
+        self,
+        key: str,
+        window_start: int,
+        window_duration: int,
+        limit: int,
+        previous_weight: float,
+    ) -> tuple[int, int, bool]:
+        """Increment the current window count unless the sliding limit is reached.
+
+        Args:
+            key: Rate limit key
+            window_start: Current window start timestamp
+            window_duration: Window duration in seconds
+            limit: Request limit for the sliding window
+            previous_weight: Weight of the previous window's count
+
+        Returns:
+            Tuple of (previous count, current count, allowed)
+        """
+        window_key = (key, window_start)
+        current_count = self.windows.get(window_key, 0)
+        previous_count = self.windows.get((key, window_start - window_duration), 0)
+        if previous_count * previous_weight + current_count >= limit:
+            return previous_count, current_count, False
+        current_count += 1
+        self.windows[window_key] = current_count
+        return previous_count, current_count, True
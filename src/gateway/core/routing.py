@@ -7,6 +7,7 @@ This module implements the routing engine including:
 - Path parameter extraction
 """
 
+import functools
 import logging
 import re
 from dataclasses import dataclass
@@ -41,6 +42,10 @@ class PathMatcher:
         """
         self.pattern = pattern
         self.regex_pattern, self.param_names = self._compile_pattern(pattern)
+        # A pattern without parameters matches exactly one path
+        self.literal_path = (
+            None if self.param_names else "/" + "/".join(p for p in pattern.split("/") if p)
+        )
 
     def _compile_pattern(self, pattern: str) -> tuple[re.Pattern, list[str]]:
         """Compile path pattern into regex.
@@ -63,10 +68,14 @@ class PathMatcher:
                 continue
 
             # Check if this part is a parameter
-            param_match = re.match(r"^\{(\w+)\}$", part)
-            if param_match:
-                param_name = param_match.group(1)
-                param_names.append(param_name)
+            name = part[1:-1]
+            if (
+                part[:1] == "{"
+                and part[-1:] == "}"
+                and name
+                and all(c.isalnum() or c == "_" for c in name)
+            ):
+                param_names.append(name)
                 # Match any non-slash characters
                 regex_parts.append(r"([^/]+)")
             else:
@@ -88,6 +97,9 @@ class PathMatcher:
         Returns:
             Dictionary of extracted parameters if matched, None otherwise
         """
+        if self.literal_path is not None:
+            return {} if path == self.literal_path else None
+
         match = self.regex_pattern.match(path)
         if not match:
             return None
@@ -110,6 +122,9 @@ class Router:
     - Resolving route conflicts based on priority
     """
 
+    # Maximum number of (method, path) regex match results cached per router
+    MATCH_CACHE_SIZE = 4096
+
     def __init__(self, routes: list[RouteConfig]):
         """Initialize the router.
 
@@ -118,6 +133,20 @@ class Router:
         """
         self.routes = routes
         self._route_matchers: list[tuple[RouteConfig, PathMatcher]] = []
+        # Per-method combined regex plus a table mapping each route's outer
+        # group index to (route, path parameter names)
+        self._method_dispatch: dict[
+            str, tuple[re.Pattern[str], dict[int, tuple[RouteConfig, list[str]]]]
+        ] = {}
+        # Parameterless routes keyed by (HTTP method, normalized path), and
+        # the methods they allow per path
+        self._static_routes: dict[tuple[str, str], RouteConfig] = {}
+        self._static_methods: dict[str, set[str]] = {}
+        # Parameterized paths repeat (e.g. /users/42), so regex match results
+        # are memoized; the cache is bounded since paths are not
+        self._match_dynamic = functools.lru_cache(maxsize=self.MATCH_CACHE_SIZE)(
+            self._match_dynamic_uncached
+        )
         self._initialize_routes()
 
     def _initialize_routes(self) -> None:
@@ -150,12 +179,82 @@ class Router:
             return (-literal_segments, -len(pattern))
 
         self._route_matchers = sorted(route_matchers, key=route_priority)
+        self._method_dispatch = self._build_method_dispatch(self._route_matchers)
+        self._static_routes = self._build_static_routes(self._route_matchers)
+        self._static_methods = {}
+        for method, path in self._static_routes:
+            self._static_methods.setdefault(path, set()).add(method)
+        self._match_dynamic.cache_clear()
 
         logger.info(
             f"Initialized router with {len(self.routes)} routes",
             extra={"route_count": len(self.routes)},
         )
 
+    @staticmethod
+    def _build_method_dispatch(
+        route_matchers: list[tuple[RouteConfig, PathMatcher]],
+    ) -> dict[str, tuple[re.Pattern[str], dict[int, tuple[RouteConfig, list[str]]]]]:
+        """Combine route patterns into one alternation regex per HTTP method.
+
+        Alternatives keep route priority order, so the regex engine reports the
+        same route the linear scan would, in a single C-level match call.
+        Parameterless routes are left out, since the static route lookup
+        answers them before any regex runs.
+
+        Args:
+            route_matchers: Route matchers sorted by priority
+
+        Returns:
+            Mapping of HTTP method to (combined regex, group index -> route info)
+        """
+        by_method: dict[str, list[tuple[RouteConfig, PathMatcher]]] = {}
+        for route, matcher in route_matchers:
+            if not matcher.param_names:
+                continue
+            for method in dict.fromkeys(m.upper() for m in route.methods):
+                by_method.setdefault(method, []).append((route, matcher))
+
+        dispatch = {}
+        for method, matchers in by_method.items():
+            alternatives = []
+            groups: dict[int, tuple[RouteConfig, list[str]]] = {}
+            group_index = 1
+            for route, matcher in matchers:
+                # Strip the per-route ^...$ anchors; the combined pattern anchors once
+                alternatives.append(f"({matcher.regex_pattern.pattern[1:-1]})")
+                groups[group_index] = (route, matcher.param_names)
+                group_index += 1 + len(matcher.param_names)
+            combined = re.compile("^(?:" + "|".join(alternatives) + ")$")
+            dispatch[method] = (combined, groups)
+
+        return dispatch
+
+    def _build_static_routes(
+        self, route_matchers: list[tuple[RouteConfig, PathMatcher]]
+    ) -> dict[tuple[str, str], RouteConfig]:
+        """Index parameterless routes by method and path for O(1) lookup.
+
+        A parameterless route always outranks any parameterized route that
+        matches the same path, so a hit here is the route the regex would pick.
+
+        Args:
+            route_matchers: Route matchers sorted by priority
+
+        Returns:
+            Mapping of (HTTP method, normalized path) to route
+        """
+        static_routes: dict[tuple[str, str], RouteConfig] = {}
+        for route, matcher in route_matchers:
+            # literal_path collapses repeated slashes as the pattern regex does
+            path = matcher.literal_path
+            if path is None:
+                continue
+            for method in route.methods:
+                # Keep the first (highest priority) route for duplicate patterns
+                static_routes.setdefault((method.upper(), path), route)
+        return static_routes
+
     def match_route(self, path: str, method: str) -> RouteMatch | None:
         """Match a request to a route configuration.
 
@@ -166,25 +265,29 @@ class Router:
         Returns:
             RouteMatch if a matching route is found, None otherwise
         """
-        # Normalize path
+        # Normalize path and method once for both lookups below
         normalized_path = self._normalize_path(path)
-
-        # Try to match against each route in priority order
-        for route, matcher in self._route_matchers:
-            path_params = matcher.match(normalized_path)
-
-            # Path matched, now check HTTP method
-            if path_params is not None and method.upper() in [m.upper() for m in route.methods]:
-                logger.debug(
-                    f"Route matched: {route.id}",
-                    extra={
-                        "route_id": route.id,
-                        "path": normalized_path,
-                        "method": method,
-                        "params": path_params,
-                    },
-                )
-                return RouteMatch(route=route, path_params=path_params)
+        upper_method = method.upper()
+
+        # Exact paths resolve without running any regex
+        static_route = self._static_routes.get((upper_method, normalized_path))
+        if static_route is not None:
+            return RouteMatch(route=static_route, path_params={})
+
+        result = self._match_dynamic(upper_method, normalized_path)
+        if result is not None:
+            route, path_params = result
+            logger.debug(
+                f"Route matched: {route.id}",
+                extra={
+                    "route_id": route.id,
+                    "path": normalized_path,
+                    "method": method,
+                    "params": path_params,
+                },
+            )
+            # Copy the cached parameters so callers cannot alter the cache
+            return RouteMatch(route=route, path_params=dict(path_params))
 
         logger.debug(
             f"No route matched for {method} {path}",
@@ -192,6 +295,33 @@ class Router:
         )
         return None
 
+    def _match_dynamic_uncached(
+        self, method: str, normalized_path: str
+    ) -> tuple[RouteConfig, dict[str, str]] | None:
+        """Match a path against all routes allowing a method in one regex call.
+
+        Args:
+            method: Upper-case HTTP method
+            normalized_path: Normalized request path
+
+        Returns:
+            Tuple of (route, path parameters) if a route matches, None otherwise
+        """
+        dispatch = self._method_dispatch.get(method)
+        if dispatch is None:
+            return None
+
+        combined, groups = dispatch
+        match = combined.match(normalized_path)
+        if match is None:
+            return None
+
+        # The route's outer group closes last, so lastindex identifies it
+        group_index = match.lastindex or 0
+        route, param_names = groups[group_index]
+        path_params = {name: match.group(group_index + 1 + i) for i, name in enumerate(param_names)}
+        return route, path_params
+
     def _normalize_path(self, path: str) -> str:
         """Normalize URL path.
 
@@ -227,14 +357,16 @@ class Router:
             List of allowed HTTP methods
         """
         normalized_path = self._normalize_path(path)
-        allowed_methods = set()
-
-        for route, matcher in self._route_matchers:
-            path_params = matcher.match(normalized_path)
-            if path_params is not None:
-                allowed_methods.update(route.methods)
 
-        return sorted(allowed_methods)
+        # A method is allowed if any of its routes matches: parameterless
+        # routes by lookup, the rest by one combined regex call per method
+        methods = set(self._static_methods.get(normalized_path, ()))
+        methods.update(
+            method
+            for method, (combined, _) in self._method_dispatch.items()
+            if combined.match(normalized_path)
+        )
+        return sorted(methods)
 
 
 def create_router(routes: list[RouteConfig]) -> Router:
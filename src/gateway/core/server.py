@@ -8,6 +8,7 @@ This module implements the HTTP server foundation including:
 """
 
 import logging
+import os
 import ssl
 
 from aiohttp import web
@@ -22,9 +23,11 @@ logger = logging.getLogger(__name__)
 CONFIG_KEY = web.AppKey("config", GatewayConfig)
 LOGGER_KEY = web.AppKey("logger", GatewayLogger)
 METRICS_KEY = web.AppKey("metrics", GatewayMetrics)
+# Correlation ID header name, read on every request
+CORRELATION_HEADER_KEY = web.AppKey("correlation_header", str)
 
 # Export keys
-__all__ = ["HTTPServer", "CONFIG_KEY", "LOGGER_KEY", "METRICS_KEY"]
+__all__ = ["HTTPServer", "CONFIG_KEY", "LOGGER_KEY", "METRICS_KEY", "CORRELATION_HEADER_KEY"]
 
 
 class HTTPServer:
@@ -56,6 +59,9 @@ class HTTPServer:
         self.app: web.Application | None = None
         self._runner: web.AppRunner | None = None
         self._site: web.TCPSite | None = None
+        # SSL context reused across restarts until the certificate files change
+        self._ssl_context: ssl.SSLContext | None = None
+        self._ssl_context_key: tuple[str, str, str, float, float] | None = None
 
     def create_app(self) -> web.Application:
         """Create and configure the aiohttp application.
@@ -74,6 +80,7 @@ class HTTPServer:
         app[CONFIG_KEY] = self.config
         app[LOGGER_KEY] = self.structured_logger
         app[METRICS_KEY] = self.metrics
+        app[CORRELATION_HEADER_KEY] = self.config.logging.correlation_id_header
 
         # Setup lifecycle hooks
         app.on_startup.append(self._on_startup)
@@ -96,21 +103,39 @@ class HTTPServer:
             logger.warning("TLS enabled but certificate or key path not configured")
             return None
 
-        ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
-        ssl_context.load_cert_chain(
-            certfile=self.config.server.tls_cert_path,
-            keyfile=self.config.server.tls_key_path,
+        cert_path = self.config.server.tls_cert_path
+        key_path = self.config.server.tls_key_path
+        min_version = self.config.server.tls_min_version
+
+        # Loading the chain is the expensive part; keep the context (and with it
+        # the session ticket keys) until the files are replaced on disk
+        cache_key = (
+            cert_path,
+            key_path,
+            min_version,
+            os.stat(cert_path).st_mtime,
+            os.stat(key_path).st_mtime,
         )
+        if self._ssl_context is not None and self._ssl_context_key == cache_key:
+            return self._ssl_context
+
+        ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        ssl_context.load_cert_chain(certfile=cert_path, keyfile=key_path)
 
         # Configure TLS settings for security
-        ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
+        ssl_context.minimum_version = ssl.TLSVersion[min_version.replace(".", "_")]
         ssl_context.set_ciphers("HIGH:!aNULL:!MD5:!RC4")
+        # aiohttp serves HTTP/1.1 only, so that is the sole protocol advertised
+        ssl_context.set_alpn_protocols(["http/1.1"])
+
+        self._ssl_context = ssl_context
+        self._ssl_context_key = cache_key
 
         logger.info(
             "TLS enabled",
             extra={
-                "cert_path": self.config.server.tls_cert_path,
-                "min_version": "TLSv1.2",
+                "cert_path": cert_path,
+                "min_version": min_version,
             },
         )
 
@@ -142,12 +167,16 @@ class HTTPServer:
         )
         await self._runner.setup()
 
-        # Create and start site
+        # Create and start site. With reuse_port each worker process binds its
+        # own listen socket and the kernel spreads accepts across them; aiohttp
+        # already sets TCP_NODELAY on every accepted connection.
         self._site = web.TCPSite(
             self._runner,
             host=self.config.server.host,
             port=self.config.server.port,
             ssl_context=ssl_context,
+            backlog=self.config.server.backlog,
+            reuse_port=self.config.server.reuse_port,
         )
         await self._site.start()
 
@@ -159,6 +188,8 @@ class HTTPServer:
                 "port": self.config.server.port,
                 "tls_enabled": self.config.server.tls_enabled,
                 "max_connections": self.config.server.max_connections,
+                "backlog": self.config.server.backlog,
+                "reuse_port": self.config.server.reuse_port,
             },
         )
 
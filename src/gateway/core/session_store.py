@@ -7,14 +7,19 @@ This module provides:
 - Revocation list management
 """
 
-import contextlib
-import json
+import asyncio
+import copy
+import heapq
 import logging
+import socket
+import time
 from abc import ABC, abstractmethod
-from dataclasses import asdict, dataclass
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
+import orjson
 import redis.asyncio as redis
 
 logger = logging.getLogger(__name__)
@@ -71,12 +76,49 @@ class SessionData:
         Returns:
             Dictionary representation of session data
         """
-        data = asdict(self)
-        # Convert datetime objects to ISO format strings
-        data["created_at"] = self.created_at.isoformat()
-        data["last_accessed_at"] = self.last_accessed_at.isoformat()
-        data["expires_at"] = self.expires_at.isoformat()
-        return data
+        # Built field by field rather than with asdict(), which deep-copies
+        # every value recursively; shallow copies of the containers suffice
+        return {
+            "session_id": self.session_id,
+            "user_id": self.user_id,
+            "username": self.username,
+            "created_at": self.created_at.isoformat(),
+            "last_accessed_at": self.last_accessed_at.isoformat(),
+            "expires_at": self.expires_at.isoformat(),
+            "revoked": self.revoked,
+            "roles": list(self.roles) if self.roles is not None else None,
+            "permissions": list(self.permissions) if self.permissions is not None else None,
+            "ip_address": self.ip_address,
+            "device_fingerprint": self.device_fingerprint,
+            "metadata": dict(self.metadata) if self.metadata is not None else None,
+        }
+
+    def to_json(self) -> bytes:
+        """Serialize session data to JSON for storage.
+
+        Returns:
+            UTF-8 encoded JSON representation of session data
+        """
+        # orjson writes datetimes as ISO 8601 itself and copies nothing, so the
+        # fields are handed over as-is; from_dict reads the result back
+        return orjson.dumps(
+            {
+                "session_id": self.session_id,
+                "user_id": self.user_id,
+                "username": self.username,
+                "created_at": self.created_at,
+                "last_accessed_at": self.last_accessed_at,
+                "expires_at": self.expires_at,
+                "revoked": self.revoked,
+                "roles": self.roles,
+                "permissions": self.permissions,
+                "ip_address": self.ip_address,
+                "device_fingerprint": self.device_fingerprint,
+                "metadata": self.metadata,
+            },
+            # Metadata may use non-str keys, which json.dumps stringified too
+            option=orjson.OPT_NON_STR_KEYS,
+        )
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "SessionData":
@@ -202,27 +244,50 @@ class SessionStore(ABC):
         pass
 
 
+# TCP keepalive probes (idle, interval, count) that detect connections silently
+# dropped by NAT or firewalls long before the OS default of two hours
+_KEEPALIVE_OPTIONS = {
+    getattr(socket, name): value
+    for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+}
+
+
 class RedisSessionStore(SessionStore):
     """Redis-based session store implementation."""
 
-    def __init__(self, redis_url: str, key_prefix: str = "session:"):
+    # Seconds a pooled connection may sit idle before it is pinged on reuse
+    HEALTH_CHECK_INTERVAL = 30
+
+    def __init__(self, redis_url: str, key_prefix: str = "session:", max_connections: int = 64):
         """Initialize Redis session store.
 
         Args:
             redis_url: Redis connection URL
             key_prefix: Prefix for session keys
+            max_connections: Maximum pooled connections; callers wait for a free one
         """
         self.redis_url = redis_url
         self.key_prefix = key_prefix
+        self.max_connections = max_connections
         self.client: redis.Redis | None = None
         self.revocation_key_prefix = "revoked:"
 
     async def connect(self) -> None:
         """Connect to Redis."""
         if self.client is None:
-            self.client = await redis.from_url(
-                self.redis_url, encoding="utf-8", decode_responses=True
+            # Reuse a bounded set of kept-alive connections rather than
+            # reconnecting after bursts or after idle sockets were dropped
+            pool = redis.BlockingConnectionPool.from_url(
+                self.redis_url,
+                max_connections=self.max_connections,
+                encoding="utf-8",
+                decode_responses=True,
+                socket_keepalive=True,
+                socket_keepalive_options=_KEEPALIVE_OPTIONS,
+                health_check_interval=self.HEALTH_CHECK_INTERVAL,
             )
+            self.client = redis.Redis.from_pool(pool)
             logger.info(f"Connected to Redis session store at {self.redis_url}")
 
     async def disconnect(self) -> None:
@@ -286,19 +351,16 @@ class RedisSessionStore(SessionStore):
 
             # Store session data
             session_key = self._session_key(session_data.session_id)
-            session_json = json.dumps(session_data.to_dict())
-
-            # Set with expiration
-            await self.client.set(session_key, session_json, ex=ttl)
+            session_json = session_data.to_json()
 
-            # Add to user sessions set
+            # Store the session and add it to the user's sessions set in one
+            # round trip; the writes need no MULTI/EXEC isolation
             user_sessions_key = self._user_sessions_key(session_data.user_id)
-            result = self.client.sadd(user_sessions_key, session_data.session_id)
-            if hasattr(result, "__await__"):
-                await result
-            expire_result = self.client.expire(user_sessions_key, ttl)
-            if hasattr(expire_result, "__await__"):
-                await expire_result
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.set(session_key, session_json, ex=ttl)
+                pipe.sadd(user_sessions_key, session_data.session_id)
+                pipe.expire(user_sessions_key, ttl)
+                await pipe.execute()
 
             logger.debug(
                 f"Created session {session_data.session_id} for user {session_data.user_id}"
@@ -328,7 +390,7 @@ class RedisSessionStore(SessionStore):
             if not session_json:
                 return None
 
-            session_dict = json.loads(session_json)
+            session_dict = orjson.loads(session_json)
             session_data = SessionData.from_dict(session_dict)
 
             # Check if expired (shouldn't happen due to Redis TTL, but defensive check)
@@ -370,7 +432,7 @@ class RedisSessionStore(SessionStore):
                 return False
 
             # Update session data
-            session_json = json.dumps(session_data.to_dict())
+            session_json = session_data.to_json()
             await self.client.set(session_key, session_json, ex=ttl)
 
             logger.debug(f"Updated session {session_data.session_id}")
@@ -393,23 +455,18 @@ class RedisSessionStore(SessionStore):
             raise RuntimeError("Session store not connected")
 
         try:
-            # Get session to find user_id
-            session_data = await self.get(session_id)
-
-            # Delete session key
+            # Read the stored session to find user_id
             session_key = self._session_key(session_id)
-            await self.client.delete(session_key)
-
-            # Remove from user sessions set if we found the session
-            if session_data:
-                user_sessions_key = self._user_sessions_key(session_data.user_id)
-                srem_result = self.client.srem(user_sessions_key, session_id)
-                if hasattr(srem_result, "__await__"):
-                    await srem_result
+            session_json = await self.client.get(session_key)
 
-            # Delete revocation key if exists
-            revocation_key = self._revocation_key(session_id)
-            await self.client.delete(revocation_key)
+            # Delete the session and revocation keys, and remove the session
+            # from its user's set if it was found, in one round trip
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.delete(session_key, self._revocation_key(session_id))
+                if session_json:
+                    user_id = orjson.loads(session_json)["user_id"]
+                    pipe.srem(self._user_sessions_key(user_id), session_id)
+                await pipe.execute()
 
             logger.debug(f"Deleted session {session_id}")
             return True
@@ -440,13 +497,21 @@ class RedisSessionStore(SessionStore):
 
             # Mark session as revoked
             session_data.revoked = True
-            await self.update(session_data)
 
-            # Add to revocation set with TTL matching session expiration
             ttl = int((session_data.expires_at - datetime.now(UTC)).total_seconds())
-            if ttl > 0:
-                revocation_key = self._revocation_key(session_id)
-                await self.client.set(revocation_key, "1", ex=ttl)
+            if ttl <= 0:
+                await self.delete(session_id)
+            else:
+                # Write the session back and add the revocation key, with TTL
+                # matching session expiration, in one round trip
+                async with self.client.pipeline(transaction=False) as pipe:
+                    pipe.set(
+                        self._session_key(session_id),
+                        session_data.to_json(),
+                        ex=ttl,
+                    )
+                    pipe.set(self._revocation_key(session_id), "1", ex=ttl)
+                    await pipe.execute()
 
             logger.info(f"Revoked session {session_id}")
             return True
@@ -476,11 +541,41 @@ class RedisSessionStore(SessionStore):
             else:
                 session_ids = smembers_result
 
+            if not session_ids:
+                logger.info(f"Revoked 0 sessions for user {user_id}")
+                return 0
+
+            # Read all of the user's sessions in one round trip
+            member_ids = [str(session_id) for session_id in session_ids]
+            session_jsons = await self.client.mget(
+                [self._session_key(session_id) for session_id in member_ids]
+            )
+
+            now = datetime.now(UTC)
             count = 0
-            for session_id in session_ids:
-                if await self.revoke(session_id):
+            async with self.client.pipeline(transaction=False) as pipe:
+                for session_id, session_json in zip(member_ids, session_jsons, strict=True):
+                    if not session_json:
+                        continue
+
+                    session_data = SessionData.from_dict(orjson.loads(session_json))
+                    ttl = int((session_data.expires_at - now).total_seconds())
+                    if ttl <= 0:
+                        continue
+
+                    # Write back the revoked session and its revocation key
+                    session_data.revoked = True
+                    pipe.set(
+                        self._session_key(session_id),
+                        session_data.to_json(),
+                        ex=ttl,
+                    )
+                    pipe.set(self._revocation_key(session_id), "1", ex=ttl)
                     count += 1
 
+                if count:
+                    await pipe.execute()
+
             logger.info(f"Revoked {count} sessions for user {user_id}")
             return count
 
@@ -501,16 +596,10 @@ class RedisSessionStore(SessionStore):
             raise RuntimeError("Session store not connected")
 
         try:
-            # Check revocation key
+            # Every revocation writes the revocation key for the session's
+            # remaining lifetime, so its existence alone answers this
             revocation_key = self._revocation_key(session_id)
-            exists = await self.client.exists(revocation_key)
-
-            if exists:
-                return True
-
-            # Also check session data
-            session_data = await self.get(session_id)
-            return session_data.revoked if session_data else False
+            return bool(await self.client.exists(revocation_key))
 
         except Exception as e:
             logger.error(f"Failed to check revocation status for session {session_id}: {e}")
@@ -529,14 +618,196 @@ class RedisSessionStore(SessionStore):
         return 0
 
 
+class CachedSessionStore(SessionStore):
+    """Session store that keeps recently read sessions in process memory.
+
+    Wraps another store (typically Redis) with a small LRU cache with a short
+    TTL, so repeated lookups of the same session within that window skip the
+    network round-trip. Concurrent misses for the same session share a single
+    backend read. Writes through this store invalidate the cached entry;
+    changes made by other gateway instances become visible after the TTL.
+    """
+
+    def __init__(self, backend: SessionStore, max_size: int = 4096, ttl: float = 1.0):
+        """Initialize the cached session store.
+
+        Args:
+            backend: Session store to read through to
+            max_size: Maximum number of cached sessions
+            ttl: Seconds a cached session is served without re-reading it
+        """
+        self.backend = backend
+        self.max_size = max_size
+        self.ttl = ttl
+        self._cache: OrderedDict[str, tuple[float, SessionData]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[SessionData | None]] = {}
+
+    async def connect(self) -> None:
+        """Connect the backend store."""
+        await self.backend.connect()
+
+    async def disconnect(self) -> None:
+        """Disconnect the backend store and drop cached sessions."""
+        self._cache.clear()
+        await self.backend.disconnect()
+
+    def _invalidate(self, session_id: str) -> None:
+        """Drop a session from the cache.
+
+        Args:
+            session_id: Session identifier
+        """
+        self._cache.pop(session_id, None)
+
+    async def create(self, session_data: SessionData) -> bool:
+        """Create a new session in the backend store.
+
+        Args:
+            session_data: Session data to store
+
+        Returns:
+            True if created successfully, False otherwise
+        """
+        self._invalidate(session_data.session_id)
+        return await self.backend.create(session_data)
+
+    async def get(self, session_id: str) -> SessionData | None:
+        """Retrieve session, serving it from the cache when fresh.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            SessionData if found, None otherwise
+        """
+        cached = self._cache.get(session_id)
+        if cached is not None:
+            cached_at, cached_session = cached
+            if time.monotonic() - cached_at < self.ttl and not cached_session.is_expired():
+                self._cache.move_to_end(session_id)
+                # Callers may mutate the session; never hand out the cached object
+                return copy.copy(cached_session)
+            del self._cache[session_id]
+
+        # Coalesce concurrent misses for the same session into one backend read
+        inflight = self._inflight.get(session_id)
+        if inflight is not None:
+            shared = await asyncio.shield(inflight)
+            return copy.copy(shared) if shared else None
+
+        future: asyncio.Future[SessionData | None] = asyncio.get_running_loop().create_future()
+        self._inflight[session_id] = future
+        try:
+            session_data = await self.backend.get(session_id)
+            future.set_result(session_data)
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved in case no other caller was waiting
+            future.exception()
+            raise
+        finally:
+            del self._inflight[session_id]
+            if not future.done():
+                # Cancelled while reading; waiting callers are cancelled too
+                future.cancel()
+
+        if session_data is None:
+            return None
+
+        self._cache[session_id] = (time.monotonic(), session_data)
+        self._cache.move_to_end(session_id)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return copy.copy(session_data)
+
+    async def update(self, session_data: SessionData) -> bool:
+        """Update session in the backend store.
+
+        Args:
+            session_data: Session data to update
+
+        Returns:
+            True if updated successfully, False otherwise
+        """
+        self._invalidate(session_data.session_id)
+        return await self.backend.update(session_data)
+
+    async def delete(self, session_id: str) -> bool:
+        """Delete session from the backend store.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            True if deleted successfully, False otherwise
+        """
+        self._invalidate(session_id)
+        return await self.backend.delete(session_id)
+
+    async def revoke(self, session_id: str) -> bool:
+        """Revoke session in the backend store.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            True if revoked successfully, False otherwise
+        """
+        self._invalidate(session_id)
+        return await self.backend.revoke(session_id)
+
+    async def revoke_all_user_sessions(self, user_id: str) -> int:
+        """Revoke all sessions for a user in the backend store.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Number of sessions revoked
+        """
+        for session_id in [
+            session_id
+            for session_id, (_, session_data) in self._cache.items()
+            if session_data.user_id == user_id
+        ]:
+            del self._cache[session_id]
+        return await self.backend.revoke_all_user_sessions(user_id)
+
+    async def is_revoked(self, session_id: str) -> bool:
+        """Check if a session is revoked in the backend store.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            True if revoked, False otherwise
+        """
+        return await self.backend.is_revoked(session_id)
+
+    async def cleanup_expired(self) -> int:
+        """Clean up expired sessions in the backend store.
+
+        Returns:
+            Number of sessions cleaned up
+        """
+        return await self.backend.cleanup_expired()
+
+
 class InMemorySessionStore(SessionStore):
     """In-memory session store for testing and development."""
 
     def __init__(self) -> None:
         """Initialize in-memory session store."""
         self.sessions: dict[str, SessionData] = {}
-        self.user_sessions: dict[str, list[str]] = {}
+        self.user_sessions: dict[str, set[str]] = {}
         self.revoked: set[str] = set()
+        # Min-heap of (expires_at, session_id) so cleanup only visits sessions
+        # that are due; entries of deleted or extended sessions are settled
+        # lazily when they come up
+        self._expiry_heap: list[tuple[datetime, str]] = []
+        # Expiry each live session is currently queued under, which is never
+        # later than its real expiry
+        self._queued_expiry: dict[str, datetime] = {}
 
     async def connect(self) -> None:
         """Connect (no-op for in-memory store)."""
@@ -547,6 +818,8 @@ class InMemorySessionStore(SessionStore):
         self.sessions.clear()
         self.user_sessions.clear()
         self.revoked.clear()
+        self._expiry_heap.clear()
+        self._queued_expiry.clear()
 
     async def create(self, session_data: SessionData) -> bool:
         """Create a new session.
@@ -560,9 +833,9 @@ class InMemorySessionStore(SessionStore):
         self.sessions[session_data.session_id] = session_data
 
         # Add to user sessions
-        if session_data.user_id not in self.user_sessions:
-            self.user_sessions[session_data.user_id] = []
-        self.user_sessions[session_data.user_id].append(session_data.session_id)
+        self.user_sessions.setdefault(session_data.user_id, set()).add(session_data.session_id)
+
+        self._queue_expiry(session_data)
 
         return True
 
@@ -594,6 +867,12 @@ class InMemorySessionStore(SessionStore):
         """
         if session_data.session_id in self.sessions:
             self.sessions[session_data.session_id] = session_data
+            # A shortened expiry must be queued again or cleanup would only
+            # reach the session at its old expiry; extensions are requeued
+            # by cleanup itself
+            queued = self._queued_expiry.get(session_data.session_id)
+            if queued is None or session_data.expires_at < queued:
+                self._queue_expiry(session_data)
             return True
         return False
 
@@ -608,12 +887,16 @@ class InMemorySessionStore(SessionStore):
         """
         session_data = self.sessions.pop(session_id, None)
 
-        # Remove from user sessions
-        if session_data and session_data.user_id in self.user_sessions:
-            with contextlib.suppress(ValueError):
-                self.user_sessions[session_data.user_id].remove(session_id)
+        # Remove from user sessions, dropping the user's set once it is empty
+        if session_data:
+            user_session_ids = self.user_sessions.get(session_data.user_id)
+            if user_session_ids is not None:
+                user_session_ids.discard(session_id)
+                if not user_session_ids:
+                    del self.user_sessions[session_data.user_id]
 
         self.revoked.discard(session_id)
+        self._queued_expiry.pop(session_id, None)
         return True
 
     async def revoke(self, session_id: str) -> bool:
@@ -643,7 +926,8 @@ class InMemorySessionStore(SessionStore):
         Returns:
             Number of sessions revoked
         """
-        session_ids = self.user_sessions.get(user_id, []).copy()
+        # Copied, since revoking an expired session deletes it from the set
+        session_ids = list(self.user_sessions.get(user_id, ()))
         count = 0
 
         for session_id in session_ids:
@@ -663,19 +947,37 @@ class InMemorySessionStore(SessionStore):
         """
         return session_id in self.revoked
 
+    def _queue_expiry(self, session_data: SessionData) -> None:
+        """Index a session in the expiry heap at its current expiry.
+
+        Args:
+            session_data: Session to index
+        """
+        heapq.heappush(self._expiry_heap, (session_data.expires_at, session_data.session_id))
+        self._queued_expiry[session_data.session_id] = session_data.expires_at
+
     async def cleanup_expired(self) -> int:
         """Clean up expired sessions.
 
         Returns:
             Number of sessions cleaned up
         """
-        expired = [
-            session_id
-            for session_id, session_data in self.sessions.items()
-            if session_data.is_expired()
-        ]
+        now = datetime.now(UTC)
+        count = 0
+
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, session_id = heapq.heappop(self._expiry_heap)
+            session_data = self.sessions.get(session_id)
+            if session_data is None or self._queued_expiry.get(session_id) != expires_at:
+                # Already deleted, or superseded by an earlier entry
+                continue
+
+            if session_data.expires_at > now:
+                # Extended since it was indexed; requeue at its new expiry
+                self._queue_expiry(session_data)
+                continue
 
-        for session_id in expired:
             await self.delete(session_id)
+            count += 1
 
-        return len(expired)
+        return count
@@ -18,7 +18,7 @@ from typing import Any
 
 from aiohttp import web
 
-from gateway.core.config import GatewayConfig
+from gateway.core.config import GatewayConfig, RouteConfig
 from gateway.core.middleware import Middleware, MiddlewareHandler, RequestContext
 from gateway.core.session_store import SessionData, SessionStore
 
@@ -474,6 +474,22 @@ class AuthenticationMiddleware(Middleware):
 
         self.authorizer = Authorizer()
 
+        # Cookie settings read on every refreshed response, materialized once
+        # so the request path avoids chained config model lookups
+        self._cookie_name = config.session.cookie_name
+        self._token_ttl = config.session.token_ttl
+
+    def applies_to(self, route: RouteConfig) -> bool:
+        """Only run for routes that require authentication.
+
+        Args:
+            route: Matched route configuration
+
+        Returns:
+            True if the route requires authentication
+        """
+        return route.auth_required
+
     async def process(
         self, request: web.Request, context: RequestContext, next_handler: MiddlewareHandler
     ) -> web.Response:
@@ -570,9 +586,9 @@ class AuthenticationMiddleware(Middleware):
                 status=403,
             )
 
-        # Handle token refresh if enabled
+        # Handle token refresh if enabled (refresher is only built when enabled)
         new_token = None
-        if self.refresher and self.config.session.refresh_enabled:
+        if self.refresher is not None:
             session_data, new_token = await self.refresher.refresh(session_data)
 
         # Process request
@@ -581,9 +597,9 @@ class AuthenticationMiddleware(Middleware):
         # Add new token to response if refreshed
         if new_token:
             response.set_cookie(
-                self.config.session.cookie_name,
+                self._cookie_name,
                 new_token,
-                max_age=self.config.session.token_ttl,
+                max_age=self._token_ttl,
                 httponly=True,
                 secure=True,  # Always use secure in production
                 samesite="Lax",
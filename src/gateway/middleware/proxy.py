@@ -9,6 +9,7 @@ This module implements the upstream proxying functionality including:
 """
 
 import logging
+from collections.abc import Mapping
 from datetime import UTC, datetime
 from urllib.parse import urlparse
 
@@ -122,7 +123,7 @@ class UpstreamProxyClient:
 
     def _prepare_upstream_headers(
         self,
-        request_headers: dict[str, str],
+        request_headers: Mapping[str, str],
         upstream_url: str,
         correlation_id: str,
         user_id: str | None = None,
@@ -268,6 +269,7 @@ class ProxyMiddleware(Middleware):
         """
         super().__init__(config)
         self.proxy_client = UpstreamProxyClient(config)
+        self._correlation_header = config.logging.correlation_id_header
         logger.info("Proxy middleware initialized")
 
     async def close(self) -> None:
@@ -485,7 +487,8 @@ class ProxyMiddleware(Middleware):
         if context.rate_limit_reset is not None:
             headers["X-RateLimit-Reset"] = str(context.rate_limit_reset)
 
-        # Add correlation ID for tracing
-        headers["X-Request-ID"] = context.correlation_id
+        # Add correlation ID for tracing, under the configured header name so
+        # the request handler does not have to add it afterwards
+        headers[self._correlation_header] = context.correlation_id
 
         return headers
@@ -6,12 +6,14 @@ This module implements:
 - Rate limiting middleware (Task 19)
 """
 
+import asyncio
 import logging
+import time
 from datetime import UTC, datetime
 
 from aiohttp import web
 
-from gateway.core.config import GatewayConfig, RateLimitRule
+from gateway.core.config import GatewayConfig, RateLimitRule, RouteConfig
 from gateway.core.middleware import Middleware, MiddlewareHandler, RequestContext
 from gateway.core.rate_limit import (
     FixedWindowAlgorithm,
@@ -133,24 +135,38 @@ class RateLimitKeyGenerator:
 class RateLimitEvaluator:
     """Evaluates rate limiting rules and makes allow/deny decisions."""
 
+    # Denied keys whose next admission time is known are answered locally
+    # until then, without a store round trip
+    MAX_DENIED_KEYS = 10000
+
+    # Concurrent checks of one key wait for the first to finish when its
+    # algorithm reports when a denial ends; only a denial is shared, since
+    # sharing an admit would let the whole burst through on one count
+    COALESCED_ALGORITHMS = frozenset({"token_bucket", "fixed_window"})
+
     def __init__(
         self,
         store: RateLimitStore,
         fail_mode: str = "open",
+        local_admission: bool = False,
     ):
         """Initialize rate limit evaluator.
 
         Args:
             store: Rate limiting state store
             fail_mode: Fail mode ('open' or 'closed') when store is unavailable
+            local_admission: Let the token bucket admit requests for keys last
+                seen with a full bucket before the store confirms
         """
         self.store = store
         self.fail_mode = fail_mode
         self.key_generator = RateLimitKeyGenerator()
+        self._denied_until: dict[str, tuple[int, RateLimitState]] = {}
+        self._in_flight: dict[str, asyncio.Future[None]] = {}
 
         # Cache algorithm instances
         self.algorithms: dict[str, RateLimitAlgorithm] = {
-            "token_bucket": TokenBucketAlgorithm(store),
+            "token_bucket": TokenBucketAlgorithm(store, local_admission=local_admission),
             "fixed_window": FixedWindowAlgorithm(store),
             "sliding_window": SlidingWindowAlgorithm(store),
         }
@@ -180,27 +196,52 @@ class RateLimitEvaluator:
             RateLimitState with decision and metadata
         """
         try:
-            # Check if store is healthy
-            if not await self.store.is_healthy():
-                logger.warning("Rate limit store unhealthy, using fail mode")
-                return self._handle_store_failure(rule)
-
             # Generate rate limiting key
             key = self.key_generator.generate_key(context, rule)
 
-            # Get algorithm
-            algorithm = self._get_algorithm(rule.algorithm)
-
-            # Check limit
-            state = await algorithm.check_limit(
-                key=key,
-                limit=rule.limit,
-                window=rule.window,
-                burst=rule.burst,
-            )
+            # Short-circuit keys still known to be denied
+            denied = self._check_denied(key)
+            if denied is not None:
+                return denied
+
+            # Wait for a check of the same key that is already in flight; if it
+            # was denied, its denial is shared rather than asking the store again
+            in_flight = self._in_flight.get(key)
+            if in_flight is not None:
+                await asyncio.shield(in_flight)
+                denied = self._check_denied(key)
+                if denied is not None:
+                    return denied
+
+            leader: asyncio.Future[None] | None = None
+            if rule.algorithm in self.COALESCED_ALGORITHMS and key not in self._in_flight:
+                leader = asyncio.get_running_loop().create_future()
+                self._in_flight[key] = leader
+
+            try:
+                # Check if store is healthy
+                if not await self.store.is_healthy():
+                    logger.warning("Rate limit store unhealthy, using fail mode")
+                    return self._handle_store_failure(rule)
+
+                # Get algorithm
+                algorithm = self._get_algorithm(rule.algorithm)
+
+                # Check limit
+                state = await algorithm.check_limit(
+                    key=key,
+                    limit=rule.limit,
+                    window=rule.window,
+                    burst=rule.burst,
+                )
+            finally:
+                if leader is not None:
+                    del self._in_flight[key]
+                    leader.set_result(None)
 
             # Log rate limiting decision
             if not state.allowed:
+                self._remember_denied(key, state)
                 logger.info(
                     f"Rate limit exceeded for key {key}",
                     extra={
@@ -227,6 +268,51 @@ class RateLimitEvaluator:
             logger.error(f"Error evaluating rate limit: {e}", exc_info=True)
             return self._handle_store_failure(rule)
 
+    def _check_denied(self, key: str) -> RateLimitState | None:
+        """Return a denial for a key that cannot have been admitted yet.
+
+        Args:
+            key: Rate limiting key
+
+        Returns:
+            RateLimitState with an updated retry_after, or None if the store
+            has to be consulted
+        """
+        entry = self._denied_until.get(key)
+        if entry is None:
+            return None
+
+        next_allowed_at_ns, state = entry
+        remaining_ns = next_allowed_at_ns - time.time_ns()
+        if remaining_ns <= 0:
+            del self._denied_until[key]
+            return None
+
+        return RateLimitState(
+            allowed=False,
+            remaining=0,
+            limit=state.limit,
+            reset_at=state.reset_at,
+            retry_after=-(-remaining_ns // 1_000_000_000),
+            next_allowed_at_ns=next_allowed_at_ns,
+        )
+
+    def _remember_denied(self, key: str, state: RateLimitState) -> None:
+        """Remember a denial until the key's next admission time.
+
+        Args:
+            key: Rate limiting key
+            state: Denied rate limiting state
+        """
+        if state.next_allowed_at_ns is None:
+            return
+
+        if key not in self._denied_until and len(self._denied_until) >= self.MAX_DENIED_KEYS:
+            # Evict the oldest entry to bound memory
+            del self._denied_until[next(iter(self._denied_until))]
+
+        self._denied_until[key] = (state.next_allowed_at_ns, state)
+
     def _handle_store_failure(self, rule: RateLimitRule) -> RateLimitState:
         """Handle rate limit store failure based on fail mode.
 
@@ -284,10 +370,24 @@ class RateLimitingMiddleware(Middleware):
         self.evaluator = RateLimitEvaluator(
             store=rate_limit_store,
             fail_mode=config.rate_limiting.fail_mode,
+            local_admission=config.rate_limiting.local_admission,
         )
         self.enabled = config.rate_limiting.enabled
         self.rules = config.rate_limiting.rules
 
+    def applies_to(self, route: RouteConfig) -> bool:
+        """Only run for routes that at least one rate limiting rule covers.
+
+        Args:
+            route: Matched route configuration
+
+        Returns:
+            True if rate limiting is enabled and a rule applies to the route
+        """
+        return self.enabled and any(
+            not rule.routes or route.id in rule.routes for rule in self.rules
+        )
+
     def _find_applicable_rules(self, context: RequestContext) -> list[RateLimitRule]:
         """Find rate limiting rules that apply to this request.
 
@@ -3,6 +3,9 @@
 import pytest
 from aiohttp.test_utils import TestClient
 
+from gateway.core.gateway import Gateway
+from gateway.core.metrics import GatewayMetrics
+
 
 class TestEndToEndFlow:
     """Test complete request flow through the gateway."""
@@ -84,6 +87,20 @@ class TestEndToEndFlow:
         assert data["error"] == "method_not_allowed"
         assert "Allow" in response.headers
 
+    @pytest.mark.asyncio
+    async def test_router_built_on_first_request(
+        self, gateway: Gateway, gateway_client: TestClient
+    ):
+        """Test the router and middleware chain are deferred until first use."""
+        assert "router" not in vars(gateway)
+        assert "middleware_chain" not in vars(gateway)
+
+        response = await gateway_client.get("/api/hello")
+        assert response.status == 200
+
+        assert "router" in vars(gateway)
+        assert "middleware_chain" in vars(gateway)
+
     @pytest.mark.asyncio
     async def test_correlation_id_generated(self, gateway_client: TestClient):
         """Test that correlation ID is generated and included in response."""
@@ -103,6 +120,7 @@ class TestEndToEndFlow:
 
         assert response.status == 200
         # Correlation ID should be preserved and forwarded
+        assert response.headers["X-Request-ID"] == correlation_id
 
     @pytest.mark.asyncio
     async def test_different_http_methods(self, gateway_client: TestClient):
@@ -179,6 +197,23 @@ class TestRequestResponseLogging:
 
         # Check that response was logged with status code and latency
 
+    @pytest.mark.asyncio
+    async def test_response_metrics_recorded(
+        self, gateway_client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test proxied responses are recorded in metrics with latency in seconds."""
+        recorded: list[dict] = []
+        monkeypatch.setattr(
+            GatewayMetrics, "record_request", lambda self, **kwargs: recorded.append(kwargs)
+        )
+
+        response = await gateway_client.get("/api/hello")
+        assert response.status == 200
+
+        assert len(recorded) == 1
+        assert recorded[0]["status_code"] == 200
+        assert 0 <= recorded[0]["duration_seconds"] < 1
+
     @pytest.mark.asyncio
     async def test_error_logged(self, gateway_client: TestClient, caplog):
         """Test that errors are logged."""
@@ -264,6 +299,38 @@ class TestHealthChecks:
         assert "status" in data
         assert "components" in data
 
+    @pytest.mark.asyncio
+    async def test_probe_endpoints_resolve_before_gateway_routes(self, gateway_client: TestClient):
+        """Test health probes are served directly rather than by the gateway router."""
+        response = await gateway_client.get("/health/live")
+        assert response.status == 200
+        assert (await response.json()) == {"status": "alive"}
+
+        response = await gateway_client.get("/health/ready")
+        assert response.status == 200
+        assert (await response.json()) == {"status": "ready"}
+
+    @pytest.mark.asyncio
+    async def test_readiness_result_cached(
+        self, gateway: Gateway, gateway_client: TestClient, monkeypatch
+    ):
+        """Test repeated readiness probes reuse the previous store check."""
+        calls = 0
+        check_readiness = gateway._check_readiness
+
+        async def counting_check_readiness():
+            nonlocal calls
+            calls += 1
+            return await check_readiness()
+
+        monkeypatch.setattr(gateway, "_check_readiness", counting_check_readiness)
+
+        for _ in range(3):
+            response = await gateway_client.get("/health/ready")
+            assert response.status == 200
+
+        assert calls == 1
+
 
 class TestMetricsEndpoint:
     """Test metrics exposition."""
@@ -36,6 +36,9 @@ def test_server_config_defaults() -> None:
     assert config.host == "0.0.0.0"
     assert config.port == 8080
     assert config.tls_enabled is False
+    assert config.backlog == 1024
+    assert config.reuse_port is False
+    assert config.tls_min_version == "TLSv1.2"
 
 
 def test_server_config_validation() -> None:
@@ -52,6 +55,11 @@ def test_server_config_validation() -> None:
     with pytest.raises(ValueError):
         ServerConfig(port=70000)
 
+    # Minimum TLS version
+    assert ServerConfig(tls_min_version="TLSv1.3").tls_min_version == "TLSv1.3"
+    with pytest.raises(ValueError, match="Invalid tls_min_version"):
+        ServerConfig(tls_min_version="TLSv1.1")
+
 
 def test_logging_config_defaults() -> None:
     """Test LoggingConfig with default values."""
@@ -83,6 +91,7 @@ def test_session_config_defaults() -> None:
     assert config.cookie_name == "session_token"
     assert config.token_ttl == 3600
     assert config.refresh_enabled is True
+    assert config.pool_size == 64
 
 
 def test_rate_limit_config_validation() -> None:
@@ -96,6 +105,10 @@ def test_rate_limit_config_validation() -> None:
     with pytest.raises(ValueError, match="Invalid fail_mode"):
         RateLimitConfig(fail_mode="invalid")
 
+    assert RateLimitConfig().pool_size == 64
+    with pytest.raises(ValueError):
+        RateLimitConfig(pool_size=0)
+
 
 def test_gateway_config_defaults() -> None:
     """Test GatewayConfig with all defaults."""
@@ -125,6 +138,15 @@ def test_config_loader_missing_file() -> None:
     assert config.environment == "development"
 
 
+def test_config_loader_empty_file(tmp_path: Path) -> None:
+    """Test ConfigLoader treats an empty file as an empty configuration."""
+    config_file = tmp_path / "empty.yaml"
+    config_file.touch()
+
+    config = ConfigLoader(config_path=str(config_file)).load()
+    assert config.environment == "development"
+
+
 def test_config_loader_env_override(
     temp_config_file: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -172,3 +194,81 @@ def test_config_validation_error() -> None:
 
     with pytest.raises(ValueError, match="Configuration validation failed"):
         loader.load()
+
+
+def test_config_loader_mixed_key_types(tmp_path: Path) -> None:
+    """Test a YAML mapping with mixed-type keys is validated normally."""
+    config_file = tmp_path / "mixed.yaml"
+    config_file.write_text("server:\n  1: ignored\n  port: 9000\n")
+
+    config = ConfigLoader(config_path=str(config_file)).load()
+    assert config.server.port == 9000
+
+
+def test_config_loader_caches_parsed_yaml(
+    temp_config_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test repeated loads of an unchanged file skip YAML parsing."""
+    loader = ConfigLoader(config_path=str(temp_config_file))
+    first = loader._load_from_file()
+
+    def fail_parse(*args: object, **kwargs: object) -> None:
+        raise AssertionError("YAML should not be re-parsed")
+
+    monkeypatch.setattr(yaml, "load", fail_parse)
+    second = loader._load_from_file()
+
+    assert second == first
+    # Returned dicts are independent copies
+    second["server"]["port"] = 1
+    assert loader._load_from_file()["server"]["port"] == 9999
+
+
+def test_config_loader_cache_invalidated_on_change(temp_config_file: Path) -> None:
+    """Test the YAML cache is invalidated when the file changes."""
+    loader = ConfigLoader(config_path=str(temp_config_file))
+    assert loader.load().server.port == 9999
+
+    with open(temp_config_file, "w") as f:
+        yaml.dump({"environment": "changed", "server": {"port": 12345}}, f)
+
+    config = loader.load()
+    assert config.environment == "changed"
+    assert config.server.port == 12345
+
+
+def test_config_loader_loads_do_not_share_state(temp_config_file: Path) -> None:
+    """Test mutating a loaded config does not affect other loads."""
+    first = ConfigLoader(config_path=str(temp_config_file)).load()
+    second = ConfigLoader(config_path=str(temp_config_file)).load()
+    assert second is not first
+
+    second.server.port = 1
+    assert first.server.port == 9999
+    assert ConfigLoader(config_path=str(temp_config_file)).load().server.port == 9999
+
+
+def test_config_loader_cached_config_rechecks_tls_files(tmp_path: Path) -> None:
+    """Test a cached config still fails once its TLS files are removed."""
+    cert_path = tmp_path / "cert.pem"
+    key_path = tmp_path / "key.pem"
+    cert_path.write_text("cert")
+    key_path.write_text("key")
+    config_file = tmp_path / "tls.yaml"
+    with open(config_file, "w") as f:
+        yaml.dump(
+            {
+                "server": {
+                    "tls_enabled": True,
+                    "tls_cert_path": str(cert_path),
+                    "tls_key_path": str(key_path),
+                }
+            },
+            f,
+        )
+
+    assert ConfigLoader(config_path=str(config_file)).load().server.tls_enabled is True
+
+    key_path.unlink()
+    with pytest.raises(ValueError, match="TLS file not found"):
+        ConfigLoader(config_path=str(config_file)).load()
@@ -1,9 +1,11 @@
 """Unit tests for logging module."""
 
+import asyncio
 import json
 import logging
 
 import pytest
+from multidict import CIMultiDict, CIMultiDictProxy
 
 from gateway.core.config import LoggingConfig
 from gateway.core.logging import (
@@ -63,6 +65,21 @@ def test_correlation_id_filter() -> None:
     assert record.correlation_id == "none"  # type: ignore
 
 
+async def test_correlation_id_isolated_per_task() -> None:
+    """Test concurrent tasks each see their own correlation ID."""
+    filter_obj = CorrelationIdFilter()
+
+    async def handle(correlation_id: str) -> str:
+        filter_obj.set_correlation_id(correlation_id)
+        await asyncio.sleep(0)
+        record = logging.LogRecord("test", logging.INFO, "", 0, "msg", (), None)
+        filter_obj.filter(record)
+        return record.correlation_id  # type: ignore
+
+    results = await asyncio.gather(handle("req-a"), handle("req-b"))
+    assert results == ["req-a", "req-b"]
+
+
 def test_json_formatter() -> None:
     """Test JsonFormatter produces valid JSON."""
     formatter = JsonFormatter()
@@ -86,6 +103,119 @@ def test_json_formatter() -> None:
     assert "timestamp" in log_data
 
 
+def test_formatters_use_record_creation_time() -> None:
+    """Test both formatters timestamp records with their creation time."""
+    record = logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname="",
+        lineno=0,
+        msg="test message",
+        args=(),
+        exc_info=None,
+    )
+
+    for created, expected in [
+        (1700000000.5, "2023-11-14T22:13:20.500000+00:00"),
+        (1700000000.25, "2023-11-14T22:13:20.250000+00:00"),
+        (1700000001.0, "2023-11-14T22:13:21.000000+00:00"),
+    ]:
+        record.created = created
+        assert json.loads(JsonFormatter().format(record))["timestamp"] == expected
+        assert TextFormatter().format(record).startswith(f"{expected} [INFO]")
+
+
+def test_json_formatter_redacts_only_extra_fields() -> None:
+    """Test GatewayLogger's own event fields skip redaction but extra fields do not."""
+    formatter = JsonFormatter(redact_patterns=["Token"])
+    record = logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname="",
+        lineno=0,
+        msg="test message",
+        args=(),
+        exc_info=None,
+    )
+    record.event_fields = {"event_type": "token_refresh", "request": {"path": "/token"}}  # type: ignore
+    record.extra_fields = {"headers": {"X-Token": "secret"}}  # type: ignore
+
+    log_data = json.loads(formatter.format(record))
+
+    assert log_data["event_type"] == "token_refresh"
+    assert log_data["request"] == {"path": "/token"}
+    assert log_data["headers"] == {"X-Token": "***REDACTED***"}
+    assert "event_fields" not in log_data
+    assert "extra_fields" not in log_data
+
+
+def test_json_formatter_redacts_header_multidicts() -> None:
+    """Test request header multidicts are redacted like plain dicts."""
+    formatter = JsonFormatter(redact_patterns=["Authorization"])
+    record = logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname="",
+        lineno=0,
+        msg="test message",
+        args=(),
+        exc_info=None,
+    )
+    record.extra_fields = {  # type: ignore
+        "headers": CIMultiDictProxy(
+            CIMultiDict({"Authorization": "Bearer secret", "Accept": "application/json"})
+        )
+    }
+
+    log_data = json.loads(formatter.format(record))
+
+    assert log_data["headers"] == {
+        "Authorization": "***REDACTED***",
+        "Accept": "application/json",
+    }
+
+
+def test_json_formatter_custom_attributes() -> None:
+    """Test JsonFormatter copies custom record attributes but not reserved ones."""
+    formatter = JsonFormatter()
+    record = logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname="/app/module.py",
+        lineno=42,
+        msg="test message",
+        args=(),
+        exc_info=None,
+    )
+    record.route_id = "users"  # type: ignore
+
+    log_data = json.loads(formatter.format(record))
+
+    assert log_data["route_id"] == "users"
+    assert "pathname" not in log_data
+    assert "lineno" not in log_data
+
+
+def test_json_formatter_falls_back_for_unsupported_values() -> None:
+    """Test JsonFormatter still emits values orjson cannot serialize."""
+    formatter = JsonFormatter()
+    record = logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname="",
+        lineno=0,
+        msg="test message",
+        args=(),
+        exc_info=None,
+    )
+    record.extra_fields = {"big": 2**70, "obj": object()}  # type: ignore
+
+    log_data = json.loads(formatter.format(record))
+
+    assert log_data["big"] == 2**70
+    assert log_data["obj"].startswith("<object object")
+
+
 def test_json_formatter_redaction() -> None:
     """Test JsonFormatter redacts sensitive data."""
     formatter = JsonFormatter(redact_patterns=["Authorization", "Cookie"])
@@ -115,6 +245,24 @@ def test_json_formatter_redaction() -> None:
     assert log_data["headers"]["Content-Type"] == "application/json"
 
 
+def test_json_formatter_redaction_substring_match() -> None:
+    """Test redaction matches patterns as literal, case-insensitive substrings."""
+    formatter = JsonFormatter(redact_patterns=["Authorization", "X.Key"])
+    data = {
+        "Proxy-AUTHORIZATION": "secret",
+        "nested": {"x.key-id": "secret", "xakey": "visible"},
+        "path": "/api",
+    }
+
+    redacted = formatter._redact_sensitive_data(data)
+
+    assert redacted["Proxy-AUTHORIZATION"] == "***REDACTED***"
+    assert redacted["nested"]["x.key-id"] == "***REDACTED***"
+    # Pattern characters are literal, not regex metacharacters
+    assert redacted["nested"]["xakey"] == "visible"
+    assert redacted["path"] == "/api"
+
+
 def test_text_formatter() -> None:
     """Test TextFormatter produces human-readable output."""
     formatter = TextFormatter()
@@ -155,6 +303,10 @@ def test_generate_correlation_id(gateway_logger: GatewayLogger) -> None:
     correlation_id2 = gateway_logger.generate_correlation_id()
     assert correlation_id != correlation_id2
 
+    correlation_ids = {gateway_logger.generate_correlation_id() for _ in range(1000)}
+    assert len(correlation_ids) == 1000
+    assert all(int(cid[4:], 16) >= 0 and len(cid) == 20 for cid in correlation_ids)
+
 
 def test_set_correlation_id(gateway_logger: GatewayLogger) -> None:
     """Test setting correlation ID."""
@@ -184,6 +336,38 @@ def test_log_request(gateway_logger: GatewayLogger, caplog: pytest.LogCaptureFix
     assert "/api/users" in record.message
 
 
+def test_log_request_fields(
+    gateway_logger: GatewayLogger, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test request logging attaches event and caller fields without caller lookup."""
+    with caplog.at_level(logging.INFO, logger="gateway"):
+        gateway_logger.log_request(
+            method="GET", path="/api/users", client_ip="192.168.1.1", route_id="users"
+        )
+
+    record = caplog.records[0]
+    assert record.event_fields["request"]["path"] == "/api/users"  # type: ignore
+    assert record.extra_fields == {"route_id": "users"}  # type: ignore
+    assert record.lineno == 0
+
+
+def test_log_helpers_skip_disabled_levels(
+    gateway_logger: GatewayLogger, caplog: pytest.LogCaptureFixture, monkeypatch
+) -> None:
+    """Test helpers return before building a record when the level is disabled."""
+    monkeypatch.setattr(
+        gateway_logger, "_log", lambda *args: pytest.fail("record built for disabled level")
+    )
+
+    with caplog.at_level(logging.INFO, logger="gateway"):
+        gateway_logger.log_rate_limit_event(
+            key="user-123:/api/users", limit=100, current=50, exceeded=False
+        )
+        gateway_logger.log_upstream_event(upstream_url="http://backend:8080", method="GET")
+
+    assert caplog.records == []
+
+
 def test_log_response(gateway_logger: GatewayLogger, caplog: pytest.LogCaptureFixture) -> None:
     """Test response logging."""
     # Test successful response (INFO level)
@@ -302,3 +486,41 @@ def test_initialize_logging(log_config: LoggingConfig) -> None:
     """Test global logger initialization."""
     logger = initialize_logging(log_config)
     assert isinstance(logger, GatewayLogger)
+
+
+def test_gateway_logger_writes_through_listener(tmp_path) -> None:
+    """Test records are written by the listener thread and flushed on shutdown."""
+    log_file = tmp_path / "gateway.log"
+    gateway_logger = GatewayLogger(LoggingConfig(level="INFO", output=str(log_file)))
+    gateway_logger.set_correlation_id("listener-123")
+    try:
+        gateway_logger.log_request(method="GET", path="/api/users", client_ip="10.0.0.1")
+    finally:
+        gateway_logger.clear_correlation_id()
+        gateway_logger.shutdown()
+
+    log_data = json.loads(log_file.read_text())
+    assert log_data["message"] == "GET /api/users from 10.0.0.1"
+    assert log_data["correlation_id"] == "listener-123"
+    assert log_data["request"]["path"] == "/api/users"
+
+
+def test_gateway_logger_writes_synchronously_on_lambda(tmp_path, monkeypatch) -> None:
+    """Test records are written before the call returns when running on Lambda."""
+    monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "api-gateway")
+    log_file = tmp_path / "gateway.log"
+    gateway_logger = GatewayLogger(LoggingConfig(level="INFO", output=str(log_file)))
+    assert gateway_logger.listener is None
+
+    gateway_logger.set_correlation_id("lambda-123")
+    try:
+        gateway_logger.log_request(method="GET", path="/api/users", client_ip="10.0.0.1")
+
+        # No shutdown or flush: the record must already be in the file
+        log_data = json.loads(log_file.read_text())
+    finally:
+        gateway_logger.clear_correlation_id()
+        gateway_logger.shutdown()
+
+    assert log_data["message"] == "GET /api/users from 10.0.0.1"
+    assert log_data["correlation_id"] == "lambda-123"
@@ -1,12 +1,17 @@
 """Unit tests for metrics module."""
 
+import asyncio
+
 import pytest
+from prometheus_client import CollectorRegistry, Histogram, values
 
 from gateway.core.config import MetricsConfig
 from gateway.core.metrics import (
     ComponentHealth,
     GatewayMetrics,
     HealthStatus,
+    _BisectHistogram,
+    _UnlockedValue,
     initialize_metrics,
 )
 
@@ -44,6 +49,12 @@ def test_component_health() -> None:
     assert health_dict["message"] == "All good"
     assert health_dict["details"]["version"] == "1.0"
 
+    assert not hasattr(health, "__dict__")
+    assert ComponentHealth("bare", HealthStatus.DEGRADED).to_dict() == {
+        "name": "bare",
+        "status": "degraded",
+    }
+
 
 def test_gateway_metrics_initialization(gateway_metrics: GatewayMetrics) -> None:
     """Test GatewayMetrics initializes correctly."""
@@ -62,8 +73,34 @@ def test_record_request(gateway_metrics: GatewayMetrics) -> None:
         response_size=500,
     )
 
-    # Verify metrics were recorded (can't easily check values without exposing internals)
-    # Just ensure no exceptions were raised
+    # Size histograms are not labelled by path
+    assert set(gateway_metrics.request_size._metrics) == {("GET",)}
+    assert set(gateway_metrics.response_size._metrics) == {("GET",)}
+
+
+def test_record_request_reuses_bound_children(gateway_metrics: GatewayMetrics) -> None:
+    """Test label children are bound once per label set and the cache is bounded."""
+    gateway_metrics.LABEL_CACHE_SIZE = 2
+
+    for _ in range(3):
+        gateway_metrics.record_request(
+            method="GET", path="/api/users/1", status_code=200, duration_seconds=0.01
+        )
+
+    children = gateway_metrics._request_children[("GET", "/api/users/:id", 200)]
+    assert children[0]._value.get() == 3
+
+    gateway_metrics.record_request(
+        method="POST", path="/api/users", status_code=201, duration_seconds=0.01
+    )
+    gateway_metrics.record_request(
+        method="GET", path="/api/users", status_code=200, duration_seconds=0.01
+    )
+
+    assert list(gateway_metrics._request_children) == [
+        ("POST", "/api/users", 201),
+        ("GET", "/api/users", 200),
+    ]
 
 
 def test_normalize_path(gateway_metrics: GatewayMetrics) -> None:
@@ -84,6 +121,22 @@ def test_normalize_path(gateway_metrics: GatewayMetrics) -> None:
     normalized = gateway_metrics._normalize_path("/api/users")
     assert normalized == "/api/users"
 
+    # Test UUID without any digits
+    normalized = gateway_metrics._normalize_path("/api/users/abcdefab-abcd-abcd-abcd-abcdefabcdef")
+    assert normalized == "/api/users/:id"
+
+
+def test_normalize_path_cached(gateway_metrics: GatewayMetrics) -> None:
+    """Test repeated paths are served from the normalization cache."""
+    gateway_metrics._normalize_path.cache_clear()
+
+    for _ in range(3):
+        assert gateway_metrics._normalize_path("/api/orders/42") == "/api/orders/:id"
+
+    cache_info = gateway_metrics._normalize_path.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 2
+
 
 def test_record_auth_attempt(gateway_metrics: GatewayMetrics) -> None:
     """Test recording authentication attempts."""
@@ -115,6 +168,48 @@ def test_update_rate_limit_keys(gateway_metrics: GatewayMetrics) -> None:
     # No exceptions should be raised
 
 
+def test_free_form_labels_capped(gateway_metrics: GatewayMetrics) -> None:
+    """Test label sets beyond the series budget are folded into "other"."""
+    gateway_metrics.config.max_label_series = 2
+
+    for error_type in ("a", "b", "c", "d", "a"):
+        gateway_metrics.record_error(error_type=error_type)
+
+    children = gateway_metrics.errors_total._metrics
+    assert set(children) == {("a",), ("b",), ("other",)}
+    assert children[("a",)]._value.get() == 2
+    assert children[("other",)]._value.get() == 2
+    assert gateway_metrics.label_overflow.labels(metric="gateway_errors_total")._value.get() == 2
+
+
+def test_configured_labels_allowlisted(gateway_metrics: GatewayMetrics) -> None:
+    """Test route, upstream and rule labels outside the configured values become "other"."""
+    gateway_metrics.set_label_allowlists(
+        routes=["admin"], upstreams=["http://users:8080"], rule_names=["global"]
+    )
+
+    gateway_metrics.record_authz_denial(route="admin")
+    gateway_metrics.record_authz_denial(route="/api/admin/123")
+    gateway_metrics.record_rate_limit_exceeded(rule_name="unknown", key_type="ip")
+    gateway_metrics.record_upstream_request(
+        upstream="http://users:8080", status_code=200, duration_seconds=0.01
+    )
+    gateway_metrics.record_upstream_request(
+        upstream="http://elsewhere", status_code=200, duration_seconds=0.01
+    )
+
+    assert set(gateway_metrics.authz_denials._metrics) == {("admin",), ("other",)}
+    assert set(gateway_metrics.rate_limit_exceeded._metrics) == {("other", "ip")}
+    assert set(gateway_metrics.upstream_duration._metrics) == {("http://users:8080",), ("other",)}
+
+
+def test_rate_limit_key_type_allowlisted(gateway_metrics: GatewayMetrics) -> None:
+    """Test unknown rate limit key types are recorded as "other"."""
+    gateway_metrics.record_rate_limit_exceeded(rule_name="global", key_type="header")
+
+    assert set(gateway_metrics.rate_limit_exceeded._metrics) == {("global", "other")}
+
+
 def test_record_upstream_request(gateway_metrics: GatewayMetrics) -> None:
     """Test recording upstream requests."""
     # Successful request
@@ -132,7 +227,10 @@ def test_record_upstream_request(gateway_metrics: GatewayMetrics) -> None:
         error_type="timeout",
     )
 
-    # No exceptions should be raised
+    assert set(gateway_metrics.upstream_requests._metrics) == {
+        ("user-service", "200"),
+        ("user-service", "error"),
+    }
 
 
 def test_record_error(gateway_metrics: GatewayMetrics) -> None:
@@ -150,7 +248,7 @@ def test_connection_tracking(gateway_metrics: GatewayMetrics) -> None:
     # No exceptions should be raised
 
 
-def test_health_check_registration(gateway_metrics: GatewayMetrics) -> None:
+async def test_health_check_registration(gateway_metrics: GatewayMetrics) -> None:
     """Test registering health checks."""
 
     def healthy_check() -> ComponentHealth:
@@ -161,13 +259,13 @@ def test_health_check_registration(gateway_metrics: GatewayMetrics) -> None:
 
     gateway_metrics.register_health_check("test_component", healthy_check)
 
-    health = gateway_metrics.check_health(detailed=True)
+    health = await gateway_metrics.check_health(detailed=True)
     assert health["status"] == "healthy"
     assert len(health["components"]) == 1
     assert health["components"][0]["name"] == "test_component"
 
 
-def test_health_check_unhealthy(gateway_metrics: GatewayMetrics) -> None:
+async def test_health_check_unhealthy(gateway_metrics: GatewayMetrics) -> None:
     """Test health check with unhealthy component."""
 
     def unhealthy_check() -> ComponentHealth:
@@ -179,13 +277,13 @@ def test_health_check_unhealthy(gateway_metrics: GatewayMetrics) -> None:
 
     gateway_metrics.register_health_check("failing_component", unhealthy_check)
 
-    health = gateway_metrics.check_health(detailed=True)
+    health = await gateway_metrics.check_health(detailed=True)
     assert health["status"] == "unhealthy"
     assert health["components"][0]["status"] == "unhealthy"
     assert health["components"][0]["message"] == "Component is down"
 
 
-def test_health_check_degraded(gateway_metrics: GatewayMetrics) -> None:
+async def test_health_check_degraded(gateway_metrics: GatewayMetrics) -> None:
     """Test health check with degraded component."""
 
     def degraded_check() -> ComponentHealth:
@@ -197,11 +295,11 @@ def test_health_check_degraded(gateway_metrics: GatewayMetrics) -> None:
 
     gateway_metrics.register_health_check("degraded_component", degraded_check)
 
-    health = gateway_metrics.check_health(detailed=True)
+    health = await gateway_metrics.check_health(detailed=True)
     assert health["status"] == "degraded"
 
 
-def test_health_check_exception(gateway_metrics: GatewayMetrics) -> None:
+async def test_health_check_exception(gateway_metrics: GatewayMetrics) -> None:
     """Test health check handles exceptions."""
 
     def failing_check() -> ComponentHealth:
@@ -209,10 +307,71 @@ def test_health_check_exception(gateway_metrics: GatewayMetrics) -> None:
 
     gateway_metrics.register_health_check("crashing_component", failing_check)
 
-    health = gateway_metrics.check_health(detailed=True)
+    health = await gateway_metrics.check_health(detailed=True)
     assert health["status"] == "unhealthy"
     assert "Health check failed" in health["components"][0]["message"]
 
+    health = await gateway_metrics.check_health(use_cache=False)
+    assert health["status"] == "unhealthy"
+    assert "components" not in health
+
+
+async def test_async_health_checks_run_concurrently(gateway_metrics: GatewayMetrics) -> None:
+    """Test coroutine health checks are awaited together."""
+    started = 0
+    both_started = asyncio.Event()
+
+    async def waiting_check() -> ComponentHealth:
+        nonlocal started
+        started += 1
+        if started == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return ComponentHealth(name="waiting", status=HealthStatus.HEALTHY)
+
+    gateway_metrics.register_health_check("first", waiting_check)
+    gateway_metrics.register_health_check("second", waiting_check)
+
+    health = await gateway_metrics.check_health(detailed=True)
+    assert health["status"] == "healthy"
+    assert len(health["components"]) == 2
+
+
+async def test_summary_health_check_cached(gateway_metrics: GatewayMetrics) -> None:
+    """Test back-to-back summary health checks reuse the previous result."""
+    calls = 0
+
+    def counting_check() -> ComponentHealth:
+        nonlocal calls
+        calls += 1
+        return ComponentHealth(name="counted", status=HealthStatus.HEALTHY)
+
+    gateway_metrics.register_health_check("counted", counting_check)
+
+    await gateway_metrics.check_health()
+    await gateway_metrics.check_readiness()
+    assert calls == 1
+
+    await gateway_metrics.check_health(use_cache=False)
+    await gateway_metrics.check_health(detailed=True)
+    assert calls == 3
+
+
+async def test_cached_health_result_not_shared(gateway_metrics: GatewayMetrics) -> None:
+    """Test mutating a returned summary does not alter the cached result."""
+    gateway_metrics.register_health_check(
+        "ok", lambda: ComponentHealth(name="ok", status=HealthStatus.HEALTHY)
+    )
+
+    first = await gateway_metrics.check_health()
+    first["status"] = "mutated"
+    second = await gateway_metrics.check_health()
+    second["extra"] = True
+
+    third = await gateway_metrics.check_health()
+    assert third["status"] == HealthStatus.HEALTHY.value
+    assert "extra" not in third
+
 
 def test_liveness_check(gateway_metrics: GatewayMetrics) -> None:
     """Test liveness check."""
@@ -221,10 +380,10 @@ def test_liveness_check(gateway_metrics: GatewayMetrics) -> None:
     assert "timestamp" in liveness
 
 
-def test_readiness_check(gateway_metrics: GatewayMetrics) -> None:
+async def test_readiness_check(gateway_metrics: GatewayMetrics) -> None:
     """Test readiness check."""
     # No health checks registered - should be ready
-    readiness = gateway_metrics.check_readiness()
+    readiness = await gateway_metrics.check_readiness()
     assert readiness["ready"] is True
 
     # Add unhealthy component - should not be ready
@@ -236,7 +395,7 @@ def test_readiness_check(gateway_metrics: GatewayMetrics) -> None:
 
     gateway_metrics.register_health_check("failing_component", unhealthy_check)
 
-    readiness = gateway_metrics.check_readiness()
+    readiness = await gateway_metrics.check_readiness()
     assert readiness["ready"] is False
 
 
@@ -256,7 +415,66 @@ def test_export_metrics(gateway_metrics: GatewayMetrics) -> None:
     assert b"gateway_requests_total" in metrics_output
 
 
+def test_export_metrics_cached(gateway_metrics: GatewayMetrics) -> None:
+    """Test rapid scrapes reuse the rendered output until the cache expires."""
+    first = gateway_metrics.export_metrics()
+    assert gateway_metrics.export_metrics() is first
+
+    gateway_metrics._export_time -= GatewayMetrics.EXPORT_CACHE_SECONDS
+    assert gateway_metrics.export_metrics() is not first
+
+
 def test_initialize_metrics(metrics_config: MetricsConfig) -> None:
     """Test global metrics initialization."""
     metrics = initialize_metrics(metrics_config)
     assert isinstance(metrics, GatewayMetrics)
+
+
+def test_single_threaded_metrics_use_unlocked_values(monkeypatch) -> None:
+    """Test single_threaded mode creates metrics with lock-free values."""
+    monkeypatch.setattr(values, "ValueClass", values.MutexValue)
+    metrics = GatewayMetrics(MetricsConfig(single_threaded=True))
+
+    metrics.record_request(method="GET", path="/api", status_code=200, duration_seconds=0.01)
+
+    total = metrics._request_children[("GET", "/api", 200)][0]
+    assert isinstance(total._value, _UnlockedValue)
+    assert total._value.get() == 1
+
+
+def test_bisect_histogram_matches_linear_bucketing() -> None:
+    """Test the bisecting histogram fills the same buckets as Histogram."""
+    registry = CollectorRegistry()
+    buckets = (0.005, 0.01, 0.025, 0.05, 0.1)
+    expected = Histogram("expected", "Expected", buckets=buckets, registry=registry)
+    actual = _BisectHistogram("actual", "Actual", buckets=buckets, registry=registry)
+
+    for amount in (0.0, 0.005, 0.0051, 0.01, 0.03, 0.1, 0.2, 42.0):
+        expected.observe(amount)
+        actual.observe(amount)
+
+    assert [b.get() for b in actual._buckets] == [b.get() for b in expected._buckets]
+    assert actual._sum.get() == expected._sum.get()
+
+
+def test_bisect_histogram_skips_buckets_for_nan() -> None:
+    """Test NaN is counted in no bucket, as by Histogram."""
+    registry = CollectorRegistry()
+    histogram = _BisectHistogram("nan", "NaN", buckets=(0.1, 1.0), registry=registry)
+
+    histogram.observe(float("nan"))
+
+    assert [b.get() for b in histogram._buckets] == [0, 0, 0]
+
+
+def test_histogram_internals_used_by_bisect_histogram() -> None:
+    """Test the prometheus_client internals _BisectHistogram relies on still exist."""
+    histogram = Histogram(
+        "internals", "Internals", ["route"], buckets=(0.1, 1.0), registry=CollectorRegistry()
+    )
+    child = histogram.labels(route="/api")
+
+    assert list(child._upper_bounds) == [0.1, 1.0, float("inf")]
+    assert len(child._buckets) == 3
+    assert all(hasattr(bucket, "inc") for bucket in child._buckets)
+    assert hasattr(child._sum, "inc")
@@ -473,6 +473,18 @@ class TestProxyMiddleware:
         # Should add correlation ID
         assert headers["X-Request-ID"] == "test-correlation-id"
 
+    def test_prepare_response_headers_uses_configured_correlation_header(
+        self, gateway_config, request_context
+    ):
+        """Test the correlation ID is returned under the configured header name."""
+        gateway_config.logging.correlation_id_header = "X-Correlation-ID"
+        middleware = ProxyMiddleware(gateway_config)
+
+        headers = middleware._prepare_response_headers({}, request_context)
+
+        assert headers["X-Correlation-ID"] == "test-correlation-id"
+        assert "X-Request-ID" not in headers
+
     def test_prepare_response_headers_without_rate_limit(self, gateway_config, request_context):
         """Test response header preparation without rate limit info."""
         middleware = ProxyMiddleware(gateway_config)
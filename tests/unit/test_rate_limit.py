@@ -5,8 +5,9 @@ import time
 from unittest.mock import Mock
 
 import pytest
+from aiohttp import web
 
-from gateway.core.config import RateLimitRule, RouteConfig
+from gateway.core.config import GatewayConfig, RateLimitConfig, RateLimitRule, RouteConfig
 from gateway.core.middleware import RequestContext
 from gateway.core.rate_limit import (
     FixedWindowAlgorithm,
@@ -16,7 +17,11 @@ from gateway.core.rate_limit import (
     TokenBucketAlgorithm,
 )
 from gateway.core.routing import RouteMatch
-from gateway.middleware.ratelimit import RateLimitEvaluator, RateLimitKeyGenerator
+from gateway.middleware.ratelimit import (
+    RateLimitEvaluator,
+    RateLimitingMiddleware,
+    RateLimitKeyGenerator,
+)
 
 
 @pytest.fixture
@@ -94,6 +99,7 @@ class TestTokenBucketAlgorithm:
         for i in range(burst):
             state = await algorithm.check_limit(key="test", limit=10, window=60, burst=burst)
             assert state.allowed is True, f"Request {i + 1} should be allowed"
+            assert state.remaining == burst - i - 1
 
         # Next request should be denied (bucket empty)
         state = await algorithm.check_limit(key="test", limit=10, window=60, burst=burst)
@@ -119,6 +125,41 @@ class TestTokenBucketAlgorithm:
         # Just verify it doesn't crash
         assert isinstance(state.allowed, bool)
 
+    @pytest.mark.asyncio
+    async def test_local_admission_for_full_bucket(self, in_memory_store):
+        """Test a key last seen with a full bucket is admitted before the store."""
+        algorithm = TokenBucketAlgorithm(in_memory_store, local_admission=True)
+
+        state = await algorithm.check_limit(key="test", limit=10, window=60, burst=5)
+        assert state.allowed is True
+
+        store_calls = 0
+        advance_tat = in_memory_store.advance_tat
+
+        async def counting_advance(*args):
+            nonlocal store_calls
+            store_calls += 1
+            return await advance_tat(*args)
+
+        in_memory_store.advance_tat = counting_advance
+
+        # The TAT seen last is still ahead, so the store decides
+        state = await algorithm.check_limit(key="test", limit=10, window=60, burst=5)
+        assert state.remaining == 3
+        assert store_calls == 1
+
+        # Once the last seen TAT has passed, admit without waiting for the store
+        algorithm._local_tats["test"] = time.time() - 1
+        state = await algorithm.check_limit(key="test", limit=10, window=60, burst=5)
+        assert state.allowed is True
+        assert state.remaining == 4
+        assert store_calls == 1
+
+        # The request is still written back, and the store's TAT remembered
+        await asyncio.gather(*algorithm._write_backs)
+        assert store_calls == 2
+        assert algorithm._local_tats["test"] == await in_memory_store.get_tat("test")
+
 
 class TestFixedWindowAlgorithm:
     """Tests for fixed window rate limiting algorithm."""
@@ -395,24 +436,162 @@ class TestRateLimitEvaluator:
         # Should fail closed (deny request)
         assert state.allowed is False
 
+    @pytest.mark.asyncio
+    async def test_denied_key_answered_without_store(self, in_memory_store, request_context):
+        """Test a denied key is short-circuited until its next admission time."""
+        evaluator = RateLimitEvaluator(in_memory_store, fail_mode="open")
+
+        rule = RateLimitRule(
+            name="test_rule",
+            key_type="user",
+            algorithm="token_bucket",
+            limit=1,
+            window=60,
+            burst=1,
+        )
+
+        assert (await evaluator.evaluate(request_context, rule)).allowed is True
+        denied = await evaluator.evaluate(request_context, rule)
+        assert denied.allowed is False
+        assert denied.next_allowed_at_ns is not None
+
+        store_calls = 0
+        advance_tat = in_memory_store.advance_tat
+
+        async def counting_advance(*args):
+            nonlocal store_calls
+            store_calls += 1
+            return await advance_tat(*args)
+
+        in_memory_store.advance_tat = counting_advance
+
+        state = await evaluator.evaluate(request_context, rule)
+        assert state.allowed is False
+        assert 0 < state.retry_after <= 60
+        assert store_calls == 0
+
+        # Once the next admission time has passed the store is consulted again
+        key = evaluator.key_generator.generate_key(request_context, rule)
+        evaluator._denied_until[key] = (time.time_ns() - 1, denied)
+        await evaluator.evaluate(request_context, rule)
+        assert store_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_denials_share_one_store_call(self, in_memory_store, request_context):
+        """Test concurrent checks of a denied key wait for the first check."""
+        evaluator = RateLimitEvaluator(in_memory_store, fail_mode="open")
+
+        rule = RateLimitRule(
+            name="test_rule",
+            key_type="user",
+            algorithm="token_bucket",
+            limit=1,
+            window=60,
+            burst=1,
+        )
+
+        assert (await evaluator.evaluate(request_context, rule)).allowed is True
+
+        store_calls = 0
+        advance_tat = in_memory_store.advance_tat
+
+        async def slow_advance(*args):
+            nonlocal store_calls
+            store_calls += 1
+            await asyncio.sleep(0.01)
+            return await advance_tat(*args)
+
+        in_memory_store.advance_tat = slow_advance
+
+        states = await asyncio.gather(
+            *(evaluator.evaluate(request_context, rule) for _ in range(5))
+        )
+
+        assert all(state.allowed is False for state in states)
+        assert store_calls == 1
+        assert evaluator._in_flight == {}
+
+
+class TestRateLimitingMiddleware:
+    """Tests for rate limiting middleware."""
+
+    @pytest.mark.asyncio
+    async def test_denied_request_does_not_consume_other_rules(
+        self, in_memory_store, request_context
+    ):
+        """Test that a request denied by one rule leaves later rules' quota untouched."""
+        rules = [
+            RateLimitRule(
+                name="per_ip", key_type="ip", algorithm="fixed_window", limit=1, window=60
+            ),
+            RateLimitRule(
+                name="per_user", key_type="user", algorithm="fixed_window", limit=5, window=60
+            ),
+        ]
+        config = GatewayConfig(rate_limiting=RateLimitConfig(rules=rules))
+        middleware = RateLimitingMiddleware(config, in_memory_store)
+
+        async def next_handler(request, context):
+            return web.Response(text="ok")
+
+        request = Mock()
+        request.app.get.return_value = None
+        response = await middleware.process(request, request_context, next_handler)
+        assert response.status == 200
+        # Context reflects the first applicable rule
+        assert request_context.rate_limit_key == "ip:192.168.1.100:per_ip"
+
+        for _ in range(3):
+            request_context.rate_limit_key = None
+            response = await middleware.process(request, request_context, next_handler)
+            assert response.status == 429
+
+        # Only the allowed request counted against the per-user rule
+        state = await middleware.evaluator.evaluate(request_context, rules[1])
+        assert state.allowed is True
+        assert state.remaining == 3
+
+    @pytest.mark.asyncio
+    async def test_denies_when_any_rule_exceeded(self, in_memory_store, request_context):
+        """Test that a single denying rule rejects the request."""
+        rules = [
+            RateLimitRule(name="per_ip", key_type="ip", limit=10, window=60),
+            RateLimitRule(name="per_user", key_type="user", limit=5, window=60),
+        ]
+        config = GatewayConfig(rate_limiting=RateLimitConfig(rules=rules))
+        middleware = RateLimitingMiddleware(config, in_memory_store)
+
+        async def evaluate(context, rule):
+            allowed = rule.name == "per_ip"
+            return RateLimitState(allowed=allowed, remaining=0, limit=rule.limit, reset_at=0)
+
+        middleware.evaluator.evaluate = evaluate  # type: ignore[method-assign]
+
+        async def next_handler(request, context):
+            raise AssertionError("Request should have been rate limited")
+
+        request = Mock()
+        request.app.get.return_value = None
+        response = await middleware.process(request, request_context, next_handler)
+
+        assert response.status == 429
+
 
 class TestInMemoryRateLimitStore:
     """Tests for in-memory rate limit store."""
 
     @pytest.mark.asyncio
-    async def test_stores_and_retrieves_bucket_state(self):
-        """Test storing and retrieving bucket state."""
+    async def test_stores_and_retrieves_tat(self):
+        """Test storing and retrieving a token bucket's theoretical arrival time."""
         store = InMemoryRateLimitStore()
         await store.connect()
 
-        # Set bucket state
-        await store.set_bucket_state("test", 5.0, time.time(), 60)
+        assert await store.get_tat("test") is None
 
-        # Retrieve bucket state
-        state = await store.get_bucket_state("test")
+        now = time.time()
+        await store.set_tat("test", now, 60)
 
-        assert state is not None
-        assert state[0] == 5.0  # tokens
+        assert await store.get_tat("test") == now
 
     @pytest.mark.asyncio
     async def test_increments_window_count(self):
@@ -431,6 +610,43 @@ class TestInMemoryRateLimitStore:
         assert count2 == 2
         assert count3 == 3
 
+    @pytest.mark.asyncio
+    async def test_check_and_increment_window_count(self):
+        """Test the combined check-and-increment stops counting at the limit."""
+        store = InMemoryRateLimitStore()
+
+        assert await store.check_and_increment_window_count("key", 0, 60, 2) == (1, True)
+        assert await store.check_and_increment_window_count("key", 0, 60, 2) == (2, True)
+        assert await store.check_and_increment_window_count("key", 0, 60, 2) == (2, False)
+        assert await store.get_window_count("key", 0) == 2
+
+    @pytest.mark.asyncio
+    async def test_check_and_increment_sliding_window_count(self):
+        """Test the combined sliding check weighs the previous window's count."""
+        store = InMemoryRateLimitStore()
+        for _ in range(3):
+            await store.increment_window_count("key", 0, 60)
+
+        # 3 * 0.5 + 1 = 2.5 is still under the limit, 3 * 0.5 + 2 = 3.5 is not
+        check = store.check_and_increment_sliding_window_count
+        assert await check("key", 60, 60, 3, 0.5) == (3, 1, True)
+        assert await check("key", 60, 60, 3, 0.5) == (3, 2, True)
+        assert await check("key", 60, 60, 3, 0.5) == (3, 2, False)
+
+    @pytest.mark.asyncio
+    async def test_advance_tat(self):
+        """Test the TAT advances per request and stops at the burst tolerance."""
+        store = InMemoryRateLimitStore()
+
+        # One request per second with a burst of two
+        assert await store.advance_tat("key", 1.0, 2.0, 100.0) == (True, 101.0)
+        assert await store.advance_tat("key", 1.0, 2.0, 100.0) == (True, 102.0)
+        assert await store.advance_tat("key", 1.0, 2.0, 100.5) == (False, 102.0)
+        assert await store.advance_tat("key", 1.0, 2.0, 101.0) == (True, 103.0)
+
+        # Once the TAT has passed the bucket is full again
+        assert await store.advance_tat("key", 1.0, 2.0, 200.0) == (True, 201.0)
+
     @pytest.mark.asyncio
     async def test_is_healthy_returns_true(self):
         """Test that in-memory store is always healthy."""
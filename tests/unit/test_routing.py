@@ -58,6 +58,27 @@ class TestPathMatcher:
         assert matcher.match("/api/users") is not None
         assert matcher.match("/api/users/") is None  # Matcher doesn't normalize
 
+    def test_literal_pattern_matches_without_regex(self):
+        """Test parameterless patterns match by string equality."""
+        matcher = PathMatcher("/api/users/")
+
+        assert matcher.literal_path == "/api/users"
+        assert matcher.match("/api/users") == {}
+        assert matcher.match("/api/users/") is None
+
+        # Braces around a non-word name are a literal segment
+        matcher = PathMatcher("/api/{user-id}")
+        assert matcher.param_names == []
+        assert matcher.match("/api/{user-id}") == {}
+
+    def test_digit_leading_parameter_names(self):
+        """Test parameter names may start with a digit."""
+        matcher = PathMatcher("/api/{1id}/items/{123}")
+
+        assert matcher.param_names == ["1id", "123"]
+        assert matcher.literal_path is None
+        assert matcher.match("/api/abc/items/42") == {"1id": "abc", "123": "42"}
+
 
 class TestRouter:
     """Tests for Router class."""
@@ -209,3 +230,109 @@ class TestRouter:
         # Mixed case
         match = router.match_route("/api/users", "Get")
         assert match is not None
+
+    def test_parameters_extracted_for_later_routes(self):
+        """Test parameters of lower-priority routes are extracted correctly."""
+        routes = [
+            RouteConfig(
+                id="user_by_id",
+                path_pattern="/api/users/{user_id}",
+                methods=["GET"],
+                upstream_url="http://localhost:8081",
+            ),
+            RouteConfig(
+                id="post_by_id",
+                path_pattern="/api/{owner}/posts/{post_id}",
+                methods=["GET"],
+                upstream_url="http://localhost:8081",
+            ),
+            RouteConfig(
+                id="owner_root",
+                path_pattern="/{owner}",
+                methods=["GET", "POST"],
+                upstream_url="http://localhost:8081",
+            ),
+        ]
+        router = Router(routes)
+
+        match = router.match_route("/api/alice/posts/42", "GET")
+        assert match is not None
+        assert match.route.id == "post_by_id"
+        assert match.path_params == {"owner": "alice", "post_id": "42"}
+
+        match = router.match_route("/bob", "POST")
+        assert match is not None
+        assert match.route.id == "owner_root"
+        assert match.path_params == {"owner": "bob"}
+
+        assert router.match_route("/api/users/1", "POST") is None
+
+    def test_static_map_matches_parameterless_routes(self):
+        """Test the static map resolves exact paths and ignores parameterized ones."""
+        router = Router(self.create_test_routes())
+
+        match = router.match_route("/api/users/", "post")
+        assert match is not None
+        assert match.route.id == "users_list"
+        assert match.path_params == {}
+
+        # Parameterized routes and disallowed methods are not in the static map
+        assert ("POST", "/api/users") in router._static_routes
+        assert ("GET", "/api/users/123") not in router._static_routes
+        assert router.match_route("/api/users", "DELETE") is None
+
+    def test_static_route_outranks_parameterized_route(self):
+        """Test an exact route wins over a parameterized route for the same path."""
+        routes = [
+            RouteConfig(
+                id="user_by_id",
+                path_pattern="/api/users/{user_id}",
+                methods=["GET"],
+                upstream_url="http://localhost:8081",
+            ),
+            RouteConfig(
+                id="current_user",
+                path_pattern="/api/users/me",
+                methods=["GET"],
+                upstream_url="http://localhost:8081",
+            ),
+        ]
+        router = Router(routes)
+
+        match = router.match_route("/api/users/me", "GET")
+        assert match is not None
+        assert match.route.id == "current_user"
+
+        match = router.match_route("/api/users/42", "GET")
+        assert match is not None
+        assert match.route.id == "user_by_id"
+
+    def test_static_route_with_repeated_slashes(self):
+        """Test a pattern with repeated slashes matches its collapsed path."""
+        routes = [
+            RouteConfig(
+                id="users",
+                path_pattern="/api//users",
+                methods=["GET"],
+                upstream_url="http://localhost:8081",
+            ),
+        ]
+        router = Router(routes)
+
+        match = router.match_route("/api/users", "GET")
+        assert match is not None
+        assert match.route.id == "users"
+        assert router.get_allowed_methods("/api/users") == ["GET"]
+
+    def test_parameterized_matches_cached(self):
+        """Test repeated parameterized paths reuse the cached regex match."""
+        router = Router(self.create_test_routes())
+
+        first = router.match_route("/api/users/42", "GET")
+        second = router.match_route("/api/users/42", "get")
+
+        assert first is not None and second is not None
+        assert second.route is first.route
+        assert second.path_params == {"user_id": "42"}
+        assert second.path_params is not first.path_params
+        assert router._match_dynamic.cache_info().hits == 1
@@ -1,10 +1,25 @@
 """Unit tests for session store module."""
 
+import asyncio
+import json
 from datetime import UTC, datetime, timedelta
 
 import pytest
 
-from gateway.core.session_store import InMemorySessionStore, SessionData
+from gateway.core.session_store import CachedSessionStore, InMemorySessionStore, SessionData
+
+
+class CountingSessionStore(InMemorySessionStore):
+    """In-memory store that counts backend reads."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.get_calls = 0
+
+    async def get(self, session_id: str) -> SessionData | None:
+        self.get_calls += 1
+        await asyncio.sleep(0)
+        return await super().get(session_id)
 
 
 class TestSessionData:
@@ -115,6 +130,42 @@ class TestSessionData:
         assert restored_session.roles == session.roles
         assert restored_session.permissions == session.permissions
 
+    def test_session_json_round_trip(self):
+        """Test stored JSON restores an equal session without sharing containers."""
+        now = datetime.now(UTC)
+        session = SessionData(
+            session_id="sess-123",
+            user_id="user-456",
+            username="testuser",
+            created_at=now,
+            last_accessed_at=now,
+            expires_at=now + timedelta(hours=1),
+            roles=["user"],
+            metadata={"source": "sso"},
+        )
+
+        assert SessionData.from_dict(json.loads(session.to_json())) == session
+
+        session_dict = session.to_dict()
+        session_dict["roles"].append("admin")
+        assert session.roles == ["user"]
+
+    def test_session_json_stringifies_non_str_metadata_keys(self):
+        """Test metadata with non-str keys serializes with the keys as strings."""
+        now = datetime.now(UTC)
+        session = SessionData(
+            session_id="sess-123",
+            user_id="user-456",
+            username="testuser",
+            created_at=now,
+            last_accessed_at=now,
+            expires_at=now + timedelta(hours=1),
+            metadata={1: "first", "source": "sso"},
+        )
+
+        restored = SessionData.from_dict(json.loads(session.to_json()))
+        assert restored.metadata == {"1": "first", "source": "sso"}
+
 
 class TestInMemorySessionStore:
     """Tests for InMemorySessionStore."""
@@ -182,6 +233,7 @@ class TestInMemorySessionStore:
         # Verify deleted
         retrieved = await store.get(sample_session.session_id)
         assert retrieved is None
+        assert sample_session.user_id not in store.user_sessions
 
     async def test_revoke_session(self, store, sample_session):
         """Test revoking a session."""
@@ -269,6 +321,31 @@ class TestInMemorySessionStore:
         # Verify valid session still exists
         assert await store.get("sess-valid") is not None
 
+    async def test_cleanup_requeues_extended_session(self, store, sample_session):
+        """Test cleanup keeps a session extended after it was indexed."""
+        now = datetime.now(UTC)
+        sample_session.expires_at = now - timedelta(minutes=1)
+        await store.create(sample_session)
+
+        sample_session.expires_at = now + timedelta(hours=1)
+        await store.update(sample_session)
+
+        assert await store.cleanup_expired() == 0
+        assert await store.get(sample_session.session_id) is not None
+        assert store._expiry_heap == [(sample_session.expires_at, sample_session.session_id)]
+
+    async def test_cleanup_removes_session_with_shortened_expiry(self, store, sample_session):
+        """Test cleanup honours an expiry moved earlier by update."""
+        now = datetime.now(UTC)
+        sample_session.expires_at = now + timedelta(hours=1)
+        await store.create(sample_session)
+
+        sample_session.expires_at = now - timedelta(minutes=1)
+        await store.update(sample_session)
+
+        assert await store.cleanup_expired() == 1
+        assert sample_session.session_id not in store.sessions
+
     async def test_get_expired_session_returns_none(self, store):
         """Test that getting an expired session returns None."""
         now = datetime.now(UTC)
@@ -287,3 +364,98 @@ class TestInMemorySessionStore:
         # Getting expired session should return None and clean it up
         retrieved = await store.get("sess-expired")
         assert retrieved is None
+
+
+class TestCachedSessionStore:
+    """Tests for CachedSessionStore."""
+
+    @pytest.fixture
+    async def backend(self):
+        """Create a counting in-memory backend."""
+        backend = CountingSessionStore()
+        await backend.connect()
+        return backend
+
+    @pytest.fixture
+    def sample_session(self):
+        """Create sample session data."""
+        now = datetime.now(UTC)
+        return SessionData(
+            session_id="sess-123",
+            user_id="user-456",
+            username="testuser",
+            created_at=now,
+            last_accessed_at=now,
+            expires_at=now + timedelta(hours=1),
+        )
+
+    async def test_repeated_get_served_from_cache(self, backend, sample_session):
+        """Test repeated lookups within the TTL read the backend once."""
+        store = CachedSessionStore(backend, ttl=60)
+        await store.create(sample_session)
+
+        first = await store.get("sess-123")
+        second = await store.get("sess-123")
+
+        assert first is not None and second is not None
+        assert first.user_id == second.user_id
+        # Callers receive independent copies
+        assert first is not second
+        assert backend.get_calls == 1
+
+    async def test_concurrent_misses_coalesced(self, backend, sample_session):
+        """Test concurrent misses for the same session share one backend read."""
+        store = CachedSessionStore(backend, ttl=60)
+        await store.create(sample_session)
+
+        results = await asyncio.gather(*(store.get("sess-123") for _ in range(5)))
+
+        assert all(r is not None and r.session_id == "sess-123" for r in results)
+        assert backend.get_calls == 1
+
+    async def test_expired_entries_reread(self, backend, sample_session):
+        """Test entries older than the TTL are read from the backend again."""
+        store = CachedSessionStore(backend, ttl=0)
+        await store.create(sample_session)
+
+        await store.get("sess-123")
+        await store.get("sess-123")
+
+        assert backend.get_calls == 2
+
+    async def test_misses_not_cached(self, backend):
+        """Test unknown sessions are not cached."""
+        store = CachedSessionStore(backend, ttl=60)
+
+        assert await store.get("missing") is None
+        assert await store.get("missing") is None
+        assert backend.get_calls == 2
+
+    async def test_writes_invalidate_cache(self, backend, sample_session):
+        """Test revoking through the cache is visible immediately."""
+        store = CachedSessionStore(backend, ttl=60)
+        await store.create(sample_session)
+        await store.get("sess-123")
+
+        await store.delete("sess-123")
+
+        assert await store.get("sess-123") is None
+
+    async def test_lru_eviction(self, backend):
+        """Test the cache never holds more than max_size sessions."""
+        store = CachedSessionStore(backend, max_size=2, ttl=60)
+        now = datetime.now(UTC)
+        for i in range(3):
+            await store.create(
+                SessionData(
+                    session_id=f"sess-{i}",
+                    user_id="user-1",
+                    username="user",
+                    created_at=now,
+                    last_accessed_at=now,
+                    expires_at=now + timedelta(hours=1),
+                )
+            )
+            await store.get(f"sess-{i}")
+
+        assert list(store._cache) == ["sess-1", "sess-2"]